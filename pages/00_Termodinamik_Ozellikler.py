@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
-from src.calculators.thermo_calculator import calculate_properties, generate_plot_data, get_chemical_list
-from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override
+from src.calculators.thermo_calculator import (
+    calculate_properties, generate_plot_data, get_chemical_list, display_conversion,
+    iter_property_batch, property_batch_columns, PROPERTY_OPTIONS,
+)
+from src.calculators.chemical_index import search_chemicals
+from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override, format_unit
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
 
 load_css()
@@ -67,9 +71,21 @@ with col_left:
     if input_method == "Listeden Seç":
         selected_chem_display = st.selectbox("Akışkan Seç:", options=chem_names_display, index=0)
         chemical_name = chem_map[selected_chem_display]
+        chemical_display = chemical_name
     else:
-        manual_chemical = st.text_input("İngilizce İsim Girin:", "", placeholder="Örn: toluene, acetone, hexane")
-        chemical_name = manual_chemical.strip()
+        manual_chemical = st.text_input("İsim, CAS veya Formül Girin:", "", placeholder="Örn: toluene, aseton, 67-64-1, C6H14")
+        chemical_name = chemical_display = manual_chemical.strip()
+        if chemical_name:
+            # Pahalı thermo araması öncesi yerel indeksten öneriler (yazım hatalarına toleranslı)
+            with st.spinner("Kimyasal indeksi hazırlanıyor..."):
+                matches = search_chemicals(chemical_name, limit=8)
+            if matches:
+                labels = [f"{m['name']} ({m['CAS']}, {m['formula']}) · {m['kind']}: {m['match']}" for m in matches]
+                choice = st.selectbox("Öneriler:", range(len(matches)), format_func=labels.__getitem__)
+                chemical_name = matches[choice]['CAS']
+                chemical_display = matches[choice]['name']
+            else:
+                st.caption("Yerel indekste eşleşme bulunamadı; isim doğrudan thermo'ya gönderilecek.")
 
     # Sıcaklık ve Basınç Girişleri
     st.markdown("### 🌡️ Durum")
@@ -96,15 +112,9 @@ with col_left:
 
     # Özellik Seçimi
     st.markdown("### 📝 Özellikler")
-    property_options = {
-        "Yoğunluk (rho)": "rho", "Viskozite (mu)": "mu", "Isı Kapasitesi (Cp)": "Cp",
-        "Buhar Basıncı (Psat)": "Psat", "Yüzey Gerilimi (sigma)": "sigma",
-        "Isıl İletkenlik (k)": "k", "Kaynama Noktası (Tb)": "Tb", "Donma Noktası (Tm)": "Tm"
-    }
-    
     selected_properties = st.multiselect(
         "Hesaplanacaklar:",
-        options=list(property_options.keys()),
+        options=list(PROPERTY_OPTIONS.keys()),
         default=["Yoğunluk (rho)", "Viskozite (mu)", "Isı Kapasitesi (Cp)"]
     )
 
@@ -140,6 +150,7 @@ with col_right:
                             'df': df,
                             'formula': formula,
                             'chemical_name': chemical_name,
+                            'chemical_display': chemical_display,
                             'unit_system': calc_unit_system,
                             'p_input': p_input,
                             't_input': t_input,
@@ -155,7 +166,7 @@ with col_right:
         res = st.session_state.thermo_results
         df = res['df']
         formula = res['formula']
-        chem_name = res['chemical_name']
+        chem_name = res.get('chemical_display', res['chemical_name'])
         
         # Başlık
         chem_title = chem_name.title()
@@ -184,33 +195,44 @@ with col_right:
         st.markdown("### 📊 Grafik Analizi")
         
         # Grafik için uygun özellikler (Tb ve Tm hariç)
-        plottable_props = [p for p in res['selected_properties'] if property_options[p] not in ['Tb', 'Tm']]
+        plottable_props = [p for p in res['selected_properties'] if PROPERTY_OPTIONS[p] not in ['Tb', 'Tm']]
         
         if plottable_props:
             prop_to_plot = st.selectbox("Grafik Özelliği:", plottable_props)
             
-            t_range_col1, t_range_col2 = st.columns(2)
+            t_range_col1, t_range_col2, t_range_col3 = st.columns(3)
             # Varsayılan aralık: Giriş sıcaklığının +/- 50 birim çevresi
             t_center = res['t_input']
             t_min_plot = t_range_col1.number_input("Min T", value=t_center - 50)
             t_max_plot = t_range_col2.number_input("Maks T", value=t_center + 50)
+            t_step_plot = t_range_col3.number_input("Adım (Çözünürlük)", value=5.0, min_value=0.01, format="%.2f")
             
             if st.button("📈 Grafiği Güncelle"):
                 with st.spinner("Grafik oluşturuluyor..."):
-                    plot_df = generate_plot_data(
-                        res['chemical_name'], 
-                        res['p_input'], 
-                        res['unit_system'],
-                        property_options[prop_to_plot], 
-                        t_min_plot, 
-                        t_max_plot,
-                        res['manual_units']
-                    )
-                    
-                    if not plot_df.empty:
-                        chart = alt.Chart(plot_df).mark_line(point=True).encode(
+                    try:
+                        plot_df = generate_plot_data(
+                            res['chemical_name'], 
+                            res['p_input'], 
+                            res['unit_system'],
+                            PROPERTY_OPTIONS[prop_to_plot], 
+                            t_min_plot, 
+                            t_max_plot,
+                            res['manual_units'],
+                            step=t_step_plot
+                        )
+                    except ValueError as e:
+                        st.error(f"Grafik oluşturulamadı: {e}")
+                        plot_df = None
+
+                    if plot_df is None:
+                        pass
+                    elif not plot_df.empty:
+                        # Grafik değerleri tablo ile aynı görüntüleme biriminde
+                        _, plot_unit = display_conversion(PROPERTY_OPTIONS[prop_to_plot], res['unit_system'], res['manual_units'])
+                        # Yoğun eğrilerde nokta işaretleri grafiği kalabalıklaştırır
+                        chart = alt.Chart(plot_df).mark_line(point=len(plot_df) <= 60).encode(
                             x=alt.X('Sıcaklık', title=f'Sıcaklık'),
-                            y=alt.Y('Özellik', title=prop_to_plot),
+                            y=alt.Y('Özellik', title=f"{prop_to_plot} [{plot_unit}]"),
                             tooltip=['Sıcaklık', 'Özellik']
                         ).interactive()
                         st.altair_chart(chart, use_container_width=True)
@@ -221,3 +243,54 @@ with col_right:
     
     elif not calculate_btn:
         st.info("👈 Sol panelden parametreleri seçip 'Hesapla' butonuna basın.")
+
+# --- ÇOKLU KİMYASAL TABLOSU ---
+st.markdown("---")
+st.subheader("📊 Çoklu Kimyasal Karşılaştırma Tablosu")
+
+with st.expander("Kimyasal × Durum Matrisi", expanded=False):
+    render_info_card(
+        "Birden çok kimyasalı birden çok sıcaklık/basınç durumunda karşılaştırın. "
+        "Hesaplar paralel yürütülür, satırlar tamamlandıkça tabloya eklenir."
+    )
+    batch_chems_display = st.multiselect("Listeden Kimyasallar:", chem_names_display, default=chem_names_display[:3])
+    extra_chems = st.text_input("Ek Kimyasallar (İngilizce, virgülle):", "", placeholder="Örn: toluene, hexane")
+
+    col_bt, col_bp = st.columns(2)
+    temps_text = col_bt.text_input(f"Sıcaklıklar ({format_unit(t_unit_label)}, virgülle)", f"{t_val:g}, {t_val + 25:g}, {t_val + 50:g}")
+    pres_text = col_bp.text_input(f"Basınçlar ({format_unit(p_unit_label)}, virgülle)", f"{p_val:g}")
+    batch_props = st.multiselect("Özellikler:", list(PROPERTY_OPTIONS.keys()), default=list(PROPERTY_OPTIONS.keys()), key="batch_props")
+
+    if st.button("📊 Tabloyu Hesapla"):
+        batch_chems = [chem_map[d] for d in batch_chems_display]
+        batch_chems += [c.strip() for c in extra_chems.split(",") if c.strip() and c.strip() not in batch_chems]
+        try:
+            temps = [float(t) for t in temps_text.split(",") if t.strip()]
+            pressures = [float(p) for p in pres_text.split(",") if p.strip()]
+        except ValueError:
+            st.error("Sıcaklık ve basınçlar virgülle ayrılmış sayılar olmalıdır.")
+            temps, pressures = [], []
+
+        if not batch_chems or not batch_props or not temps or not pressures:
+            st.warning("En az bir kimyasal, özellik, sıcaklık ve basınç girilmelidir.")
+        else:
+            states = [(T, P) for T in temps for P in pressures]
+            total = len(batch_chems) * len(states)
+            columns = property_batch_columns(calc_unit_system, batch_props, mapped_manual_units)
+            progress = st.progress(0.0, text=f"0 / {total}")
+            table_slot = st.empty()
+
+            rows = {}
+            for i, row in iter_property_batch(batch_chems, states, calc_unit_system, batch_props, mapped_manual_units):
+                rows[i] = row
+                progress.progress(len(rows) / total, text=f"{len(rows)} / {total}")
+                table_df = pd.DataFrame([rows[j] for j in sorted(rows)]).rename(columns=columns)
+                table_slot.dataframe(table_df, use_container_width=True)
+
+            n_err = int(table_df["Hata"].notna().sum())
+            if n_err:
+                st.warning(f"{n_err} satırda hesaplanamayan değer var (Hata sütununa bakın).")
+            st.download_button(
+                "⬇️ Tabloyu İndir (CSV)", table_df.to_csv(index=False).encode("utf-8"),
+                "ozellik_tablosu.csv", "text/csv",
+            )
@@ -1,6 +1,7 @@
 import streamlit as st
-from src.calculators.fluids_calculator import calculate_reynolds, calculate_pressure_drop
-from src.calculators.fluids_calculator import calculate_reynolds, calculate_pressure_drop
+import pandas as pd
+import altair as alt
+from src.calculators.fluids_calculator import calculate_reynolds, calculate_pressure_drop, solve_pipe_network
 from src.calculators.thermo_calculator import calculate_properties as calculate_thermo_properties
 from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override, convert_value
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
@@ -84,69 +85,151 @@ with st.expander("🧪 Akışkan Özelliklerini Hesapla veya Manuel Gir", expand
         except Exception as e:
             st.error(f"Özellikler getirilemedi: {e}")
 
-# --- GİRİŞ ---
+# --- HESAPLAMA MODU ---
 st.divider()
-st.subheader("🔧 Akışkan ve Boru Bilgileri")
-
-col1, col2 = st.columns(2)
-with col1:
-    rho_unit = units.get('Density', 'kg/m**3')
-    density_input = st.number_input(f"Yoğunluk ({rho_unit})", value=st.session_state.density, format="%.4f", key="density_input")
-    # SI'ya çevir
-    density = convert_value(density_input, rho_unit, 'kg/m**3')
+calc_mode = st.radio("Hesaplama Modu", ["Tek Boru", "Boru Ağı (CSV)"], horizontal=True)
+
+if calc_mode == "Tek Boru":
+    # --- GİRİŞ ---
+    st.subheader("🔧 Akışkan ve Boru Bilgileri")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        rho_unit = units.get('Density', 'kg/m**3')
+        density_input = st.number_input(f"Yoğunluk ({rho_unit})", value=st.session_state.density, format="%.4f", key="density_input")
+        # SI'ya çevir
+        density = convert_value(density_input, rho_unit, 'kg/m**3')
     
-    len_unit = units.get('Len', 'm')
-    diameter_input = st.number_input(f"Boru İç Çapı ({len_unit})", value=0.1, format="%.4f")
-    diameter = convert_value(diameter_input, len_unit, 'm')
-with col2:
-    vel_unit = units.get('Velocity', 'm/s')
-    velocity_input = st.number_input(f"Hız ({vel_unit})", value=1.0, format="%.4f")
-    velocity = convert_value(velocity_input, vel_unit, 'm/s')
+        len_unit = units.get('Len', 'm')
+        diameter_input = st.number_input(f"Boru İç Çapı ({len_unit})", value=0.1, format="%.4f")
+        diameter = convert_value(diameter_input, len_unit, 'm')
+    with col2:
+        vel_unit = units.get('Velocity', 'm/s')
+        velocity_input = st.number_input(f"Hız ({vel_unit})", value=1.0, format="%.4f")
+        velocity = convert_value(velocity_input, vel_unit, 'm/s')
     
-    mu_unit = units.get('Viscosity', 'Pa*s')
-    viscosity_input = st.number_input(f"Viskozite ({mu_unit})", value=st.session_state.viscosity, format="%.6g", key="viscosity_input")
-    viscosity = convert_value(viscosity_input, mu_unit, 'Pa*s')
+        mu_unit = units.get('Viscosity', 'Pa*s')
+        viscosity_input = st.number_input(f"Viskozite ({mu_unit})", value=st.session_state.viscosity, format="%.6g", key="viscosity_input")
+        viscosity = convert_value(viscosity_input, mu_unit, 'Pa*s')
 
-# --- HESAPLAMA ---
-st.divider()
-st.subheader("🧮 Hesaplama Parametreleri")
-
-col1, col2 = st.columns(2)
-with col1:
-    len_unit = units.get('Len', 'm')
-    length_input = st.number_input(f"Boru Uzunluğu ({len_unit})", value=100.0, format="%.2f")
-    length = convert_value(length_input, len_unit, 'm')
-with col2:
-    roughness_input = st.number_input(f"Boru Pürüzlülüğü ({len_unit})", value=0.000045, format="%.6f", help="Ticari çelik için tipik değer: 0.000045 m")
-    roughness = convert_value(roughness_input, len_unit, 'm')
-
-if st.button("🚀 Hesaplamayı Başlat", use_container_width=True):
-    re, flow_type, re_error = calculate_reynolds(density, velocity, diameter, viscosity)
-
-    if re_error:
-        st.error(f"Reynolds Hatası: {re_error}")
-    else:
-        st.subheader("📌 Sonuçlar")
+    # --- HESAPLAMA ---
+    st.divider()
+    st.subheader("🧮 Hesaplama Parametreleri")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        len_unit = units.get('Len', 'm')
+        length_input = st.number_input(f"Boru Uzunluğu ({len_unit})", value=100.0, format="%.2f")
+        length = convert_value(length_input, len_unit, 'm')
+    with col2:
+        roughness_input = st.number_input(f"Boru Pürüzlülüğü ({len_unit})", value=0.000045, format="%.6f", help="Ticari çelik için tipik değer: 0.000045 m")
+        roughness = convert_value(roughness_input, len_unit, 'm')
+
+    if st.button("🚀 Hesaplamayı Başlat", use_container_width=True):
+        re, flow_type, re_error = calculate_reynolds(density, velocity, diameter, viscosity)
+
+        if re_error:
+            st.error(f"Reynolds Hatası: {re_error}")
+        else:
+            st.subheader("📌 Sonuçlar")
         
-        col_res1, col_res2 = st.columns(2)
+            col_res1, col_res2 = st.columns(2)
         
-        with col_res1:
-            render_card("Reynolds Sayısı (Re)", f"{re:,.2f}")
+            with col_res1:
+                render_card("Reynolds Sayısı (Re)", f"{re:,.2f}")
             
-            if flow_type == "Laminer":
-                st.info("**Akış Tipi:** Laminer (Re < 2300)")
-            elif flow_type == "Geçiş Bölgesi":
-                st.warning("**Akış Tipi:** Geçiş (2300 ≤ Re ≤ 4000)")
+                if flow_type == "Laminer":
+                    st.info("**Akış Tipi:** Laminer (Re < 2300)")
+                elif flow_type == "Geçiş Bölgesi":
+                    st.warning("**Akış Tipi:** Geçiş (2300 ≤ Re ≤ 4000)")
+                else:
+                    st.success("**Akış Tipi:** Türbülanslı (Re > 4000)")
+
+            pressure_drop, fd, pd_error = calculate_pressure_drop(density, velocity, diameter, viscosity, length, roughness)
+            if pd_error:
+                st.error(f"Basınç Düşüşü Hatası: {pd_error}")
             else:
-                st.success("**Akış Tipi:** Türbülanslı (Re > 4000)")
+                with col_res2:
+                    render_card("Darcy Sürtünme Faktörü (fD)", f"{fd:.4f}")
+                
+                    p_unit = units.get('P', 'Pa')
+                    pd_val = convert_value(pressure_drop, 'Pa', p_unit)
+                    render_card("Basınç Düşüşü (ΔP)", f"{pd_val:,.4f}", unit=p_unit)
+
+else:
+    # --- BORU AĞI ---
+    st.subheader("🕸️ Boru Ağı Çözümü")
+    render_info_card(
+        "Ağ topolojisini iki CSV dosyası ile yükleyin (SI birimleri). "
+        "Düğümler: node, demand (m³/s, düğümden çekilen), pressure (Pa, yalnızca sabit basınçlı düğümlerde), "
+        "elevation (m, isteğe bağlı). Borular: pipe, from, to, length (m), diameter (m), roughness (m)."
+    )
+
+    example_nodes = pd.DataFrame({
+        'node': ['A', 'B', 'C'], 'demand': [0.0, 0.02, 0.005],
+        'pressure': [400000.0, None, None], 'elevation': [0.0, 5.0, 2.0],
+    })
+    example_pipes = pd.DataFrame({
+        'pipe': ['p1', 'p2', 'p3'], 'from': ['A', 'A', 'C'], 'to': ['B', 'C', 'B'],
+        'length': [300.0, 150.0, 150.0], 'diameter': [0.1, 0.1, 0.08], 'roughness': [4.5e-5] * 3,
+    })
+
+    col_t1, col_t2 = st.columns(2)
+    with col_t1:
+        st.download_button("📄 Örnek Düğüm CSV", example_nodes.to_csv(index=False), "nodes.csv", "text/csv")
+        nodes_file = st.file_uploader("Düğüm Tablosu (CSV)", type="csv", key="nodes_csv")
+    with col_t2:
+        st.download_button("📄 Örnek Boru CSV", example_pipes.to_csv(index=False), "pipes.csv", "text/csv")
+        pipes_file = st.file_uploader("Boru Tablosu (CSV)", type="csv", key="pipes_csv")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        rho_unit = units.get('Density', 'kg/m**3')
+        net_density_input = st.number_input(f"Yoğunluk ({rho_unit})", value=st.session_state.density, format="%.4f", key="net_density")
+        net_density = convert_value(net_density_input, rho_unit, 'kg/m**3')
+    with col2:
+        mu_unit = units.get('Viscosity', 'Pa*s')
+        net_viscosity_input = st.number_input(f"Viskozite ({mu_unit})", value=st.session_state.viscosity, format="%.6g", key="net_viscosity")
+        net_viscosity = convert_value(net_viscosity_input, mu_unit, 'Pa*s')
+    with col3:
+        ff_method = st.selectbox("Sürtünme Korelasyonu", ["Churchill_1977", "Clamond", "Haaland", "Serghides_2"],
+                                 help="Churchill tüm rejimlerde süreklidir; diğerlerinde Re = 2040'taki sıçrama yakınsamayı zorlaştırabilir.")
+
+    if st.button("🚀 Ağı Çöz", use_container_width=True):
+        if nodes_file is None or pipes_file is None:
+            nodes_df, pipes_df = example_nodes, example_pipes
+            st.info("CSV yüklenmedi; örnek ağ çözülüyor.")
+        else:
+            nodes_df, pipes_df = pd.read_csv(nodes_file), pd.read_csv(pipes_file)
 
-        pressure_drop, fd, pd_error = calculate_pressure_drop(density, velocity, diameter, viscosity, length, roughness)
-        if pd_error:
-            st.error(f"Basınç Düşüşü Hatası: {pd_error}")
+        try:
+            result = solve_pipe_network(nodes_df, pipes_df, net_density, net_viscosity, method=ff_method)
+        except Exception as e:
+            st.error(f"Ağ Çözüm Hatası: {e}")
         else:
-            with col_res2:
-                render_card("Darcy Sürtünme Faktörü (fD)", f"{fd:.4f}")
-                
-                p_unit = units.get('P', 'Pa')
-                pd_val = convert_value(pressure_drop, 'Pa', p_unit)
-                render_card("Basınç Düşüşü (ΔP)", f"{pd_val:,.4f}", unit=p_unit)
+            if result['converged']:
+                st.success(f"✅ {result['iterations']} iterasyonda yakınsadı ({len(pipes_df)} boru, {len(nodes_df)} düğüm).")
+            else:
+                st.warning(f"⚠️ {result['iterations']} iterasyonda yakınsamadı; sonuçlar son iterasyona aittir.")
+
+            p_unit = units.get('P', 'Pa')
+            nodes_out = result['nodes'].copy()
+            nodes_out['pressure'] = convert_value(nodes_out['pressure'].to_numpy(), 'Pa', p_unit)
+            pipes_out = result['pipes'].copy()
+            pipes_out['dP'] = convert_value(pipes_out['dP'].to_numpy(), 'Pa', p_unit)
+
+            st.markdown(f"#### Düğümler (Basınç: {p_unit})")
+            st.dataframe(nodes_out, use_container_width=True)
+            st.markdown(f"#### Borular (Q: m³/s, v: m/s, ΔP: {p_unit})")
+            st.dataframe(pipes_out, use_container_width=True)
+
+            st.markdown("#### Yakınsama Geçmişi")
+            hist = result['history'].melt('iteration', var_name='Artık', value_name='Değer')
+            hist = hist[hist['Değer'] > 0]
+            hist_chart = alt.Chart(hist).mark_line(point=True).encode(
+                x=alt.X('iteration:Q', title='İterasyon'),
+                y=alt.Y('Değer:Q', scale=alt.Scale(type='log'), title='En Büyük Değer'),
+                color='Artık:N',
+                tooltip=['iteration', 'Artık', 'Değer']
+            )
+            st.altair_chart(hist_chart, use_container_width=True)
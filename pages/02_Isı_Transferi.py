@@ -12,7 +12,6 @@ from src.calculators.heat_transfer_calculator import (
     calculate_cylindrical_shell_heat_transfer,
     calculate_spherical_shell_heat_transfer,
     MATERIAL_LIBRARY,
-    ureg
 )
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
 
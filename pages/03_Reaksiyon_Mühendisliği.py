@@ -7,7 +7,8 @@ from src.calculators.reaction_calculator import (
     calculate_rate_constant,
     calculate_reactor_volume,
     calculate_batch_time,
-    generate_levenspiel_data
+    generate_levenspiel_data,
+    sweep_reactor_volume
 )
 from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override, convert_value
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
@@ -220,3 +221,65 @@ with col_right:
             # st.exception(e) # Debug
     else:
         st.info("👈 Parametreleri ayarlayıp 'Hesapla' butonuna basın.")
+
+# --- PARAMETRİK ÇALIŞMA ---
+st.markdown("---")
+with st.expander("🔬 Parametrik Çalışma (CSTR / PFR Hacim Taraması)", expanded=False):
+    st.markdown("Soldaki parametreler sabit tutularak seçilen değişken taranır; CSTR ve PFR hacmi birlikte hesaplanır.")
+
+    sweep_options = ["Dönüşüm (X)", "Mertebe (n)"]
+    if k_method != "Doğrudan Gir":
+        sweep_options.insert(1, "Sıcaklık (T)")
+    sweep_var = st.selectbox("Taranacak Değişken", sweep_options)
+
+    col_s1, col_s2, col_s3 = st.columns(3)
+    if sweep_var.startswith("Dönüşüm"):
+        lo_default, hi_default, x_title = 0.05, 0.95, "Dönüşüm (X)"
+    elif sweep_var.startswith("Sıcaklık"):
+        lo_default, hi_default = T_input - 25.0, T_input + 25.0
+        x_title = f"Sıcaklık (T, {units.get('T', 'K')})"
+    else:
+        lo_default, hi_default, x_title = 0.0, 3.0, "Mertebe (n)"
+    with col_s1:
+        sweep_lo = st.number_input("Alt Sınır", value=float(lo_default))
+    with col_s2:
+        sweep_hi = st.number_input("Üst Sınır", value=float(hi_default))
+    with col_s3:
+        sweep_n = st.number_input("Nokta Sayısı", value=50, min_value=2, max_value=5000, step=10)
+
+    if st.button("📊 Taramayı Çalıştır", use_container_width=True):
+        try:
+            values = np.linspace(sweep_lo, sweep_hi, int(sweep_n))
+            sweep_args = dict(X=X_target, n=n, C_A0=C_A0, F_A0=F_A0)
+            if sweep_var.startswith("Dönüşüm"):
+                sweep_args['X'] = values
+            elif sweep_var.startswith("Mertebe"):
+                sweep_args['n'] = values
+
+            if k_method == "Doğrudan Gir":
+                sweep_args['k'] = k
+            else:
+                T_values = convert_value(values, units.get('T', 'K'), 'K') if sweep_var.startswith("Sıcaklık") else T
+                sweep_args.update(T=T_values, k0=A, Ea=Ea)
+
+            df_sweep = sweep_reactor_volume(
+                **sweep_args, C_B0=C_B0, m=m, b=b_coeff, phase=phase, epsilon=epsilon
+            )
+            target_vol_unit = units.get('Vol', 'm**3')
+            df_sweep['V_out'] = convert_value(df_sweep['V'].to_numpy(), 'm**3', target_vol_unit)
+            df_sweep['param'] = np.tile(values, 2)
+
+            sweep_chart = alt.Chart(df_sweep).mark_line(strokeWidth=3).encode(
+                x=alt.X('param', title=x_title),
+                y=alt.Y('V_out', title=f'Hacim ({target_vol_unit})'),
+                color=alt.Color('reactor', title='Reaktör'),
+                tooltip=['param', 'reactor', 'V_out', 'k']
+            ).properties(title="Reaktör Hacmi Taraması")
+            st.altair_chart(sweep_chart, use_container_width=True)
+
+            st.dataframe(
+                df_sweep.pivot(index='param', columns='reactor', values='V_out').rename_axis(x_title),
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Tarama Hatası: {e}")
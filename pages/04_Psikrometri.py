@@ -1,14 +1,29 @@
+import os
+import re
+import tempfile
 import streamlit as st
+import numpy as np
 import pandas as pd
 from src.calculators.psychrometrics_calculator import (
     calculate_psychrometric_properties,
-    generate_psychrometric_chart
+    calculate_psychrometric_batch,
+    get_chart_background,
+    write_psychrometric_batch
 )
 from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override, convert_value, format_unit
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
 
 load_css()
 
+# Toplu hesapta önizleme için okunan satır sayısı
+BATCH_PREVIEW_ROWS = 1000
+
+# İndirme düğmesiyle sunulan en büyük çıktı (MB); düğme çıktıyı belleğe kopyalar
+BATCH_DOWNLOAD_LIMIT_MB = 100
+
+# Bağıl nem sütunu adı tahmini (ör. "RH", "rh_pct", "Bağıl Nem", "Humidity")
+RH_COLUMN_PATTERN = re.compile(r"(?<![a-z])rh(?![a-z])|nem|humid", re.IGNORECASE)
+
 st.set_page_config(page_title="Psikrometrik Hesaplayıcı", page_icon="🌬️")
 render_header("Psikrometrik Hesaplayıcı", "🌬️")
 st.markdown("Bu modül, nemli havanın termodinamik özelliklerini (entalpi, nem oranı, çiğ noktası vs.) hesaplamanıza ve psikrometrik diyagram üretmenize yardımcı olur.")
@@ -97,10 +112,118 @@ if props:
 st.divider()
 st.subheader("📉 Psikrometrik Diyagram")
 
+col_l1, col_l2, col_l3 = st.columns(3)
+with col_l1:
+    show_h = st.checkbox("İzentalpi çizgileri", value=False)
+with col_l2:
+    show_wb = st.checkbox("Yaş termometre çizgileri", value=False)
+with col_l3:
+    show_v = st.checkbox("Özgül hacim çizgileri", value=False)
+
 if st.button("📊 Diyagramı Göster", key="show_diagram"):
     try:
         P_val = st.session_state.get("psychro_P", 101325.0)
-        fig = generate_psychrometric_chart(P_val, T_min=0, T_max=50)
-        st.pyplot(fig)
+        # Arka plan (P, çizgi kümeleri) başına bir kez çizilip önbellekte tutulur
+        background = get_chart_background(
+            P_val, T_min=0, T_max=50,
+            h_lines=np.arange(10, 140, 10) if show_h else None,
+            wb_lines=np.arange(0, 35, 5) if show_wb else None,
+            v_lines=np.arange(0.78, 0.96, 0.02) if show_v else None,
+        )
+
+        # Durum noktası ve çiğ noktasına soğutma çizgisi arka planın üzerine eklenir
+        points, process_lines = [], []
+        if props and "Hata" not in props:
+            T_state = st.session_state.get("psychro_T")
+            w_state = props['w (kg_water/kg_dry)']
+            if T_state is not None and 0 <= T_state <= 50:
+                points.append((T_state, w_state))
+                process_lines.append([(T_state, w_state), (max(props['T_dp (°C)'], 0.0), w_state)])
+
+        st.image(background.render(points, process_lines), use_container_width=True)
     except Exception as e:
         st.error(f"Diyagram oluşturulamadı: {e}")
+
+# --- TOPLU HESAPLAMA (CSV) ---
+st.divider()
+st.subheader("📁 Toplu Hesaplama (BMS / HVAC Logları)")
+
+with st.expander("CSV Yükle ve Hesapla", expanded=False):
+    render_info_card(
+        "Kuru termometre sıcaklığı ile bağıl nem (%) veya yaş termometre sıcaklığı sütunları içeren bir CSV yükleyin. "
+        "Basınç sütunu yoksa yukarıdaki atmosfer basıncı kullanılır. Sonuçlar parça parça hesaplanır."
+    )
+    batch_file = st.file_uploader("Log Dosyası (CSV)", type="csv", key="psychro_batch_csv")
+
+    if batch_file is not None:
+        # Yalnızca başlık ve önizleme satırları DataFrame'e okunur; tüm dosya hesap
+        # sırasında parça parça işlenir ve geçici dosyaya yazılır. Yüklenen dosyanın
+        # baytları ve indirilen çıktı Streamlit tarafından bellekte tutulur; çıktı
+        # BATCH_DOWNLOAD_LIMIT_MB ile sınırlandırılır.
+        try:
+            batch_head = pd.read_csv(batch_file, nrows=BATCH_PREVIEW_ROWS)
+        except Exception as e:
+            st.error(f"CSV okunamadı: {e}")
+            batch_head = None
+
+        if batch_head is not None:
+            cols = list(batch_head.columns)
+            none_opt = "(yok)"
+            col_b1, col_b2 = st.columns(2)
+            with col_b1:
+                T_col = st.selectbox(f"Kuru Termometre Sütunu ({format_unit(t_unit)})", cols)
+                # Varsayılan yalnızca adı bağıl neme benzeyen sütun (RH, nem, humidity); yoksa "(yok)"
+                rh_guess = [c for c in cols if RH_COLUMN_PATTERN.search(str(c))]
+                rh_col = st.selectbox("Bağıl Nem Sütunu (%)", [none_opt] + cols,
+                                      index=1 + cols.index(rh_guess[0]) if rh_guess else 0)
+            with col_b2:
+                twb_col = st.selectbox(f"Yaş Termometre Sütunu ({format_unit(t_unit)})", [none_opt] + cols)
+                P_col = st.selectbox(f"Basınç Sütunu ({format_unit(p_unit)})", [none_opt] + cols)
+            out_fmt = st.radio("Çıktı Biçimi", ["CSV", "Parquet"], horizontal=True)
+
+            if st.button("⚙️ Toplu Hesapla"):
+                try:
+                    # Fonksiyonlar °C ve Pa bekler: sütunlar her parçada çevrilir
+                    def to_si(chunk):
+                        converted = {
+                            col: convert_value(chunk[col].to_numpy(dtype=float), t_unit, 'degC')
+                            for col in {T_col, twb_col} - {none_opt}
+                        }
+                        if P_col != none_opt:
+                            converted[P_col] = convert_value(chunk[P_col].to_numpy(dtype=float), p_unit, 'Pa')
+                        return chunk.assign(**converted)
+
+                    batch_kwargs = dict(
+                        T_col=T_col,
+                        rh_col=None if rh_col == none_opt else rh_col,
+                        twb_col=None if twb_col == none_opt else twb_col,
+                        P_col=None if P_col == none_opt else P_col,
+                        P_Pa=P,
+                    )
+                    preview = calculate_psychrometric_batch(to_si(batch_head), **batch_kwargs)
+                    st.dataframe(preview, use_container_width=True)
+
+                    ext, mime = ("csv", "text/csv") if out_fmt == "CSV" else ("parquet", "application/octet-stream")
+                    with tempfile.TemporaryDirectory(prefix="psikrometri-") as tmp_dir:
+                        out_path = os.path.join(tmp_dir, f"psikrometri.{ext}")
+                        batch_file.seek(0)
+                        n_rows = write_psychrometric_batch(
+                            batch_file, out_path, fmt=out_fmt.lower(), converter=to_si, **batch_kwargs
+                        )
+                        n_err = int(preview["Hata"].notna().sum())
+                        st.success(
+                            f"{n_rows} satır hesaplandı."
+                            + (f" İlk {len(preview)} satırda {n_err} geçersiz satır var." if n_err else "")
+                        )
+                        # download_button dosyanın tamamını sunucu belleğine kopyalar
+                        size_mb = os.path.getsize(out_path) / 1e6
+                        if size_mb > BATCH_DOWNLOAD_LIMIT_MB:
+                            st.warning(
+                                f"Sonuç dosyası {size_mb:.0f} MB; {BATCH_DOWNLOAD_LIMIT_MB} MB üzerindeki çıktılar "
+                                "indirme için sunulmaz. Daha küçük olan Parquet biçimini seçin veya logu bölün."
+                            )
+                        else:
+                            with open(out_path, "rb") as fh:
+                                st.download_button(f"⬇️ Sonuçları İndir ({out_fmt})", fh, f"psikrometri.{ext}", mime)
+                except Exception as e:
+                    st.error(f"Toplu hesaplama hatası: {e}")
@@ -3,7 +3,12 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 import numpy as np
-from src.calculators.separation_calculator import calculate_mccabe_thiele, calculate_ponchon_savarit
+from src.calculators.separation_calculator import (
+    calculate_mccabe_thiele, calculate_ponchon_savarit, calculate_q_from_T, calculate_shortcut_design,
+    gilliland_stages, get_vle_data, mccabe_thiele_stages, InfeasibleSpecError,
+)
+from src.calculators.activity_models import ACTIVITY_MODELS
+from src.calculators.column_solver import solve_column
 from src.calculators.thermo_calculator import get_chemical_list
 from src.utils.unit_manager import render_global_settings_sidebar, render_local_unit_override, convert_value, format_unit
 from src.utils.ui_helper import load_css, render_header, render_card, render_info_card
@@ -16,7 +21,7 @@ load_css()
 st.set_page_config(page_title="Ayırma İşlemleri", page_icon="⚗️", layout="wide")
 
 render_header("Ayırma İşlemleri", "⚗️")
-st.markdown("İkili karışımların distilasyon kolon hesaplamaları (McCabe-Thiele ve Ponchon-Savarit Yöntemleri).")
+st.markdown("İkili karışımların distilasyon kolon hesaplamaları (McCabe-Thiele, Ponchon-Savarit ve kademe kademe MESH çözümü).")
 st.markdown("---")
 
 # --- GİRİŞLER ---
@@ -32,7 +37,7 @@ with col_left:
     st.subheader("⚙️ Parametreler")
     
     # Yöntem Seçimi
-    method = st.radio("Hesaplama Yöntemi:", ["McCabe-Thiele", "Ponchon-Savarit"], horizontal=True)
+    method = st.radio("Hesaplama Yöntemi:", ["McCabe-Thiele", "Ponchon-Savarit", "MESH (Kademe Kademe)"], horizontal=True)
     
     # Akışkan Seçimi
     chem_list = get_chemical_list()
@@ -52,6 +57,14 @@ with col_left:
         st.error("Lütfen iki farklı bileşen seçin.")
         st.stop()
         
+    # Sıvı faz modeli (ideal olmayan karışımlar için aktivite katsayısı)
+    model_keys = list(ACTIVITY_MODELS)
+    vle_model = st.selectbox(
+        "Sıvı Faz Modeli (VLE)", model_keys, index=model_keys.index('unifac'),
+        format_func=ACTIVITY_MODELS.get,
+        help="İdeal (Raoult) yalnızca benzer bileşenler için uygundur; etanol-su gibi sistemlerde aktivite modeli seçin.",
+    )
+
     # İşletme Koşulları
     st.markdown("### 🌡️ İşletme Koşulları")
     
@@ -62,7 +75,8 @@ with col_left:
     
     st.markdown("### 📊 Konsantrasyonlar (Mol Kesri)")
     zF = st.slider("Besleme (zF)", 0.0, 1.0, 0.5)
-    xD = st.slider("Distilat (xD)", 0.0, 1.0, 0.95)
+    # Varsayılan etanol-su çifti x ≈ 0.87-0.89'da azeotrop yapar; varsayılan xD altında kalır
+    xD = st.slider("Distilat (xD)", 0.0, 1.0, 0.80)
     xB = st.slider("Dip Ürün (xB)", 0.0, 1.0, 0.05)
     
     st.markdown("### ⚙️ Kolon Ayarları")
@@ -75,8 +89,8 @@ with col_left:
     else:
         # Varsayılan sıcaklık tahmini (Kaynama noktası civarı)
         try:
-            from thermo import Chemical
-            T_boil_K = Chemical(chem1, P=P).Tb
+            from src.calculators.property_cache import get_chemical
+            T_boil_K = get_chemical(chem1, P=P).Tb
         except:
             T_boil_K = 350.0
         
@@ -90,6 +104,11 @@ with col_left:
         q = None # Daha sonra hesaplanacak
 
     R = st.number_input("Geri Akış Oranı (R)", value=1.5, min_value=0.0)
+
+    if method == "MESH (Kademe Kademe)":
+        # Kademe 1 toplam yoğuşturucu, N kazan
+        N_mesh = st.number_input("Kademe Sayısı (N, yoğuşturucu ve kazan dahil)", value=20, min_value=3, step=1)
+        feed_stage = st.number_input("Besleme Kademesi", value=10, min_value=2, max_value=int(N_mesh), step=1)
     
     calc_btn = st.button("🚀 Hesapla", type="primary", use_container_width=True)
 
@@ -98,18 +117,58 @@ with col_right:
     if calc_btn:
         with st.spinner("Hesaplanıyor... (Termodinamik veriler çekiliyor)"):
             try:
+                # VLE eğrisi bir kez hesaplanır; q ve raf hesapları aynı veriyi kullanır
+                vle = get_vle_data(chem1, chem2, P, model=vle_model)
+
                 # Eğer sıcaklık seçildiyse q'yu hesapla
                 if feed_condition_type == "Sıcaklık ile Belirle":
-                    from src.calculators.separation_calculator import calculate_q_from_T
-                    q = calculate_q_from_T(chem1, chem2, P, zF, T_feed)
+                    q = calculate_q_from_T(chem1, chem2, P, zF, T_feed, vle=vle)
                     st.info(f"ℹ️ Hesaplanan Besleme Kalitesi (q): **{q:.4f}**")
 
+                # Kısa yol tahmini: raf sayımından önce R_min, N_min ve N - R/R_min eğrisi
+                # MESH çözümü xD hedefine ulaşılmasını gerektirmez: azeotrop/pinch
+                # engeli yalnızca grafik yöntemlerde hatadır, MESH'te uyarıdır
+                try:
+                    shortcut = calculate_shortcut_design(chem1, chem2, P, zF, xD, xB, q, vle=vle)
+                except InfeasibleSpecError as e:
+                    if method != "MESH (Kademe Kademe)":
+                        raise
+                    st.warning(f"⚠️ Kısa yol tasarımı yapılamadı: {e} MESH çözümü, kademe sayısının izin verdiği ürün saflığını hesaplar.")
+                    shortcut = None
+
+                if shortcut is not None:
+                    R_min = shortcut['R_min']
+                    N_at_R = float(gilliland_stages(R, R_min, shortcut['N_min']))
+                    with st.expander("📐 Kısa Yol Tasarımı (R_min / Fenske / Gilliland)", expanded=True):
+                        sc1, sc2, sc3 = st.columns(3)
+                        with sc1:
+                            render_card("R_min", f"{R_min:.3f}", description=f"{shortcut['pinch']['kind'].capitalize()} pinch, x = {shortcut['pinch']['x']:.3f}")
+                        with sc2:
+                            render_card("N_min (Fenske)", f"{shortcut['N_min']:.2f}", unit="kademe", description=f"α ort. = {shortcut['alpha']:.3f}")
+                        with sc3:
+                            render_card("N (Gilliland)", f"{N_at_R:.1f}" if np.isfinite(N_at_R) else "∞", unit="kademe", description=f"R = {R:.3f} (R/R_min = {R / R_min:.2f})" if R_min > 0 else "")
+
+                        curve = shortcut['curve']
+                        curve_chart = alt.Chart(curve).mark_line(color='#1f77b4', strokeWidth=2).encode(
+                            x=alt.X('R_ratio', title='R / R_min'),
+                            y=alt.Y('N', title='Teorik Kademe Sayısı (N)', scale=alt.Scale(zero=False)),
+                            tooltip=['R_ratio', 'R', 'N']
+                        )
+                        layers = [curve_chart]
+                        if R_min > 0 and curve['R_ratio'].min() <= R / R_min <= curve['R_ratio'].max():
+                            layers.append(alt.Chart(pd.DataFrame({'R_ratio': [R / R_min]})).mark_rule(color='#d62728', strokeDash=[5, 5]).encode(x='R_ratio'))
+                        st.altair_chart(alt.layer(*layers).properties(title="Gilliland: N - R/R_min", height=300), use_container_width=True)
+
                 if method == "McCabe-Thiele":
+                    stages = mccabe_thiele_stages(vle, zF, xD, xB, q, R)
                     vle_df, q_df, rect_df, strip_df, trays, steps = calculate_mccabe_thiele(
-                        chem1, chem2, P, zF, xD, xB, q, R
+                        chem1, chem2, P, zF, xD, xB, q, R, vle=vle, stages=stages
                     )
                     
-                    st.success(f"✅ Teorik Raf Sayısı: **{trays}**")
+                    st.success(
+                        f"✅ Teorik Raf Sayısı: **{trays}** (kesirli: {stages['n_stages']:.2f}, "
+                        f"besleme kademesi: {stages['feed_stage']})"
+                    )
                     
                     # Grafik
                     base = alt.Chart(pd.DataFrame({'x': [0, 1], 'y': [0, 1]})).mark_rule(color='lightgray', strokeDash=[5, 5]).encode(x='x', y='y')
@@ -133,10 +192,72 @@ with col_right:
                     ).interactive()
                     
                     st.altair_chart(chart, use_container_width=True)
+
+                    with st.expander("📋 Kademe Profili (F = 1 mol temelinde)"):
+                        t_unit = units.get('T', 'K')
+                        profile_df = pd.DataFrame({
+                            'Kademe': stages['stage'],
+                            'x': stages['x'],
+                            'y': stages['y'],
+                            f'T ({format_unit(t_unit)})': [convert_value(T, 'K', t_unit) for T in stages['T']],
+                            'L (mol)': stages['L'],
+                            'V (mol)': stages['V'],
+                        })
+                        st.dataframe(profile_df, hide_index=True, use_container_width=True)
                     
+                elif method == "MESH (Kademe Kademe)":
+                    # F = 1 mol/s; D toplam kütle denkliğinden, xD/xB sonuç olarak çıkar
+                    D = (zF - xB) / (xD - xB)
+                    col = solve_column(
+                        [chem1, chem2], P, int(N_mesh),
+                        [{'stage': int(feed_stage), 'F': 1.0, 'z': [zF, 1 - zF], 'q': q}],
+                        D=D, R=R, model=vle_model,
+                    )
+                    st.success(f"✅ MESH çözümü {col['iterations']} Newton iterasyonunda yakınsadı.")
+
+                    energy_unit = units.get('Energy', 'J')
+                    target_h_unit = f"{energy_unit}/mol"
+                    mc1, mc2, mc3, mc4 = st.columns(4)
+                    with mc1:
+                        render_card("xD (hesaplanan)", f"{col['xD'][0]:.4f}", description=f"Hedef: {xD:.4f}")
+                    with mc2:
+                        render_card("xB (hesaplanan)", f"{col['xB'][0]:.4f}", description=f"Hedef: {xB:.4f}")
+                    with mc3:
+                        render_card("Qc (yoğuşturucu)", f"{convert_value(col['Qc'], 'J/mol', target_h_unit):.4g}", unit=f"{format_unit(energy_unit)}/mol F")
+                    with mc4:
+                        render_card("Qr (kazan)", f"{convert_value(col['Qr'], 'J/mol', target_h_unit):.4g}", unit=f"{format_unit(energy_unit)}/mol F")
+
+                    t_unit = units.get('T', 'K')
+                    t_col = f'T ({format_unit(t_unit)})'
+                    profile_df = pd.DataFrame({
+                        'Kademe': col['stage'],
+                        'x': col['x'][:, 0],
+                        'y': col['y'][:, 0],
+                        t_col: [convert_value(T, 'K', t_unit) for T in col['T']],
+                        'L (mol/s)': col['L'],
+                        'V (mol/s)': col['V'],
+                    })
+
+                    comp_chart = alt.Chart(profile_df).transform_fold(['x', 'y'], as_=['Faz', 'Mol Kesri']).mark_line(point=True).encode(
+                        x=alt.X('Mol Kesri:Q', title=f'Mol Kesri ({chem1})', scale=alt.Scale(domain=[0, 1])),
+                        y=alt.Y('Kademe:Q', scale=alt.Scale(reverse=True)),
+                        color='Faz:N', order='Kademe:Q',
+                        tooltip=['Kademe', 'x', 'y']
+                    ).properties(title="Kompozisyon Profili", height=500)
+                    temp_chart = alt.Chart(profile_df).mark_line(point=True, color='#d62728').encode(
+                        x=alt.X(f'{t_col}:Q', title=t_col, scale=alt.Scale(zero=False)),
+                        y=alt.Y('Kademe:Q', scale=alt.Scale(reverse=True)),
+                        order='Kademe:Q',
+                        tooltip=['Kademe', t_col]
+                    ).properties(title="Sıcaklık Profili", height=500)
+                    st.altair_chart(alt.hconcat(comp_chart, temp_chart), use_container_width=True)
+
+                    with st.expander("📋 Kademe Profili (F = 1 mol/s temelinde)"):
+                        st.dataframe(profile_df, hide_index=True, use_container_width=True)
+
                 else: # Ponchon-Savarit
                     df, points, trays, steps = calculate_ponchon_savarit(
-                        chem1, chem2, P, zF, xD, xB, q, R
+                        chem1, chem2, P, zF, xD, xB, q, R, vle=vle
                     )
                     
                     if trays == float('inf'):
@@ -238,6 +359,11 @@ with col_right:
                         vle_chart = alt.Chart(df).mark_line().encode(x='x', y='y').properties(title="x-y Diyagramı")
                         st.altair_chart(vle_chart, use_container_width=True)
 
+            except InfeasibleSpecError as e:
+                # Ön denetim: raf sayımına girilmeden reddedilen şartname
+                st.error(f"❌ Bu şartname sağlanamaz: {e}")
+                if e.diagnostic.get('reason') == 'azeotrope':
+                    st.info("💡 xD (veya xB) değerini azeotrop kompozisyonunun aynı tarafında seçin.")
             except Exception as e:
                 st.error(f"Hesaplama hatası: {e}")
                 # st.exception(e) # Debug için açılabilir
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import threading
+import numpy as np
+from src.calculators.lazy import lazy_import
+from src.calculators.property_cache import get_chemical
+from typing import Tuple
+
+ipdb = lazy_import("thermo.interaction_parameters")
+unifac = lazy_import("thermo.unifac")
+
+# Ayırma sayfasında sunulan modeller (anahtar -> görünen ad)
+ACTIVITY_MODELS = {
+    'ideal': "İdeal (Raoult)",
+    'wilson': "Wilson",
+    'nrtl': "NRTL",
+    'unifac': "UNIFAC",
+}
+
+
+class ActivityModel:
+    """
+    İkili sıvı faz aktivite katsayısı modeli.
+
+    `gammas(x1, T)` tüm kompozisyon noktaları için (γ1, γ2) dizilerini
+    döndürür; x1 ve T aynı boyutlu NumPy dizileridir (T skaler de olabilir).
+    """
+
+    name = 'ideal'
+
+    def ln_gammas(self, x1: np.ndarray, T: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        zeros = np.zeros(np.broadcast(x1, T).shape)
+        return zeros, zeros
+
+    def gammas(self, x1: np.ndarray, T: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        ln_g1, ln_g2 = self.ln_gammas(np.asarray(x1, dtype=float), np.asarray(T, dtype=float))
+        return np.exp(ln_g1), np.exp(ln_g2)
+
+    @property
+    def ideal(self) -> bool:
+        return type(self) is ActivityModel
+
+
+class WilsonModel(ActivityModel):
+    """
+    Wilson modeli; thermo'nun "Wilson original T" biçimi:
+    ln Λij = aij + bij/T (bij, K).
+    """
+
+    name = 'wilson'
+
+    def __init__(self, a12: float, a21: float, b12: float, b21: float):
+        self.a12, self.a21 = a12, a21
+        self.b12, self.b21 = b12, b21
+
+    def ln_gammas(self, x1, T):
+        x2 = 1.0 - x1
+        L12 = np.exp(self.a12 + self.b12 / T)
+        L21 = np.exp(self.a21 + self.b21 / T)
+        s1 = x1 + L12 * x2
+        s2 = x2 + L21 * x1
+        c = L12 / s1 - L21 / s2
+        return -np.log(s1) + x2 * c, -np.log(s2) - x1 * c
+
+
+class NRTLModel(ActivityModel):
+    """
+    NRTL modeli; thermo'nun "NRTL original T" biçimi:
+    τij = bij/T (bij, K), Gij = exp(-α τij).
+    """
+
+    name = 'nrtl'
+
+    def __init__(self, b12: float, b21: float, alpha: float):
+        self.b12, self.b21 = b12, b21
+        self.alpha = alpha
+
+    def ln_gammas(self, x1, T):
+        x2 = 1.0 - x1
+        t12 = self.b12 / T
+        t21 = self.b21 / T
+        G12 = np.exp(-self.alpha * t12)
+        G21 = np.exp(-self.alpha * t21)
+        s1 = x1 + x2 * G21
+        s2 = x2 + x1 * G12
+        ln_g1 = x2 ** 2 * (t21 * (G21 / s1) ** 2 + t12 * G12 / s2 ** 2)
+        ln_g2 = x1 ** 2 * (t12 * (G12 / s2) ** 2 + t21 * G21 / s1 ** 2)
+        return ln_g1, ln_g2
+
+
+class UNIFACModel(ActivityModel):
+    """
+    Orijinal UNIFAC (Fredenslund); grup parametreleri thermo.unifac
+    UFSG/UFIP tablolarından, Ψmn = exp(-amn/T).
+
+    nu: (2, G) bileşen başına grup sayıları; R, Q: (G,) grup hacim/alan
+    parametreleri; a: (G, G) ana grup etkileşim parametreleri (K).
+    Saf bileşen referans terimleri de T dizisi üzerinden birlikte hesaplanır.
+    """
+
+    name = 'unifac'
+
+    def __init__(self, nu: np.ndarray, R: np.ndarray, Q: np.ndarray, a: np.ndarray):
+        self.nu = nu
+        self.R = R
+        self.Q = Q
+        self.a = a
+        self.r = nu @ R
+        self.q = nu @ Q
+        # Saf bileşenlerdeki grup mol kesirleri (2, G)
+        self.X_pure = nu / nu.sum(axis=1, keepdims=True)
+
+    def _ln_Gamma(self, X: np.ndarray, psi: np.ndarray) -> np.ndarray:
+        """Grup mol kesirleri X (n, G) için ln Γk (n, G)."""
+        theta = X * self.Q
+        theta /= theta.sum(axis=-1, keepdims=True)
+        # S[n, k] = Σm Θm Ψmk
+        S = np.einsum('nm,nmk->nk', theta, psi)
+        return self.Q * (1.0 - np.log(S) - np.einsum('nm,nkm->nk', theta / S, psi))
+
+    def ln_gammas(self, x1, T):
+        x1, T = np.broadcast_arrays(np.atleast_1d(x1), np.atleast_1d(T))
+        x = np.stack([x1, 1.0 - x1], axis=-1)                    # (n, 2)
+
+        # Kombinatoryal kısım (x_i = 0 noktalarında da tanımlı biçim)
+        V = self.r / (x @ self.r)[:, None]
+        F = self.q / (x @ self.q)[:, None]
+        ln_comb = 1.0 - V + np.log(V) - 5.0 * self.q * (1.0 - V / F + np.log(V / F))
+
+        # Artık kısım
+        psi = np.exp(-self.a / T[:, None, None])                 # (n, G, G)
+        groups = x @ self.nu
+        ln_G = self._ln_Gamma(groups / groups.sum(axis=-1, keepdims=True), psi)
+        ln_res = np.empty_like(x)
+        for i in range(2):
+            ln_G_pure = self._ln_Gamma(np.broadcast_to(self.X_pure[i], ln_G.shape).copy(), psi)
+            ln_res[:, i] = ((ln_G - ln_G_pure) * self.nu[i]).sum(axis=-1)
+
+        ln_g = ln_comb + ln_res
+        return ln_g[:, 0], ln_g[:, 1]
+
+
+# ---------------- Parametre Kaynakları ----------------
+
+def _ip_pair(table: str, CASs: list, keys: list, label: str) -> dict:
+    db = ipdb.IPDB
+    if not db.has_ip_specific(table, CASs, keys[0]):
+        raise ValueError(f"{label} etkileşim parametresi bulunamadı ({' / '.join(CASs)}).")
+    params = {}
+    for key in keys:
+        if db.metadata[table]['symmetric'] or key.startswith('alpha'):
+            params[key] = db.get_ip_symmetric_matrix(table, CASs, key)
+        else:
+            params[key] = db.get_ip_asymmetric_matrix(table, CASs, key)
+    return params
+
+
+def _build_wilson(chem1, chem2) -> WilsonModel:
+    p = _ip_pair('ChemSep Wilson', [chem1.CAS, chem2.CAS], ['aij', 'bij'], "Wilson")
+    a, b = p['aij'], p['bij']
+    return WilsonModel(a[0][1], a[1][0], b[0][1], b[1][0])
+
+
+def _build_nrtl(chem1, chem2) -> NRTLModel:
+    p = _ip_pair('ChemSep NRTL', [chem1.CAS, chem2.CAS], ['bij', 'alphaij'], "NRTL")
+    b = p['bij']
+    return NRTLModel(b[0][1], b[1][0], p['alphaij'][0][1])
+
+
+def _build_unifac(chem1, chem2) -> UNIFACModel:
+    groups = []
+    for chem in (chem1, chem2):
+        g = chem.UNIFAC_groups
+        if not g:
+            raise ValueError(f"{chem.name} için UNIFAC grupları bulunamadı.")
+        groups.append(g)
+
+    ids = sorted(set(groups[0]) | set(groups[1]))
+    subgroups = [unifac.UFSG[k] for k in ids]
+    nu = np.array([[g.get(k, 0) for k in ids] for g in groups], dtype=float)
+    R = np.array([s.R for s in subgroups])
+    Q = np.array([s.Q for s in subgroups])
+
+    a = np.zeros((len(ids), len(ids)))
+    for m, sm in enumerate(subgroups):
+        for n, sn in enumerate(subgroups):
+            mg, ng = sm.main_group_id, sn.main_group_id
+            if mg == ng:
+                continue
+            try:
+                a[m, n] = unifac.UFIP[mg][ng]
+            except KeyError:
+                raise ValueError(
+                    f"UNIFAC ana grup etkileşimi bulunamadı: {sm.main_group} / {sn.main_group}"
+                ) from None
+    return UNIFACModel(nu, R, Q, a)
+
+
+_BUILDERS = {
+    'wilson': _build_wilson,
+    'nrtl': _build_nrtl,
+    'unifac': _build_unifac,
+}
+
+_models = {}
+_models_lock = threading.Lock()
+
+
+def get_activity_model(model: str, chem1: str, chem2: str) -> ActivityModel:
+    """
+    İkili sistem için aktivite modelini döndürür. Parametreler (ChemSep
+    ikili parametreleri veya UNIFAC grup etkileşim matrisi) her (model,
+    bileşen çifti) için bir kez toplanır ve bellekte tutulur.
+    """
+    if model not in ACTIVITY_MODELS:
+        raise ValueError(f"Bilinmeyen VLE modeli: {model}")
+    if model == 'ideal':
+        return ActivityModel()
+
+    key = (model, chem1.strip().lower(), chem2.strip().lower())
+    with _models_lock:
+        cached = _models.get(key)
+    if cached is not None:
+        return cached
+
+    activity = _BUILDERS[model](get_chemical(chem1), get_chemical(chem2))
+    with _models_lock:
+        return _models.setdefault(key, activity)
+
+
+def clear_activity_models():
+    """Önbelleklenmiş ikili parametreleri boşaltır."""
+    with _models_lock:
+        _models.clear()
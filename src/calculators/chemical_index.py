@@ -0,0 +1,325 @@
+import os
+import shutil
+import threading
+import unicodedata
+from importlib import metadata
+import numpy as np
+from src.calculators.lazy import lazy_import
+
+identifiers = lazy_import("chemicals.identifiers")
+
+# İndeks dosya biçimi değişirse artırılır (eski dizinler yeniden üretilir)
+INDEX_VERSION = 2
+
+# İndeksin saklandığı dizin (CHEMCALC_INDEX_DIR ile değiştirilebilir)
+INDEX_DIR = os.environ.get(
+    "CHEMCALC_INDEX_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "chemcalc", "identifiers"),
+)
+
+# Bileşen başına indekslenen en fazla eş anlamlı (PubChem sırası: yaygın olanlar önce)
+MAX_SYNONYMS = 16
+
+# Eşleşme türleri; sıralamada küçük değer önce gelir
+KIND_NAME, KIND_TURKISH, KIND_CAS, KIND_FORMULA, KIND_SYNONYM = range(5)
+KIND_LABELS = {
+    KIND_NAME: "isim", KIND_TURKISH: "Türkçe", KIND_CAS: "CAS",
+    KIND_FORMULA: "formül", KIND_SYNONYM: "eş anlamlı",
+}
+
+_ARRAYS = ("keys", "key_off", "key_head", "key_comp", "key_kind", "key_ntri",
+           "comp", "comp_off", "tri_codes", "tri_off", "tri_post")
+
+# Türkçe ve aksanlı harfler ASCII'ye katlanır; 'ı' NFKD ile ayrışmaz
+_FOLD = str.maketrans({"ı": "i"})
+
+
+def normalize_key(text: str) -> str:
+    """Arama anahtarı: küçük harf, aksansız, tek boşluklu."""
+    text = unicodedata.normalize("NFKD", text.translate(_FOLD))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.casefold().translate(_FOLD).split())
+
+
+def _trigrams(keys: list) -> tuple:
+    """
+    Anahtarların bayt trigramları: (kod, anahtar indeksi) çiftleri.
+
+    Anahtarlar " anahtar " olarak doldurulur (baş ve son trigramları kelime
+    sınırını taşır); kod b0<<16 | b1<<8 | b2'dir.
+    """
+    padded = [b" " + k + b" " for k in keys]
+    lengths = np.fromiter((len(p) for p in padded), dtype=np.int64, count=len(padded))
+    blob = np.frombuffer(b"".join(padded), dtype=np.uint8).astype(np.uint32)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    owner = np.repeat(np.arange(len(padded)), lengths)
+    pos = np.arange(blob.size) - np.repeat(starts, lengths)
+    valid = pos <= np.repeat(lengths, lengths) - 3
+    idx = np.flatnonzero(valid)
+    codes = (blob[idx] << 16) | (blob[idx + 1] << 8) | blob[idx + 2]
+    return codes, owner[idx]
+
+
+def _heads(keys: list) -> np.ndarray:
+    """Anahtarların ilk 8 baytı (sıfırla doldurulmuş, big-endian uint64); sıralama bayt sırasıyla aynıdır."""
+    return np.frombuffer(b"".join(k[:8].ljust(8, b"\0") for k in keys), dtype=">u8").astype(np.uint64)
+
+
+def _query_trigrams(key: bytes) -> np.ndarray:
+    # Tek kısa anahtar için saf Python, numpy kurulum maliyetinden hızlıdır
+    padded = b" " + key + b" "
+    codes = {(padded[i] << 16) | (padded[i + 1] << 8) | padded[i + 2] for i in range(len(padded) - 2)}
+    return np.array(sorted(codes), dtype=np.uint32)
+
+
+class ChemicalIndex:
+    """
+    Kimyasal isim/eş anlamlı/CAS/formül/Türkçe isim indeksi.
+
+    Anahtarlar normalize edilmiş UTF-8 bayt dizileri olarak sıralı saklanır
+    (önek araması ikili arama ile), trigram → anahtar listeleri ise bulanık
+    arama için ters indeks oluşturur. Tüm diziler .npy dosyalarından
+    bellek eşlemeli (mmap) açılır; yükleme milisaniyenin altındadır ve
+    sayfalar ilk erişimde okunur.
+    """
+
+    def __init__(self, arrays: dict):
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        self.n_keys = len(self.key_comp)
+
+    # ---- Disk ----
+
+    def save(self, path: str):
+        """Dizileri geçici dizine yazıp atomik olarak yerine taşır."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(tmp_path, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(getattr(self, name)))
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Başka bir süreç aynı indeksi önce yazdı
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: str) -> "ChemicalIndex":
+        # np.memmap alt sınıfı her dilimde ek maliyet getirir: aynı eşlemenin ndarray görünümü kullanılır
+        return cls({
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r").view(np.ndarray)
+            for name in _ARRAYS
+        })
+
+    # ---- Erişim ----
+
+    def key(self, i: int) -> bytes:
+        return self.keys[self.key_off[i]:self.key_off[i + 1]].tobytes()
+
+    def compound(self, c: int) -> tuple:
+        """(isim, CAS, formül)"""
+        name, cas, formula = self.comp[self.comp_off[c]:self.comp_off[c + 1]].tobytes().decode().split("\t")
+        return name, cas, formula
+
+    def _lower_bound(self, key: bytes) -> int:
+        # İlk 8 bayt üzerinde vektörel arama; daha uzun anahtarlarda aynı başlıklı aralık içinde ikili arama
+        head = _heads([key])[0]
+        lo = int(np.searchsorted(self.key_head, head, side="left"))
+        if len(key) <= 8:
+            return lo
+        hi = int(np.searchsorted(self.key_head, head, side="right"))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # ---- Arama ----
+
+    def prefix(self, query: str, limit: int = 200) -> tuple:
+        """Önek eşleşmeleri: (anahtar indeksleri, tam eşleşme maskesi); en fazla limit."""
+        q = normalize_key(query).encode()
+        if not q:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=bool)
+        lo = self._lower_bound(q)
+        # UTF-8 dizilerinde 0xFF baytı bulunmaz: önek aralığının üst sınırı
+        hi = min(self._lower_bound(q + b"\xff"), lo + limit)
+        keys = np.arange(lo, hi)
+        return keys, np.diff(self.key_off[lo:hi + 1]) == len(q)
+
+    def fuzzy(self, query: str, limit: int = 50, min_score: float = 0.3) -> tuple:
+        """Trigram benzerliği (Jaccard) en yüksek anahtarlar: (anahtar indeksleri, skorlar)."""
+        q = normalize_key(query).encode()
+        empty = np.empty(0, dtype=np.int64), np.empty(0)
+        if not q:
+            return empty
+        codes = _query_trigrams(q)
+        pos = np.searchsorted(self.tri_codes, codes)
+        found = pos < len(self.tri_codes)
+        found[found] = self.tri_codes[pos[found]] == codes[found]
+        pos = pos[found]
+        if pos.size == 0:
+            return empty
+        postings = np.concatenate([self.tri_post[self.tri_off[p]:self.tri_off[p + 1]] for p in pos])
+        shared = np.bincount(postings, minlength=self.n_keys)
+        # skor = s / (nq + nk - s) <= s / nq olduğundan skor >= t için s >= t * nq gerekir
+        keys = np.flatnonzero(shared >= max(1, int(np.ceil(min_score * len(codes)))))
+        shared = shared[keys]
+        score = shared / (len(codes) + self.key_ntri[keys] - shared)
+        keep = score >= min_score
+        keys, score = keys[keep], score[keep]
+        if keys.size > limit:
+            top = np.argpartition(-score, limit)[:limit]
+            keys, score = keys[top], score[top]
+        order = np.argsort(-score, kind="stable")
+        return keys[order], score[order]
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Önce tam/önek, sonra bulanık eşleşmeler; bileşen başına en iyi eşleşme.
+
+        Her sonuç bir sözlüktür: name, CAS, formula (Chemical'e verilecek
+        kimlik `name` ya da `CAS`), match (eşleşen anahtar), kind, score
+        (tam eşleşme 1.0, önek 0.9, bulanık eşleşmede trigram benzerliği).
+        """
+        keys, exact = self.prefix(query)
+        # Sıralama: tam eşleşme, tür (isim önce), kısa anahtar
+        order = np.lexsort((self.key_off[keys + 1] - self.key_off[keys],
+                            self.key_kind[keys], ~exact))
+        keys, score = keys[order], np.where(exact[order], 1.0, 0.9)
+
+        comps = self.key_comp[keys]
+        if np.unique(comps).size < limit:
+            f_keys, f_score = self.fuzzy(query, limit=limit * 5)
+            keys = np.concatenate((keys, f_keys))
+            score = np.concatenate((score, f_score))
+            comps = self.key_comp[keys]
+
+        # Bileşen başına ilk (en iyi) eşleşme, sıra korunarak
+        _, first = np.unique(comps, return_index=True)
+        first = np.sort(first)[:limit]
+
+        results = []
+        for i, s in zip(keys[first], score[first]):
+            name, cas, formula = self.compound(int(self.key_comp[i]))
+            results.append({
+                "name": name, "CAS": cas, "formula": formula,
+                "match": self.key(int(i)).decode(), "kind": KIND_LABELS[int(self.key_kind[i])],
+                "score": round(float(s), 3),
+            })
+        return results
+
+
+def build_chemical_index(translations: dict | None = None) -> ChemicalIndex:
+    """
+    chemicals paketinin varsayılan yüklenen veritabanlarından (PubChem küçük,
+    örnek kullanıcı, iyon ve inorganik; ~5000 bileşen) indeksi sıfırdan kurar.
+
+    translations: {İngilizce isim: "Türkçe (English)"} (CHEMICAL_TRANSLATIONS biçimi).
+    Büyük PubChem veritabanı (~70000 bileşen) indekslenmez; orada bulunan
+    isimler thermo tarafından yine çözülür ama öneri listesinde çıkmaz.
+    """
+    db = identifiers.get_pubchem_db()
+    compounds, comp_ids, entries = [], {}, {}
+
+    def add(key: str, c: int, kind: int):
+        k = normalize_key(key)
+        if not k:
+            return
+        prev = entries.get((k, c))
+        if prev is None or kind < prev:
+            entries[(k, c)] = kind
+
+    for meta in db.CAS_index.values():
+        if meta.CASs in comp_ids:
+            continue
+        c = comp_ids[meta.CASs] = len(compounds)
+        name = meta.common_name or meta.iupac_name or meta.CASs
+        compounds.append(f"{name}\t{meta.CASs}\t{meta.formula or ''}")
+        add(name, c, KIND_NAME)
+        if meta.iupac_name:
+            add(meta.iupac_name, c, KIND_SYNONYM)
+        for syn in meta.synonyms[:MAX_SYNONYMS]:
+            add(syn, c, KIND_SYNONYM)
+        add(meta.CASs, c, KIND_CAS)
+        if meta.formula:
+            add(meta.formula, c, KIND_FORMULA)
+
+    for english, label in (translations or {}).items():
+        try:
+            cas = identifiers.CAS_from_any(english)
+        except Exception:
+            continue
+        c = comp_ids.get(cas)
+        if c is None:
+            continue
+        add(english, c, KIND_NAME)
+        add(label.split(" (")[0], c, KIND_TURKISH)
+
+    items = sorted(((k.encode(), c, kind) for (k, c), kind in entries.items()))
+    keys = [k for k, _, _ in items]
+    key_off = np.concatenate(([0], np.cumsum([len(k) for k in keys]))).astype(np.int64)
+    comp_bytes = [s.encode() for s in compounds]
+    comp_off = np.concatenate(([0], np.cumsum([len(s) for s in comp_bytes]))).astype(np.int64)
+
+    codes, owner = _trigrams(keys)
+    pairs = np.unique((codes.astype(np.int64) << 32) | owner)
+    pair_codes = (pairs >> 32).astype(np.uint32)
+    tri_codes, tri_counts = np.unique(pair_codes, return_counts=True)
+
+    return ChemicalIndex({
+        "keys": np.frombuffer(b"".join(keys), dtype=np.uint8),
+        "key_off": key_off,
+        "key_head": _heads(keys),
+        "key_comp": np.array([c for _, c, _ in items], dtype=np.int32),
+        "key_kind": np.array([kind for _, _, kind in items], dtype=np.uint8),
+        "key_ntri": np.bincount((pairs & 0xFFFFFFFF).astype(np.int64), minlength=len(keys)).astype(np.uint16),
+        "comp": np.frombuffer(b"".join(comp_bytes), dtype=np.uint8),
+        "comp_off": comp_off,
+        "tri_codes": tri_codes,
+        "tri_off": np.concatenate(([0], np.cumsum(tri_counts))).astype(np.int64),
+        "tri_post": (pairs & 0xFFFFFFFF).astype(np.int32),
+    })
+
+
+def index_path(index_dir: str | None = None) -> str:
+    """İndeks dizininin yolu (indeks ve chemicals sürümüne göre)."""
+    # Sürüm paket meta verisinden okunur (chemicals'ı içe aktarmak ~0.2 s sürer)
+    return os.path.join(index_dir or INDEX_DIR, f"v{INDEX_VERSION}-chemicals-{metadata.version('chemicals')}")
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_chemical_index() -> ChemicalIndex:
+    """
+    İndeksi döndürür: önce bellek, sonra disk (mmap), en son chemicals
+    veritabanlarından kurup diske yazar.
+    """
+    global _index
+    if _index is not None:
+        return _index
+    with _index_lock:
+        if _index is None:
+            path = index_path()
+            try:
+                _index = ChemicalIndex.load(path)
+            except Exception:
+                from src.calculators.thermo_calculator import CHEMICAL_TRANSLATIONS
+                index = build_chemical_index(CHEMICAL_TRANSLATIONS)
+                try:
+                    index.save(path)
+                    index = ChemicalIndex.load(path)
+                except OSError:
+                    # Salt okunur dosya sistemi: indeks yalnızca bellekte tutulur
+                    pass
+                _index = index
+    return _index
+
+
+def search_chemicals(query: str, limit: int = 10) -> list:
+    """Paylaşılan indeksle kimyasal arama (bkz. ChemicalIndex.search)."""
+    return get_chemical_index().search(query, limit)
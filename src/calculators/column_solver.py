@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import numpy as np
+from src.calculators.activity_models import get_activity_model
+from src.calculators.property_cache import get_chemical
+from src.calculators.property_tables import get_component_table
+from typing import Dict, List, Sequence
+
+# ---------------- Linear Algebra ----------------
+
+def thomas_solve(a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Üç köşegenli sistemleri Thomas algoritmasıyla çözer.
+
+    a (alt), b (ana), c (üst köşegen) ve d (sağ taraf) (..., N) boyutludur;
+    öncü boyutlar (ör. bileşenler) bağımsız sistemlerdir ve aynı taramada
+    birlikte çözülür. a[..., 0] ve c[..., -1] kullanılmaz. İşlem sayısı
+    kademe sayısı N ile doğrusal artar.
+    """
+    n = b.shape[-1]
+    cp = np.empty_like(b)
+    dp = np.empty_like(b)
+    cp[..., 0] = c[..., 0] / b[..., 0]
+    dp[..., 0] = d[..., 0] / b[..., 0]
+    for j in range(1, n):
+        m = b[..., j] - a[..., j] * cp[..., j - 1]
+        cp[..., j] = c[..., j] / m
+        dp[..., j] = (d[..., j] - a[..., j] * dp[..., j - 1]) / m
+
+    x = np.empty_like(b)
+    x[..., -1] = dp[..., -1]
+    for j in range(n - 2, -1, -1):
+        x[..., j] = dp[..., j] - cp[..., j] * x[..., j + 1]
+    return x
+
+
+def block_thomas_solve(A: np.ndarray, B: np.ndarray, C: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Blok üç köşegenli sistemi (blok Thomas) çözer.
+
+    A, B, C (N, n, n) alt, ana ve üst köşegen blokları; d (N, n) sağ taraf.
+    A[0] ve C[-1] kullanılmaz. Her kademede bir (n, n) çözüm yapıldığından
+    işlem sayısı N ile doğrusal, blok boyutu n ile kübik artar.
+    """
+    N, n = d.shape
+    G = np.empty_like(C)
+    g = np.empty_like(d)
+    for j in range(N):
+        M = B[j] if j == 0 else B[j] - A[j] @ G[j - 1]
+        rhs = d[j] if j == 0 else d[j] - A[j] @ g[j - 1]
+        sol = np.linalg.solve(M, np.column_stack([C[j], rhs]))
+        G[j], g[j] = sol[:, :n], sol[:, n]
+
+    X = np.empty_like(d)
+    X[-1] = g[-1]
+    for j in range(N - 2, -1, -1):
+        X[j] = g[j] - G[j] @ X[j + 1]
+    return X
+
+
+# ---------------- Thermodynamic Layer ----------------
+
+class _MixtureModel:
+    """
+    Kolon çözücüsü için K-değerleri ve molar entalpiler.
+
+    K_i = γ_i Psat_i(T) / P (modifiye Raoult); Psat ve faz entalpileri
+    bileşen tablolarından (property_tables) okunur, entalpiler ideal karışım
+    varsayımıyla J/mol'dür. Aktivite modelleri yalnızca ikili sistemlerde
+    kullanılabilir; çok bileşenli sistemler ideal (Raoult) çözülür.
+    """
+
+    def __init__(self, components: Sequence[str], P: float, model: str = 'ideal'):
+        if len(components) < 2:
+            raise ValueError("En az iki bileşen gereklidir.")
+        if model != 'ideal' and len(components) != 2:
+            raise ValueError("Aktivite modelleri yalnızca ikili sistemler için kullanılabilir.")
+        self.P = P
+        self.tables = [get_component_table(c) for c in components]
+        self.M = np.array([get_chemical(c).MW / 1000.0 for c in components])[:, None]
+        self.activity = get_activity_model(model, components[0], components[1]) if model != 'ideal' else None
+        self.T_lo = max(t.T_min for t in self.tables)
+        self.T_hi = min(t.T_max for t in self.tables)
+        if self.T_lo >= self.T_hi:
+            raise ValueError("Bileşenlerin tablo aralıkları örtüşmüyor.")
+        self.Tsat = np.array([float(t.Tsat(P)) for t in self.tables])
+
+    def K(self, x: np.ndarray, T: np.ndarray) -> np.ndarray:
+        """K-değerleri (C, N); x (C, N) sıvı kompozisyonu, T (N,)."""
+        K = np.array([t.psat(T) for t in self.tables]) / self.P
+        if self.activity is not None:
+            K *= np.array(self.activity.gammas(x[0], T))
+        return K
+
+    def dlnK_dT(self, T: np.ndarray) -> np.ndarray:
+        """d ln K / dT (C, N); γ'nın sıcaklık bağımlılığı ihmal edilir."""
+        return np.array([t.dln_psat_dT(T) for t in self.tables])
+
+    def h_liquid(self, x: np.ndarray, T: np.ndarray) -> np.ndarray:
+        return (x * self.M * np.array([t.H_liquid(T) for t in self.tables])).sum(axis=0)
+
+    def H_vapor(self, y: np.ndarray, T: np.ndarray) -> np.ndarray:
+        return (y * self.M * np.array([t.H_vapor(T) for t in self.tables])).sum(axis=0)
+
+    def bubble_T(self, x: np.ndarray, T0: np.ndarray, tol: float = 1e-8, max_iter: int = 50) -> np.ndarray:
+        """
+        Tüm kademeler için kabarcık noktası: ln Σ K_i x_i = 0, sınırlandırılmış
+        Newton (separation_calculator._solve_bubble_T'nin çok bileşenli hali).
+        """
+        lo = np.full_like(T0, self.T_lo)
+        hi = np.full_like(T0, self.T_hi)
+        T = np.clip(T0, self.T_lo, self.T_hi)
+        for _ in range(max_iter):
+            Kx = self.K(x, T) * x
+            s = Kx.sum(axis=0)
+            g = np.log(s)
+            lo = np.where(g < 0, T, lo)
+            hi = np.where(g > 0, T, hi)
+            T_new = T - g / ((Kx * self.dlnK_dT(T)).sum(axis=0) / s)
+            outside = ~np.isfinite(T_new) | (T_new <= lo) | (T_new >= hi)
+            T_new = np.where(outside, 0.5 * (lo + hi), T_new)
+            done = np.abs(T_new - T) < tol
+            T = T_new
+            if done.all():
+                break
+        return T
+
+
+# ---------------- MESH Column Solver ----------------
+
+class _MESHSystem:
+    """
+    Naphtali-Sandholm değişkenleriyle kolon denklemleri.
+
+    Kademe j'nin değişkenleri X[j] = [v_1j..v_Cj, T_j, l_1j..l_Cj] (bileşen
+    akımları, mol/s ve sıcaklık, K). Kademe j'nin artıkları yalnızca j-1, j ve
+    j+1 kademelerine bağlı olduğundan Jacobian blok üç köşegenlidir.
+    """
+
+    def __init__(self, thermo: _MixtureModel, N: int, R: float, Fz: np.ndarray,
+                 FH: np.ndarray, U: np.ndarray, W: np.ndarray, B: float):
+        self.thermo = thermo
+        self.N = N
+        self.C = Fz.shape[0]
+        self.R = R
+        self.Fz, self.FH = Fz, FH
+        self.U, self.W = U, W
+        self.B = B
+        self.F_total = Fz.sum()
+        # Entalpi artıkları tipik bir buharlaşma ısısıyla ölçeklenir
+        T_ref = np.full(1, thermo.Tsat.mean())
+        lam = [thermo.H_vapor(e, T_ref) - thermo.h_liquid(e, T_ref) for e in np.eye(self.C)[:, :, None]]
+        self.H_scale = float(np.mean(lam)) * self.F_total
+        # Sayısal türev adımı için değişken ölçekleri
+        self.X_scale = np.concatenate([np.full(self.C, 1e-3 * self.F_total), [1.0],
+                                       np.full(self.C, 1e-3 * self.F_total)])
+
+    def unpack(self, X: np.ndarray):
+        C = self.C
+        return X[:, :C].T, X[:, C], X[:, C + 1:].T
+
+    def profile(self, X: np.ndarray) -> Dict:
+        """Akımlar, kompozisyonlar ve entalpiler; 1. kademede V = 0."""
+        v, T, l = self.unpack(X)
+        L = l.sum(axis=0)
+        V = v.sum(axis=0)
+        x = l / L
+        y = v / np.where(V > 0, V, 1.0)
+        K = self.thermo.K(x, T)
+        # Yoğuşturucudaki geri akış/distilat oranı sabittir: U_1 = L_1 / R
+        U = self.U.copy()
+        U[0] = L[0] / self.R
+        return {
+            'v': v, 'T': T, 'l': l, 'L': L, 'V': V, 'x': x, 'y': y, 'K': K, 'U': U,
+            'h': self.thermo.h_liquid(x, T), 'H': self.thermo.H_vapor(y, T),
+        }
+
+    def residuals(self, X: np.ndarray) -> np.ndarray:
+        """
+        Ölçeklenmiş artıklar (N, 2C+1): kütle (M), denge (E) ve entalpi (H).
+        1. kademede E yerine v_i1 = 0, H yerine kabarcık noktası koşulu;
+        N. kademede H yerine dip ürün kısıtı L_N = B kullanılır.
+        """
+        p = self.profile(X)
+        l, v, L, V = p['l'], p['v'], p['L'], p['V']
+        zero = np.zeros((self.C, 1))
+        l_in = np.concatenate([zero, l[:, :-1]], axis=1)
+        v_in = np.concatenate([v[:, 1:], zero], axis=1)
+
+        M = l * (1 + p['U'] / L) + v * (1 + self.W / np.where(V > 0, V, 1.0)) - l_in - v_in - self.Fz
+        E = p['K'] * p['x'] * V - v
+        E[:, 0] = v[:, 0]
+
+        h, H = p['h'], p['H']
+        Q = ((L + p['U']) * h + (V + self.W) * H
+             - np.append(0.0, L[:-1] * h[:-1]) - np.append(V[1:] * H[1:], 0.0) - self.FH)
+        Q /= self.H_scale
+        Q[0] = np.log((p['K'][:, 0] * p['x'][:, 0]).sum())
+        Q[-1] = (L[-1] - self.B) / self.F_total
+
+        return np.concatenate([M / self.F_total, Q[None], E / self.F_total]).T
+
+    def jacobian(self, X: np.ndarray, F0: np.ndarray):
+        """
+        Blok üç köşegenli Jacobian (A, B, C) ileri farklarla. Aralarında iki
+        kademe bulunan kademeler aynı anda pertürbe edilir (3 renk), böylece
+        artık değerlendirme sayısı N'den bağımsız 3(2C+1) olur.
+        """
+        N, n = X.shape
+        A = np.zeros((N, n, n))
+        B = np.zeros((N, n, n))
+        C = np.zeros((N, n, n))
+        step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(X), self.X_scale)
+        for color in range(3):
+            idx = np.arange(color, N, 3)
+            for k in range(n):
+                Xp = X.copy()
+                Xp[idx, k] += step[idx, k]
+                dF = self.residuals(Xp) - F0
+                h = step[idx, k][:, None]
+                B[idx, :, k] = dF[idx] / h
+                up = idx >= 1
+                C[idx[up] - 1, :, k] = dF[idx[up] - 1] / h[up]
+                down = idx <= N - 2
+                A[idx[down] + 1, :, k] = dF[idx[down] + 1] / h[down]
+        return A, B, C
+
+
+def _initial_profile(system: _MESHSystem, D: float, F: np.ndarray, Fq: np.ndarray,
+                     sweeps: int = 10, relax: float = 0.5) -> np.ndarray:
+    """
+    Newton için başlangıç: sabit molal taşma akımlarıyla birkaç sönümlü
+    kabarcık noktası (Wang-Henke) taraması; bileşen denklikleri Thomas ile.
+    """
+    thermo, N, C = system.thermo, system.N, system.C
+    U, W, R = system.U, system.W, system.R
+    V = np.zeros(N)
+    V[1] = (R + 1) * D
+    for j in range(1, N - 1):
+        V[j + 1] = V[j] + W[j] - (F[j] - Fq[j])
+    S = np.cumsum(F - U - W) - D
+    L = np.append(V[1:], 0.0) + S
+    L[0] = R * D
+    if (V[1:] <= 0).any() or (L <= 0).any():
+        raise ValueError("Negatif akım oluştu; R, D veya besleme şartlarını kontrol edin.")
+
+    U_all = U.copy()
+    U_all[0] = D
+    T = np.linspace(thermo.Tsat.min(), thermo.Tsat.max(), N)
+    x = np.tile(system.Fz.sum(axis=1, keepdims=True) / system.F_total, (1, N))
+    for _ in range(sweeps):
+        K = thermo.K(x, T)
+        a = np.broadcast_to(np.append(0.0, L[:-1]), (C, N))
+        b = -(L + U_all + (V + W) * K)
+        c = np.append(V[1:], 0.0) * np.concatenate([K[:, 1:], np.zeros((C, 1))], axis=1)
+        x = np.clip(thomas_solve(a, b, c, -system.Fz), 1e-12, None)
+        x /= x.sum(axis=0)
+        T = T + relax * (thermo.bubble_T(x, T) - T)
+
+    y = thermo.K(x, T) * x
+    y /= y.sum(axis=0)
+    return np.concatenate([(V * y), T[None], (L * x)]).T
+
+
+def solve_column(
+    components: Sequence[str], P: float, N: int, feeds: List[Dict], D: float, R: float,
+    side_draws: List[Dict] | None = None, model: str = 'ideal',
+    tol: float = 1e-9, max_iter: int = 50, max_dT: float = 10.0
+) -> Dict:
+    """
+    Denge kademeli kolonun MESH (kütle, denge, toplam, entalpi) denklemlerini
+    Naphtali-Sandholm yöntemiyle, tüm kademeler için eşzamanlı Newton
+    iterasyonuyla çözer.
+
+    Kademeler yukarıdan aşağı 1..N numaralanır: 1 toplam yoğuşturucu
+    (distilat sıvı olarak alınır, geri akış L1 = R*D), N kısmi kazandır.
+    Başlangıç profili birkaç kabarcık noktası taramasıyla kurulur; Newton
+    adımında blok üç köşegenli Jacobian blok Thomas ile çözüldüğünden her
+    iterasyonun maliyeti kademe sayısı N ile doğrusal artar. Sıcaklık adımı
+    max_dT ile sınırlanır, negatif çıkan akımlar küçültülerek pozitif tutulur.
+
+    feeds: [{'stage': j, 'F': mol/s, 'z': [..], 'q': sıvı kesri}, ...]
+        Besleme entalpisi, z'nin kabarcık noktasında
+        H_F = q*h_L + (1 - q)*H_V ile alınır.
+    side_draws: [{'stage': j, 'phase': 'l' | 'v', 'rate': mol/s}, ...]
+    model: 'ideal' veya ikili sistemler için aktivite modeli.
+
+    Döndürür: kademe dizileri 'T', 'L', 'V', 'x' (N, C), 'y' (N, C);
+    ürünler 'D', 'B', 'xD', 'xB'; görevler 'Qc' (yoğuşturucudan çekilen)
+    ve 'Qr' (kazana verilen); 'iterations' (Newton adımı sayısı).
+    """
+    C = len(components)
+    if N < 3:
+        raise ValueError("Kademe sayısı en az 3 olmalıdır (yoğuşturucu + kademe + kazan).")
+    if D <= 0 or R <= 0:
+        raise ValueError("D ve R sıfırdan büyük olmalıdır.")
+    thermo = _MixtureModel(components, P, model)
+
+    # Beslemeler ve yan çekişler (0 tabanlı kademe indeksleri)
+    F = np.zeros(N)
+    Fz = np.zeros((C, N))
+    Fq = np.zeros(N)
+    for feed in feeds:
+        j = int(feed['stage']) - 1
+        if not 0 < j < N:
+            raise ValueError("Besleme kademesi 2..N aralığında olmalıdır.")
+        z = np.asarray(feed['z'], dtype=float)
+        if len(z) != C or z.min() < 0:
+            raise ValueError("Besleme kompozisyonu bileşen sayısıyla uyuşmuyor.")
+        F[j] += feed['F']
+        Fz[:, j] += feed['F'] * z / z.sum()
+        Fq[j] += feed['F'] * feed.get('q', 1.0)
+
+    U = np.zeros(N)
+    W = np.zeros(N)
+    for draw in side_draws or []:
+        j = int(draw['stage']) - 1
+        if not 0 < j < N - 1:
+            raise ValueError("Yan çekiş kademesi 2..N-1 aralığında olmalıdır.")
+        (U if draw['phase'] == 'l' else W)[j] += draw['rate']
+
+    B = F.sum() - D - U.sum() - W.sum()
+    if B <= 0:
+        raise ValueError("Dip ürün akımı pozitif değil; D ve yan çekişler beslemeyi aşıyor.")
+
+    # Besleme entalpileri (J/s)
+    z_feed = np.where(F > 0, Fz / np.where(F > 0, F, 1.0), 1.0 / C)
+    T_feed = thermo.bubble_T(z_feed, np.full(N, thermo.Tsat.mean()))
+    q_feed = np.where(F > 0, Fq / np.where(F > 0, F, 1.0), 1.0)
+    FH = F * (q_feed * thermo.h_liquid(z_feed, T_feed)
+              + (1 - q_feed) * thermo.H_vapor(z_feed, T_feed))
+
+    system = _MESHSystem(thermo, N, R, Fz, FH, U, W, B)
+    X = _initial_profile(system, D, F, Fq)
+
+    converged = False
+    for it in range(1, max_iter + 1):
+        F0 = system.residuals(X)
+        if np.isfinite(F0).all() and np.abs(F0).max() < tol:
+            converged = True
+            break
+        dX = block_thomas_solve(*system.jacobian(X, F0), -F0)
+
+        step = min(1.0, max_dT / max(np.abs(dX[:, C]).max(), 1e-300))
+        X_new = X + step * dX
+        flows = np.r_[0:C, C + 1:2 * C + 1]
+        X_new[:, flows] = np.where(X_new[:, flows] > 0, X_new[:, flows], 0.1 * X[:, flows])
+        X_new[0, :C] = 0.0
+        X_new[:, C] = np.clip(X_new[:, C], thermo.T_lo, thermo.T_hi)
+        X = X_new
+
+    if not converged:
+        raise ValueError(f"MESH çözümü {max_iter} iterasyonda yakınsamadı.")
+
+    p = system.profile(X)
+    L, V, h, H, x = p['L'], p['V'], p['h'], p['H'], p['x']
+    y = p['y'].copy()
+    y[:, 0] = p['K'][:, 0] * x[:, 0]
+    Qc = V[1] * H[1] - (L[0] + p['U'][0]) * h[0]
+    Qr = (L[-1] + U[-1]) * h[-1] + (V[-1] + W[-1]) * H[-1] - L[-2] * h[-2] - FH[-1]
+    return {
+        'components': list(components),
+        'stage': np.arange(1, N + 1),
+        'T': p['T'],
+        'L': L,
+        'V': V,
+        'x': x.T,
+        'y': y.T,
+        'D': float(p['U'][0]),
+        'B': float(L[-1]),
+        'xD': x[:, 0],
+        'xB': x[:, -1],
+        'Qc': float(Qc),
+        'Qr': float(Qr),
+        'iterations': it - 1,
+    }
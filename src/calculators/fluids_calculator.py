@@ -1,4 +1,13 @@
-from fluids.friction import friction_factor
+from __future__ import annotations
+
+import numpy as np
+from src.calculators.lazy import lazy_import
+
+pd = lazy_import("pandas")
+sp = lazy_import("scipy.sparse")
+csgraph = lazy_import("scipy.sparse.csgraph")
+sparse_linalg = lazy_import("scipy.sparse.linalg")
+fluids_friction = lazy_import("fluids.friction")
 
 def calculate_reynolds(density, velocity, diameter, viscosity):
     """
@@ -42,7 +51,7 @@ def calculate_pressure_drop(density, velocity, diameter, viscosity, length, roug
 
     # Sürtünme faktörünü hesapla
     try:
-        fd = friction_factor(Re=re, eD=roughness/diameter)
+        fd = fluids_friction.friction_factor(Re=re, eD=roughness/diameter)
     except Exception as e:
         return None, None, f"Sürtünme faktörü hesaplanırken hata: {str(e)}"
     
@@ -50,3 +59,340 @@ def calculate_pressure_drop(density, velocity, diameter, viscosity, length, roug
     pressure_drop = fd * (length / diameter) * (density * velocity**2) / 2
     
     return pressure_drop, fd, None
+
+
+# ---------------- Dizi (Vektörel) Sürümler ----------------
+
+# Satır bazında hata kodları (0: hata yok); mesajlar skaler fonksiyonlarla aynı
+ERR_OK = 0
+ERR_DENSITY = 1
+ERR_DIAMETER = 2
+ERR_VISCOSITY = 3
+ERR_VELOCITY = 4
+ERR_LENGTH = 5
+ERR_ROUGHNESS = 6
+ERR_FRICTION = 7
+
+ERROR_MESSAGES = {
+    ERR_OK: None,
+    ERR_DENSITY: "Yoğunluk sıfırdan büyük olmalıdır.",
+    ERR_DIAMETER: "Çap sıfırdan büyük olmalıdır.",
+    ERR_VISCOSITY: "Viskozite sıfırdan büyük olmalıdır.",
+    ERR_VELOCITY: "Hız negatif olamaz.",
+    ERR_LENGTH: "Uzunluk sıfırdan büyük olmalıdır.",
+    ERR_ROUGHNESS: "Pürüzlülük negatif olamaz.",
+    ERR_FRICTION: "Sürtünme faktörü hesaplanamadı (Re = 0).",
+}
+
+# Akış rejimi kodları -> calculate_reynolds ile aynı etiketler
+FLOW_LAMINAR = 0
+FLOW_TRANSITION = 1
+FLOW_TURBULENT = 2
+FLOW_TYPES = ("Laminer", "Geçiş Bölgesi", "Türbülanslı")
+
+# fluids.friction.friction_factor ile aynı laminer geçiş sınırı
+LAMINAR_TRANSITION_PIPE = 2040.0
+
+
+def _first_error(checks):
+    """(maske, kod) listesinden her eleman için ilk sağlanan hatanın kodunu döndürür."""
+    err = np.zeros(np.broadcast(*[mask for mask, _ in checks]).shape, dtype=np.int8)
+    # Ters sırada yazılır: öncelikli (ilk) kontrol en son yazılıp kazanır
+    for mask, code in reversed(checks):
+        err = np.where(mask, np.int8(code), err)
+    return err
+
+
+def friction_factor_array(Re, eD, method: str = "Clamond", laminar_transition: float = LAMINAR_TRANSITION_PIPE):
+    """
+    Darcy sürtünme faktörü (dizi). Re < laminar_transition için 64/Re, aksi
+    halde seçilen açık korelasyon: 'Clamond' (Colebrook'un tam çözümü,
+    friction_factor varsayılanı), 'Churchill_1977', 'Haaland' veya
+    'Serghides_2'. Churchill_1977 tüm rejimleri kapsadığından
+    laminar_transition=0 ile sürekli bir eğri verir.
+    Re <= 0 olan elemanlar NaN döner.
+    """
+    Re = np.asarray(Re, dtype=float)
+    eD = np.asarray(eD, dtype=float)
+    Re, eD = np.broadcast_arrays(Re, eD)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if method == "Clamond":
+            X1 = eD * Re * 0.1239681863354175
+            X2 = np.log(Re) - 0.7793974884556819
+            F = X2 - 0.2
+            X1F = X1 + F
+            X1F1 = 1.0 + X1F
+            E = (np.log(X1F) - 0.2) / X1F1
+            F = F - (X1F1 + 0.5*E) * E * X1F / (X1F1 + E * (1.0 + E / 3.0))
+            X1F = X1 + F
+            X1F1 = 1.0 + X1F
+            E = (np.log(X1F) + F - X2) / X1F1
+            B = X1F1 + E * (1.0 + E / 3.0)
+            F = B / (B * F - (X1F1 + 0.5*E) * E * X1F)
+            fd = 1.3254745276195995 * F * F
+        elif method == "Churchill_1977":
+            A3 = (37530.0 / Re)**16
+            A2 = (2.457 * np.log((7.0 / Re)**0.9 + 0.27 * eD))**16
+            fd = 8.0 * ((8.0 / Re)**12 + 1.0 / (A2 + A3)**1.5)**(1.0 / 12.0)
+        elif method == "Haaland":
+            term = -3.6 * np.log10(6.9 / Re + (eD / 3.7)**1.11)
+            fd = 4.0 / (term * term)
+        elif method == "Serghides_2":
+            A = -2.0 * np.log10(eD / 3.7 + 12.0 / Re)
+            B = -2.0 * np.log10(eD / 3.7 + 2.51 * A / Re)
+            x1 = A - 4.781
+            term = 4.781 - x1 * x1 / (B - 2.0 * A + 4.781)
+            fd = 1.0 / (term * term)
+        else:
+            raise ValueError(f"Bilinmeyen sürtünme faktörü yöntemi: {method}")
+
+        fd = np.where(Re < laminar_transition, 64.0 / Re, fd)
+    return np.where(Re > 0, fd, np.nan)
+
+
+def calculate_reynolds_array(density, velocity, diameter, viscosity):
+    """
+    calculate_reynolds'un dizi sürümü. Girdiler yayınlanabilir (broadcast)
+    diziler veya skalerlerdir.
+
+    Dönen: (Re, akış rejimi kodu, hata kodu) dizileri. Geçersiz satırlarda
+    Re NaN, rejim -1'dir; rejim etiketleri FLOW_TYPES, hata mesajları
+    ERROR_MESSAGES içindedir.
+    """
+    density, velocity, diameter, viscosity = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (density, velocity, diameter, viscosity))
+    )
+    # NaN girdiler de hatalı sayılsın diye koşullar "~(geçerli)" biçiminde yazılır
+    err = _first_error([
+        (~(density > 0), ERR_DENSITY),
+        (~(diameter > 0), ERR_DIAMETER),
+        (~(viscosity > 0), ERR_VISCOSITY),
+        (~(velocity >= 0), ERR_VELOCITY),
+    ])
+    ok = err == ERR_OK
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        re = np.where(ok, density * velocity * diameter / viscosity, np.nan)
+
+    regime = np.where(re < 2300, FLOW_LAMINAR, np.where(re <= 4000, FLOW_TRANSITION, FLOW_TURBULENT))
+    regime = np.where(ok, regime, -1).astype(np.int8)
+    return re, regime, err
+
+
+def calculate_pressure_drop_array(density, velocity, diameter, viscosity, length, roughness,
+                                  method: str = "Clamond"):
+    """
+    calculate_pressure_drop'un dizi sürümü (Darcy-Weisbach).
+
+    Dönen: (basınç düşüşü [Pa], Darcy sürtünme faktörü, hata kodu) dizileri;
+    geçersiz satırlarda değerler NaN'dir.
+    """
+    re, _, err = calculate_reynolds_array(density, velocity, diameter, viscosity)
+    density, velocity, diameter, length, roughness = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (density, velocity, diameter, length, roughness)), re
+    )[:5]
+
+    err = np.where(err != ERR_OK, err, _first_error([
+        (~(length > 0), ERR_LENGTH),
+        (~(roughness >= 0), ERR_ROUGHNESS),
+        (~(re > 0), ERR_FRICTION),
+    ]))
+    ok = err == ERR_OK
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fd = np.where(ok, friction_factor_array(re, roughness / diameter, method), np.nan)
+        pressure_drop = fd * (length / diameter) * (density * velocity**2) / 2
+    return pressure_drop, fd, err
+
+
+# ---------------- Boru Ağı Çözücü ----------------
+
+# Yerçekimi ivmesi [m/s^2]
+_G = 9.80665
+
+# Türev ve sıfır akış için hız alt sınırı [m/s]
+_V_MIN = 1e-9
+
+
+def _network_friction(v, density, viscosity, diameter, roughness, method):
+    """
+    Ağ çözücüsünde kullanılan sürtünme faktörü. Laminer/türbülanslı sınırdaki
+    sıçrama Newton iterasyonunu salınıma sokabildiğinden Churchill_1977
+    laminer kesme olmadan (sürekli) kullanılır.
+    """
+    re = density * v * diameter / viscosity
+    cutoff = 0.0 if method == "Churchill_1977" else LAMINAR_TRANSITION_PIPE
+    return re, friction_factor_array(re, roughness / diameter, method, laminar_transition=cutoff)
+
+
+def _pipe_dp(v, density, viscosity, diameter, length, roughness, method):
+    """Darcy-Weisbach basınç düşüşü [Pa] (v > 0)."""
+    _, fd = _network_friction(v, density, viscosity, diameter, roughness, method)
+    return fd * (length / diameter) * (density * v**2) / 2
+
+
+def _pipe_losses(Q, area, density, viscosity, diameter, length, roughness, method):
+    """Boru basınç kayıpları h(Q) [Pa] (akış yönünde işaretli) ve dh/dQ [Pa s/m^3]."""
+    v = np.maximum(np.abs(Q) / area, _V_MIN)
+    dp = _pipe_dp(v, density, viscosity, diameter, length, roughness, method)
+
+    # dh/dQ: sürtünme faktörünün Re bağımlılığı dahil, merkezi fark ile
+    dv = 1e-6 * v
+    dp_hi = _pipe_dp(v + dv, density, viscosity, diameter, length, roughness, method)
+    dp_lo = _pipe_dp(v - dv, density, viscosity, diameter, length, roughness, method)
+    dh_dQ = (dp_hi - dp_lo) / (2.0 * dv * area)
+    return np.sign(Q) * dp, dh_dQ
+
+
+def solve_pipe_network(nodes: pd.DataFrame, pipes: pd.DataFrame, density: float, viscosity: float,
+                       method: str = "Churchill_1977", tol: float = 1e-9, max_iter: int = 100):
+    """
+    Boru ağındaki debi ve düğüm basınçlarını çözer (Todini-Pilati global
+    gradyan yöntemi: debi ve basınçlar için Newton-Raphson, basınç adımı
+    seyrek Schur tümleyeni A21 D^-1 A12 ile çözülür).
+
+    nodes: 'node', 'demand' [m^3/s, düğümden çekilen], 'pressure' [Pa, yalnızca
+           sabit basınçlı düğümlerde dolu], isteğe bağlı 'elevation' [m]
+    pipes: 'pipe', 'from', 'to', 'length' [m], 'diameter' [m], 'roughness' [m]
+
+    Sürtünme faktörü friction_factor_array ile hesaplanır; varsayılan
+    Churchill_1977 rejimler arasında sürekli olduğundan yakınsama güvenilirdir.
+    Dönen sözlük: 'pipes' (Q, v, Re, fD, dP), 'nodes' (pressure), 'history'
+    (iterasyon başına en büyük debi adımı ve artıklar), 'converged', 'iterations'.
+    """
+    if density <= 0:
+        raise ValueError(ERROR_MESSAGES[ERR_DENSITY])
+    if viscosity <= 0:
+        raise ValueError(ERROR_MESSAGES[ERR_VISCOSITY])
+
+    for col in ('node',):
+        if col not in nodes.columns:
+            raise ValueError(f"Düğüm tablosunda '{col}' sütunu eksik.")
+    for col in ('pipe', 'from', 'to', 'length', 'diameter', 'roughness'):
+        if col not in pipes.columns:
+            raise ValueError(f"Boru tablosunda '{col}' sütunu eksik.")
+
+    node_ids = nodes['node'].astype(str).to_numpy()
+    if len(set(node_ids)) != len(node_ids):
+        raise ValueError("Düğüm kimlikleri tekil olmalıdır.")
+    index = {nid: i for i, nid in enumerate(node_ids)}
+
+    try:
+        i_from = np.array([index[str(n)] for n in pipes['from']], dtype=int)
+        i_to = np.array([index[str(n)] for n in pipes['to']], dtype=int)
+    except KeyError as e:
+        raise ValueError(f"Boru tablosunda tanımsız düğüm: {e.args[0]}")
+
+    length = pipes['length'].to_numpy(dtype=float)
+    diameter = pipes['diameter'].to_numpy(dtype=float)
+    roughness = pipes['roughness'].to_numpy(dtype=float)
+    err = _first_error([
+        (~(diameter > 0), ERR_DIAMETER),
+        (~(length > 0), ERR_LENGTH),
+        (~(roughness >= 0), ERR_ROUGHNESS),
+    ])
+    if np.any(err != ERR_OK):
+        k = int(np.flatnonzero(err != ERR_OK)[0])
+        raise ValueError(f"Boru {pipes['pipe'].iloc[k]}: {ERROR_MESSAGES[int(err[k])]}")
+
+    n_nodes, n_pipes = len(node_ids), len(pipes)
+    demand = nodes['demand'].fillna(0.0).to_numpy(dtype=float) if 'demand' in nodes.columns else np.zeros(n_nodes)
+    fixed_p = nodes['pressure'].to_numpy(dtype=float) if 'pressure' in nodes.columns else np.full(n_nodes, np.nan)
+    elevation = nodes['elevation'].fillna(0.0).to_numpy(dtype=float) if 'elevation' in nodes.columns else np.zeros(n_nodes)
+
+    fixed = np.isfinite(fixed_p)
+    if not fixed.any():
+        raise ValueError("En az bir düğümde basınç sabitlenmelidir.")
+
+    # Her bağlı bileşende sabit basınçlı bir düğüm bulunmalı (aksi halde sistem tekil)
+    rows = np.arange(n_pipes)
+    graph = sp.coo_matrix((np.ones(n_pipes), (i_from, i_to)), shape=(n_nodes, n_nodes))
+    _, labels = csgraph.connected_components(graph, directed=False)
+    floating = np.setdiff1d(np.unique(labels), np.unique(labels[fixed]))
+    if floating.size:
+        raise ValueError("Sabit basınçlı düğüme bağlı olmayan ağ parçası var: "
+                         + ", ".join(node_ids[labels == floating[0]][:5]))
+
+    # Geliş matrisi (boru x düğüm): başlangıç -1, bitiş +1
+    A = sp.csr_matrix(
+        (np.concatenate([-np.ones(n_pipes), np.ones(n_pipes)]),
+         (np.concatenate([rows, rows]), np.concatenate([i_from, i_to]))),
+        shape=(n_pipes, n_nodes),
+    )
+    free = np.flatnonzero(~fixed)
+    A12 = A[:, free].tocsc()
+    A21 = A12.T.tocsr()
+
+    # Piyezometrik basınç H = P + rho g z; sabit düğümlerin katkısı
+    H0 = A[:, np.flatnonzero(fixed)] @ (fixed_p[fixed] + density * _G * elevation[fixed])
+    d_free = demand[free]
+
+    area = np.pi * diameter**2 / 4.0
+    Q = area * 1.0  # başlangıç: 1 m/s, tanımlı yönde
+    H = np.zeros(free.size)
+
+    history = []
+    converged = False
+    for it in range(1, max_iter + 1):
+        h, D = _pipe_losses(Q, area, density, viscosity, diameter, length, roughness, method)
+        D = np.maximum(D, 1e-12 * np.max(D))
+
+        F1 = h + A12 @ H + H0          # enerji denklemi artığı [Pa]
+        F2 = A21 @ Q - d_free          # süreklilik artığı [m^3/s]
+        Dinv = 1.0 / D
+
+        S = (A21 @ sp.diags(Dinv) @ A12).tocsc()
+        dH = sparse_linalg.spsolve(S, F2 - A21 @ (Dinv * F1))
+        dQ = -Dinv * (F1 + A12 @ dH)
+        Q = Q + dQ
+        H = H + dH
+
+        max_dQ = float(np.max(np.abs(dQ))) if n_pipes else 0.0
+        history.append({
+            'iteration': it,
+            'max_dQ': max_dQ,
+            'max_energy_residual': float(np.max(np.abs(F1))) if n_pipes else 0.0,
+            'max_continuity_residual': float(np.max(np.abs(F2))) if free.size else 0.0,
+        })
+        if not np.all(np.isfinite(Q)):
+            break
+        if max_dQ <= tol * max(float(np.max(np.abs(Q))), 1e-12):
+            converged = True
+            break
+
+    H_all = np.empty(n_nodes)
+    H_all[fixed] = fixed_p[fixed] + density * _G * elevation[fixed]
+    H_all[free] = H
+    P = H_all - density * _G * elevation
+
+    v = Q / area
+    re, regime, _ = calculate_reynolds_array(density, np.abs(v), diameter, viscosity)
+    _, fd = _network_friction(np.maximum(np.abs(v), _V_MIN), density, viscosity, diameter, roughness, method)
+    dp = fd * (length / diameter) * (density * v**2) / 2
+
+    pipes_out = pd.DataFrame({
+        'pipe': pipes['pipe'].to_numpy(),
+        'from': pipes['from'].astype(str).to_numpy(),
+        'to': pipes['to'].astype(str).to_numpy(),
+        'Q': Q,
+        'v': v,
+        'Re': re,
+        'flow_type': [FLOW_TYPES[r] if r >= 0 else None for r in regime],
+        'fD': fd,
+        'dP': np.sign(Q) * dp,
+    })
+    nodes_out = pd.DataFrame({
+        'node': node_ids,
+        'demand': demand,
+        'elevation': elevation,
+        'pressure': P,
+        'fixed': fixed,
+    })
+    return {
+        'pipes': pipes_out,
+        'nodes': nodes_out,
+        'history': pd.DataFrame(history),
+        'converged': converged,
+        'iterations': len(history),
+    }
@@ -1,10 +1,5 @@
 import math
-from scipy.integrate import quad
-from pint import UnitRegistry
-
-# Birim sistemi
-ureg = UnitRegistry()
-Q_ = ureg.Quantity
+from src.calculators.unit_registry import Q_
 
 # Material library example (conductivity in W/m·K)
 MATERIAL_LIBRARY = {
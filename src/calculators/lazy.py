@@ -0,0 +1,46 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    """
+    İlk öznitelik erişiminde içe aktarılan modül vekili.
+
+    `pd = lazy_import("pandas")` gibi kullanılır; `pd.DataFrame` ilk kez
+    çağrıldığında pandas yüklenir, sonraki erişimler doğrudan modüle gider.
+    importlib.util.LazyLoader'ın aksine Python 3.11'de iş parçacığı güvenlidir
+    (Streamlit betikleri ayrı iş parçacıklarında çalışır).
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with self.__dict__["_lock"]:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = importlib.import_module(self.__dict__["_name"])
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "yüklendi" if self.__dict__["_module"] is not None else "yüklenmedi"
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Modülü ilk kullanımda içe aktaran bir vekil döndürür."""
+    return LazyModule(name)
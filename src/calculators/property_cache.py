@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from src.calculators.lazy import lazy_import
+
+thermo = lazy_import("thermo")
+
+# thermo.Chemical varsayılan durumu
+DEFAULT_T = 298.15
+DEFAULT_P = 101325.0
+
+
+class PropertyCache:
+    """
+    Saf bileşen Chemical nesneleri için süreç genelinde, sınırlı boyutlu LRU önbellek.
+
+    Anahtar (isim, T, P) üçlüsüdür; T ve P verilen toleranslara yuvarlanır ve
+    Chemical nesnesi yuvarlanmış durumda oluşturulur. Böylece aynı anahtar her
+    zaman aynı sonucu verir. Streamlit'in iş parçacıklarından güvenle
+    kullanılabilir.
+
+    Not: Dönen nesneler paylaşılır; çağıran taraf `calculate(T, P)` gibi
+    durum değiştiren metodları çağırmamalıdır.
+    """
+
+    def __init__(self, maxsize: int = 512, T_tol: float = 0.01, P_tol: float = 1.0):
+        if maxsize <= 0:
+            raise ValueError("Önbellek boyutu sıfırdan büyük olmalıdır.")
+        if T_tol <= 0 or P_tol <= 0:
+            raise ValueError("Toleranslar sıfırdan büyük olmalıdır.")
+        self.maxsize = maxsize
+        self.T_tol = T_tol
+        self.P_tol = P_tol
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _quantize(self, T, P):
+        T = DEFAULT_T if T is None else float(T)
+        P = DEFAULT_P if P is None else float(P)
+        T_q = round(T / self.T_tol) * self.T_tol
+        P_q = round(P / self.P_tol) * self.P_tol
+        return T_q, P_q
+
+    def _key(self, name: str, T_q: float, P_q: float):
+        # Yuvarlama kayan nokta gürültüsü üretmesin diye tamsayı adım indeksleri kullanılır
+        return (name.strip().lower(), round(T_q / self.T_tol), round(P_q / self.P_tol))
+
+    def get(self, name: str, T: float | None = None, P: float | None = None) -> thermo.Chemical:
+        """(name, T, P) için Chemical nesnesini önbellekten döndürür veya oluşturur."""
+        T_q, P_q = self._quantize(T, P)
+        key = self._key(name, T_q, P_q)
+
+        with self._lock:
+            chem = self._data.get(key)
+            if chem is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return chem
+            self.misses += 1
+
+        # Oluşturma kilit dışında yapılır (ilk yükleme saniyeler sürebilir)
+        chem = thermo.Chemical(name, T=T_q, P=P_q)
+
+        with self._lock:
+            existing = self._data.get(key)
+            if existing is not None:
+                self._data.move_to_end(key)
+                return existing
+            self._data[key] = chem
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return chem
+
+    def configure(self, maxsize: int | None = None, T_tol: float | None = None, P_tol: float | None = None):
+        """Boyut ve toleransları değiştirir. Tolerans değişirse önbellek boşaltılır."""
+        with self._lock:
+            if maxsize is not None:
+                if maxsize <= 0:
+                    raise ValueError("Önbellek boyutu sıfırdan büyük olmalıdır.")
+                self.maxsize = maxsize
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+            if T_tol is not None or P_tol is not None:
+                if (T_tol is not None and T_tol <= 0) or (P_tol is not None and P_tol <= 0):
+                    raise ValueError("Toleranslar sıfırdan büyük olmalıdır.")
+                self.T_tol = T_tol or self.T_tol
+                self.P_tol = P_tol or self.P_tol
+                self._data.clear()
+
+    def clear(self):
+        """Önbelleği ve sayaçları sıfırlar."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """İsabet/ıska/çıkarma sayaçları ve mevcut boyut."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+# Süreç genelinde tek önbellek
+_cache = PropertyCache()
+
+
+def get_chemical(name: str, T: float | None = None, P: float | None = None) -> thermo.Chemical:
+    """Paylaşılan önbellek üzerinden Chemical nesnesi döndürür."""
+    return _cache.get(name, T, P)
+
+
+def configure_property_cache(maxsize: int | None = None, T_tol: float | None = None, P_tol: float | None = None):
+    """Paylaşılan önbelleğin boyut ve toleranslarını ayarlar."""
+    _cache.configure(maxsize, T_tol, P_tol)
+
+
+def property_cache_stats() -> dict:
+    """Paylaşılan önbelleğin istatistiklerini döndürür."""
+    return _cache.stats()
+
+
+def clear_property_cache():
+    """Paylaşılan önbelleği boşaltır."""
+    _cache.clear()
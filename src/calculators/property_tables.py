@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import numpy as np
+from src.calculators.lazy import lazy_import
+
+interpolate = lazy_import("scipy.interpolate")
+thermo = lazy_import("thermo")
+
+# Tablo dosya biçimi değişirse artırılır (eski dosyalar yeniden üretilir)
+TABLE_VERSION = 1
+
+# Izgara nokta sayısı (sıvı aralığı boyunca eşit aralıklı)
+N_GRID = 256
+
+# Tabloların saklandığı dizin (CHEMCALC_TABLE_DIR ile değiştirilebilir)
+TABLE_DIR = os.environ.get(
+    "CHEMCALC_TABLE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "chemcalc", "tables"),
+)
+
+
+class ComponentTable:
+    """
+    Bir saf bileşen için Psat(T), H_sıvı(T) ve H_buhar(T) tablosu.
+
+    Değerler bileşenin sıvı aralığında (Tm .. 0.9 Tc) yoğun bir ızgarada
+    thermo ile bir kez hesaplanır ve kübik spline ile interpole edilir
+    (Psat için ln(Psat) interpole edilir). Tablo kurulurken ızgara ara
+    noktalarında thermo ile karşılaştırma yapılır; bulunan en büyük hata
+    `errors` sözlüğünde saklanır (Psat: bağıl, H: J/kg mutlak). N_GRID=256
+    için tipik değerler Psat'ta 1e-5'ten, entalpide 1 J/kg'dan küçüktür.
+
+    Entalpiler get_phase_enthalpy ile aynı tanımı kullanır: thermo Chemical.H
+    (J/kg), sıvı için P = 1.01*Psat, buhar için P = 0.99*Psat.
+    """
+
+    def __init__(self, name: str, T: np.ndarray, ln_psat: np.ndarray, HL: np.ndarray, HV: np.ndarray, errors: dict):
+        self.name = name
+        self.T = T
+        self.ln_psat_grid = ln_psat
+        self.HL_grid = HL
+        self.HV_grid = HV
+        self.errors = errors
+
+        self._ln_psat = interpolate.CubicSpline(T, ln_psat)
+        self._dln_psat = self._ln_psat.derivative()
+        self._HL = interpolate.CubicSpline(T, HL)
+        self._HV = interpolate.CubicSpline(T, HV)
+
+    @property
+    def T_min(self) -> float:
+        return float(self.T[0])
+
+    @property
+    def T_max(self) -> float:
+        return float(self.T[-1])
+
+    def ln_psat(self, T):
+        return self._ln_psat(T)
+
+    def psat(self, T):
+        return np.exp(self._ln_psat(T))
+
+    def dln_psat_dT(self, T):
+        return self._dln_psat(T)
+
+    def H_liquid(self, T):
+        return self._HL(T)
+
+    def H_vapor(self, T):
+        return self._HV(T)
+
+    def enthalpy(self, T, phase: str):
+        """Faz entalpisi (J/kg); phase 'l' veya 'v'."""
+        if phase == 'l':
+            return self._HL(T)
+        if phase == 'v':
+            return self._HV(T)
+        raise ValueError("Faz 'l' veya 'v' olmalıdır.")
+
+    def Tsat(self, P):
+        """Verilen basınç(lar) için doyma sıcaklığı (K)."""
+        lnP = np.log(P)
+        if np.any(lnP < self.ln_psat_grid[0]) or np.any(lnP > self.ln_psat_grid[-1]):
+            raise ValueError(f"{self.name} için basınç tablo aralığı dışında.")
+        # ln(Psat) monoton artan: doğrusal ters interpolasyon + Newton düzeltmesi
+        T = np.interp(lnP, self.ln_psat_grid, self.T)
+        for _ in range(4):
+            T = T - (self._ln_psat(T) - lnP) / self._dln_psat(T)
+        return T
+
+    def save(self, path: str):
+        """Tabloyu npz olarak kaydeder (geçici dosya + atomik yer değiştirme)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmp_path,
+            version=TABLE_VERSION,
+            thermo_version=thermo.__version__,
+            name=self.name,
+            T=self.T,
+            ln_psat=self.ln_psat_grid,
+            HL=self.HL_grid,
+            HV=self.HV_grid,
+            err_psat_rel=self.errors['psat_rel'],
+            err_HL_abs=self.errors['HL_abs'],
+            err_HV_abs=self.errors['HV_abs'],
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ComponentTable":
+        """npz dosyasından tablo yükler; sürüm uyuşmazsa ValueError."""
+        with np.load(path) as data:
+            if int(data['version']) != TABLE_VERSION or str(data['thermo_version']) != thermo.__version__:
+                raise ValueError("Tablo sürümü uyumsuz.")
+            errors = {
+                'psat_rel': float(data['err_psat_rel']),
+                'HL_abs': float(data['err_HL_abs']),
+                'HV_abs': float(data['err_HV_abs']),
+            }
+            return cls(str(data['name']), data['T'], data['ln_psat'], data['HL'], data['HV'], errors)
+
+
+def _thermo_state(chem: thermo.Chemical, T: float):
+    """Tek sıcaklıkta (Psat, H_sıvı, H_buhar); hesaplanamayanlar NaN."""
+    try:
+        Psat = chem.VaporPressure(T)
+        chem.calculate(T, Psat * 1.01 if Psat else 101325)
+        HL = chem.H
+        chem.calculate(T, Psat * 0.99 if Psat else 1000)
+        HV = chem.H
+    except Exception:
+        return np.nan, np.nan, np.nan
+    return (
+        Psat if Psat else np.nan,
+        HL if HL is not None else np.nan,
+        HV if HV is not None else np.nan,
+    )
+
+
+def build_component_table(name: str, n_points: int = N_GRID) -> ComponentTable:
+    """
+    Bileşen tablosunu thermo ile sıfırdan hesaplar.
+
+    Durum değiştiren calculate() çağrıları yapıldığından paylaşılan önbellek
+    yerine bu fonksiyona özel bir Chemical nesnesi kullanılır.
+    """
+    chem = thermo.Chemical(name)
+    vp = chem.VaporPressure
+    if not chem.Tc:
+        raise ValueError(f"{name} için kritik sıcaklık bulunamadı.")
+
+    T_lo = max(chem.Tm or 0.0, vp.Tmin or 0.0) + 1.0
+    T_hi = min(0.9 * chem.Tc, vp.Tmax or chem.Tc)
+    if T_hi - T_lo < 10.0:
+        raise ValueError(f"{name} için sıvı aralığı tablo oluşturmak için çok dar.")
+
+    T = np.linspace(T_lo, T_hi, n_points)
+    values = np.array([_thermo_state(chem, t) for t in T])
+    mask = np.all(np.isfinite(values), axis=1) & (values[:, 0] > 0)
+    if mask.sum() < 4:
+        raise ValueError(f"{name} için tablo verisi hesaplanamadı.")
+    T, values = T[mask], values[mask]
+
+    table = ComponentTable(name, T, np.log(values[:, 0]), values[:, 1], values[:, 2], errors={})
+
+    # Hata sınırı: ızgara ara noktalarında thermo ile karşılaştırma
+    T_mid = 0.5 * (T[1:] + T[:-1])
+    ref = np.array([_thermo_state(chem, t) for t in T_mid])
+    ok = np.all(np.isfinite(ref), axis=1) & (ref[:, 0] > 0)
+    T_mid, ref = T_mid[ok], ref[ok]
+    table.errors = {
+        'psat_rel': float(np.max(np.abs(table.psat(T_mid) / ref[:, 0] - 1.0))) if len(ref) else np.nan,
+        'HL_abs': float(np.max(np.abs(table.H_liquid(T_mid) - ref[:, 1]))) if len(ref) else np.nan,
+        'HV_abs': float(np.max(np.abs(table.H_vapor(T_mid) - ref[:, 2]))) if len(ref) else np.nan,
+    }
+    return table
+
+
+def table_path(name: str, table_dir: str | None = None) -> str:
+    """Bileşen tablosunun dosya yolu."""
+    safe = re.sub(r"[^a-z0-9]+", "_", name.strip().lower()).strip("_")
+    return os.path.join(table_dir or TABLE_DIR, f"{safe}.npz")
+
+
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def get_component_table(name: str) -> ComponentTable:
+    """
+    Bileşen tablosunu döndürür: önce bellek, sonra disk (npz), en son
+    thermo ile hesaplayıp diske yazar.
+    """
+    key = name.strip().lower()
+    with _tables_lock:
+        table = _tables.get(key)
+    if table is not None:
+        return table
+
+    path = table_path(name)
+    try:
+        table = ComponentTable.load(path)
+    except Exception:
+        table = build_component_table(name)
+        try:
+            table.save(path)
+        except OSError:
+            # Salt okunur dosya sistemi: tablo yalnızca bellekte tutulur
+            pass
+
+    with _tables_lock:
+        return _tables.setdefault(key, table)
+
+
+def clear_component_tables():
+    """Bellekteki tabloları boşaltır (disk dosyalarına dokunmaz)."""
+    with _tables_lock:
+        _tables.clear()
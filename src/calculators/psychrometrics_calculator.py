@@ -1,6 +1,15 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
-from pyfluids import HumidAir, InputHumidAir
+from PIL import Image, ImageDraw
+from src.calculators.lazy import lazy_import
+
+pd = lazy_import("pandas")
+plt = lazy_import("matplotlib.pyplot")
+pyfluids = lazy_import("pyfluids")
 
 
 def calculate_psychrometric_properties(T_db_C, P_Pa, rh_percent=None, T_wb_C=None):
@@ -20,15 +29,15 @@ def calculate_psychrometric_properties(T_db_C, P_Pa, rh_percent=None, T_wb_C=Non
         return {"Hata": "Basınç sıfırdan büyük olmalıdır."}
     
     inputs = [
-        InputHumidAir.pressure(P_Pa),
-        InputHumidAir.temperature(T_db_C)
+        pyfluids.InputHumidAir.pressure(P_Pa),
+        pyfluids.InputHumidAir.temperature(T_db_C)
     ]
     
     if rh_percent is not None:
         if not (0 <= rh_percent <= 100):
              return {"Hata": "Bağıl nem %0 ile %100 arasında olmalıdır."}
         # PyFluids (CoolProp) RH'yi yüzde (0-100) olarak bekler
-        inputs.append(InputHumidAir.relative_humidity(rh_percent))
+        inputs.append(pyfluids.InputHumidAir.relative_humidity(rh_percent))
     elif T_wb_C is not None:
         # Tolerans kontrolü: T_wb, T_db'den çok az büyükse (ölçüm hatası vs.), eşit kabul et.
         if T_wb_C > T_db_C:
@@ -36,12 +45,12 @@ def calculate_psychrometric_properties(T_db_C, P_Pa, rh_percent=None, T_wb_C=Non
                 T_wb_C = T_db_C
             else:
                 return {"Hata": "Yaş termometre sıcaklığı, kuru termometre sıcaklığından büyük olamaz."}
-        inputs.append(InputHumidAir.wet_bulb_temperature(T_wb_C))
+        inputs.append(pyfluids.InputHumidAir.wet_bulb_temperature(T_wb_C))
     else:
         return {"Hata": "RH (%) veya yaş termometre sıcaklığı belirtilmeli."}
 
     try:
-        ha = HumidAir().with_state(*inputs)
+        ha = pyfluids.HumidAir().with_state(*inputs)
         
         props = {
             "T_db (°C)": T_db_C,
@@ -58,15 +67,223 @@ def calculate_psychrometric_properties(T_db_C, P_Pa, rh_percent=None, T_wb_C=Non
         return {"Hata": f"Hesaplama hatası: {str(e)}"}
 
 
-def generate_psychrometric_chart(P_Pa, T_min=0, T_max=50, RH_lines=None):
+# ---------------- Vektörel Psikrometrik Bağıntılar ----------------
+# ASHRAE Handbook Fundamentals (Hyland-Wexler) bağıntıları; tüm fonksiyonlar
+# NumPy dizileri ile çalışır. Entalpi ve özgül hacim kuru hava başınadır.
+# pyfluids ile karşılaştırma (-20..60 °C, 80-150 kPa, %10-100 RH):
+# w'de bağıl hata < %0.25, h'de < 0.5 kJ/kg, v'de < %0.15.
+
+# M_su / M_kuru_hava
+_EPSILON_W = 0.621945
+# Kuru hava gaz sabiti [kJ/(kg K)]
+_R_DA = 0.287042
+
+
+def saturation_pressure(T_C):
     """
-    Psikrometrik diyagram oluşturur: doyma eğrisi ve iso-RH çizgileri.
+    Doymuş su buharı basıncı [Pa] (Hyland-Wexler); 0 °C altında buz üzerinde.
+    """
+    T = np.asarray(T_C, dtype=float) + 273.15
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ln_ice = (-5.6745359e3 / T + 6.3925247 - 9.6778430e-3 * T + 6.2215701e-7 * T**2
+                  + 2.0747825e-9 * T**3 - 9.4840240e-13 * T**4 + 4.1635019 * np.log(T))
+        ln_water = (-5.8002206e3 / T + 1.3914993 - 4.8640239e-2 * T + 4.1764768e-5 * T**2
+                    - 1.4452093e-8 * T**3 + 6.5459673 * np.log(T))
+    return np.exp(np.where(T < 273.15, ln_ice, ln_water))
 
-    P_Pa: basınç (Pa)
-    T_min, T_max: DBT aralığı (°C)
-    RH_lines: çizilecek bağıl nem yüzdeleri listesi (örn. [10,30,50,70,90])
 
-    Dönen: matplotlib.figure.Figure
+def enhancement_factor(T_C, P_Pa):
+    """Nemli havada buhar basıncı artış faktörü f (Buck, 1981)."""
+    T_C = np.asarray(T_C, dtype=float)
+    P_Pa = np.asarray(P_Pa, dtype=float)
+    return np.where(T_C < 0, 1.0003 + 4.18e-8 * P_Pa, 1.0007 + 3.46e-8 * P_Pa)
+
+
+def humidity_ratio(T_C, rh_percent, P_Pa):
+    """
+    Nem oranı w [kg su/kg kuru hava]: w = 0.621945·φ·Ps/(P − φ·Ps),
+    Ps = f·Psat (artış faktörü dahil).
+    """
+    Ps = enhancement_factor(T_C, P_Pa) * saturation_pressure(T_C)
+    pw = np.asarray(rh_percent, dtype=float) / 100.0 * Ps
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _EPSILON_W * pw / (P_Pa - pw)
+
+
+def moist_air_enthalpy(T_C, w):
+    """Nemli hava entalpisi [kJ/kg kuru hava]."""
+    T_C = np.asarray(T_C, dtype=float)
+    return 1.006 * T_C + np.asarray(w, dtype=float) * (2501.0 + 1.86 * T_C)
+
+
+def moist_air_volume(T_C, w, P_Pa):
+    """Nemli hava özgül hacmi [m³/kg kuru hava]."""
+    T_C = np.asarray(T_C, dtype=float)
+    return _R_DA * (T_C + 273.15) * (1.0 + 1.607858 * np.asarray(w, dtype=float)) / (np.asarray(P_Pa, dtype=float) / 1000.0)
+
+
+def humidity_ratio_from_enthalpy(T_C, h_kJ):
+    """Verilen entalpi [kJ/kg kuru hava] için w (iso-entalpi çizgileri)."""
+    T_C = np.asarray(T_C, dtype=float)
+    return (np.asarray(h_kJ, dtype=float) - 1.006 * T_C) / (2501.0 + 1.86 * T_C)
+
+
+def humidity_ratio_from_volume(T_C, v, P_Pa):
+    """Verilen özgül hacim [m³/kg kuru hava] için w (iso-hacim çizgileri)."""
+    T_C = np.asarray(T_C, dtype=float)
+    return (np.asarray(v, dtype=float) * (np.asarray(P_Pa, dtype=float) / 1000.0) / (_R_DA * (T_C + 273.15)) - 1.0) / 1.607858
+
+
+def humidity_ratio_from_wet_bulb(T_db_C, T_wb_C, P_Pa):
+    """
+    Kuru ve yaş termometre sıcaklıklarından w (ASHRAE, termodinamik yaş termometre).
+    T_wb < 0 °C için buz yüzeyi bağıntısı kullanılır.
+    """
+    T_db = np.asarray(T_db_C, dtype=float)
+    T_wb = np.asarray(T_wb_C, dtype=float)
+    ws = humidity_ratio(T_wb, 100.0, P_Pa)
+    water = ((2501.0 - 2.326 * T_wb) * ws - 1.006 * (T_db - T_wb)) / (2501.0 + 1.86 * T_db - 4.186 * T_wb)
+    ice = ((2830.0 - 0.24 * T_wb) * ws - 1.006 * (T_db - T_wb)) / (2830.0 + 1.86 * T_db - 2.1 * T_wb)
+    return np.where(T_wb < 0, ice, water)
+
+
+def relative_humidity(T_C, w, P_Pa):
+    """Nem oranından bağıl nem [%] (humidity_ratio'nun tersi)."""
+    w = np.asarray(w, dtype=float)
+    pw = np.asarray(P_Pa, dtype=float) * w / (_EPSILON_W + w)
+    return 100.0 * pw / (enhancement_factor(T_C, P_Pa) * saturation_pressure(T_C))
+
+
+def dew_point(w, P_Pa):
+    """
+    Nem oranından çiğ noktası [°C]: f·Psat(T_dp) = p_w denkleminin Newton
+    çözümü (Magnus başlangıç tahmini). w = 0 için NaN.
+    """
+    w = np.asarray(w, dtype=float)
+    P_Pa = np.asarray(P_Pa, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ln_pw = np.log(P_Pa * w / (_EPSILON_W + w))
+        a = ln_pw - np.log(610.94)
+        T = 243.04 * a / (17.625 - a)
+        for _ in range(5):
+            f_T = np.log(enhancement_factor(T, P_Pa) * saturation_pressure(T)) - ln_pw
+            dT = 1e-3
+            df = (np.log(saturation_pressure(T + dT)) - np.log(saturation_pressure(T - dT))) / (2 * dT)
+            T = T - f_T / df
+    return np.where(w > 0, T, np.nan)
+
+
+def _dln_saturation_pressure_dT(T_C):
+    """d ln(Psat)/dT [1/K] (Hyland-Wexler bağıntısının türevi)."""
+    T = np.asarray(T_C, dtype=float) + 273.15
+    d_ice = (5.6745359e3 / T**2 - 9.6778430e-3 + 2 * 6.2215701e-7 * T + 3 * 2.0747825e-9 * T**2
+             - 4 * 9.4840240e-13 * T**3 + 4.1635019 / T)
+    d_water = (5.8002206e3 / T**2 - 4.8640239e-2 + 2 * 4.1764768e-5 * T - 3 * 1.4452093e-8 * T**2
+               + 6.5459673 / T)
+    return np.where(T < 273.15, d_ice, d_water)
+
+
+def _wet_bulb_residual(T_db, T_wb, w, P_Pa):
+    """g(T_wb) = w(T_db, T_wb) - w ve dg/dT_wb (humidity_ratio_from_wet_bulb ile aynı bağıntı)."""
+    pw = enhancement_factor(T_wb, P_Pa) * saturation_pressure(T_wb)
+    ws = _EPSILON_W * pw / (P_Pa - pw)
+    dws = _EPSILON_W * P_Pa / (P_Pa - pw)**2 * pw * _dln_saturation_pressure_dT(T_wb)
+
+    ice = T_wb < 0
+    A = np.where(ice, 2830.0, 2501.0)
+    a = np.where(ice, 0.24, 2.326)
+    c = np.where(ice, 2.1, 4.186)
+    N = (A - a * T_wb) * ws - 1.006 * (T_db - T_wb)
+    D = A + 1.86 * T_db - c * T_wb
+    dN = -a * ws + (A - a * T_wb) * dws + 1.006
+    return N / D - w, (dN * D + c * N) / D**2
+
+
+def wet_bulb_temperature(T_db_C, P_Pa, rh_percent=None, w=None, tol: float = 1e-12, max_iter: int = 20):
+    """
+    Yaş termometre sıcaklığı [°C]; bağıl nem [%] veya nem oranı w verilir.
+    humidity_ratio_from_wet_bulb'un tersi, tüm dizi için aynı anda çözülür.
+
+    Köşeli (bracketed) Newton: [T_db - 100, T_db] aralığı her adımda daraltılır;
+    Newton adımı aralık dışına düşerse ikiye bölme yapılır. Başlangıç tahmini
+    Stull (2011) bağıntısıdır. Sabit iterasyon bütçesi sonunda |w artığı| <= tol
+    olan elemanlar yakınsamış sayılır.
+
+    Dönen: (T_wb, converged) dizileri; yakınsamayan elemanlarda T_wb NaN.
+    """
+    T_db = np.asarray(T_db_C, dtype=float)
+    P_Pa = np.asarray(P_Pa, dtype=float)
+    if w is None:
+        if rh_percent is None:
+            raise ValueError("RH (%) veya nem oranı (w) belirtilmeli.")
+        rh = np.asarray(rh_percent, dtype=float)
+        w = humidity_ratio(T_db, rh, P_Pa)
+    else:
+        w = np.asarray(w, dtype=float)
+        rh = relative_humidity(T_db, w, P_Pa)
+    T_db, P_Pa, w, rh = np.broadcast_arrays(T_db, P_Pa, w, rh)
+    shape = T_db.shape
+    T_db, P_Pa, w, rh = (np.ravel(a).astype(float) for a in (T_db, P_Pa, w, rh))
+
+    lo = T_db - 100.0
+    hi = T_db.copy()
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        # Buz/su bağıntısı 0 °C'de süreksizdir; buz tarafında kök varsa o seçilir (pyfluids ile uyumlu)
+        g_ice, _ = _wet_bulb_residual(T_db, np.full(T_db.shape, -1e-9), w, P_Pa)
+        hi = np.where((g_ice > 0) & (hi > 0), -1e-9, hi)
+
+        rh_c = np.clip(rh, 1.0, 100.0)
+        T = (T_db * np.arctan(0.151977 * np.sqrt(rh_c + 8.313659)) + np.arctan(T_db + rh_c)
+             - np.arctan(rh_c - 1.676331) + 0.00391838 * rh_c**1.5 * np.arctan(0.023101 * rh_c) - 4.686035)
+        # Tahmin aralık dışındaysa üst sınırdan başlanır (g dışbükey: sağdan Newton monoton yakınsar)
+        T = np.where(np.isfinite(T) & (T > lo) & (T <= hi), T, hi)
+
+        converged = np.zeros(T.shape, dtype=bool)
+        active = np.flatnonzero(np.isfinite(T) & np.isfinite(w))
+        for _ in range(max_iter):
+            g, dg = _wet_bulb_residual(T_db[active], T[active], w[active], P_Pa[active])
+            done = np.abs(g) <= tol
+            converged[active[done]] = True
+            keep = ~done
+            active, g, dg = active[keep], g[keep], dg[keep]
+            if active.size == 0:
+                break
+
+            # g, T_wb ile artar: aralık işaretine göre daraltılır
+            t, l, h = T[active], lo[active], hi[active]
+            h = np.where(g > 0, t, h)
+            l = np.where(g > 0, l, t)
+            t_new = t - g / dg
+            bad = ~np.isfinite(t_new) | (t_new <= l) | (t_new > h)
+            T[active] = np.where(bad, 0.5 * (l + h), t_new)
+            lo[active], hi[active] = l, h
+
+    T = T.reshape(shape)
+    converged = converged.reshape(shape)
+    return np.where(converged, T, np.nan), converged
+
+
+def _clip_lines(T: np.ndarray, w: np.ndarray, w_max: np.ndarray):
+    """
+    (çizgi x nokta) w matrisinde doyma eğrisi ile w=0 arasında kalan noktaları
+    seçer; dönen: (çizgi indeksi, T, w) düz dizileri.
+    """
+    mask = np.isfinite(w) & (w >= 0) & (w <= w_max * (1 + 1e-9))
+    line_idx, point_idx = np.nonzero(mask)
+    return line_idx, T[point_idx], w[mask]
+
+
+def psychrometric_chart_data(P_Pa, T_min=0, T_max=50, RH_lines=None, h_lines=None,
+                             wb_lines=None, v_lines=None, n_points: int = 400) -> pd.DataFrame:
+    """
+    Psikrometrik diyagram çizgilerini vektörel olarak hesaplar.
+
+    RH_lines: bağıl nem yüzdeleri (doyma eğrisi RH=100 her zaman eklenir)
+    h_lines: entalpi [kJ/kg kuru hava], wb_lines: yaş termometre [°C],
+    v_lines: özgül hacim [m³/kg kuru hava] değerleri (isteğe bağlı)
+
+    Dönen: uzun tablo (family, value, T [°C], w [kg/kg]); family 'RH', 'h',
+    'T_wb' veya 'v'. Çizgiler doyma eğrisi ile w=0 arasında kırpılır.
     """
     if P_Pa <= 0:
         raise ValueError("Basınç sıfırdan büyük olmalıdır.")
@@ -76,37 +293,73 @@ def generate_psychrometric_chart(P_Pa, T_min=0, T_max=50, RH_lines=None):
     if RH_lines is None:
         RH_lines = [10, 30, 50, 70, 90]
 
-    # DBT ekseni
-    Tdb = np.linspace(T_min, T_max, 50) # Performans için nokta sayısını 50'ye düşürdük
-    
+    T = np.linspace(T_min, T_max, n_points)
+    w_sat = humidity_ratio(T, 100.0, P_Pa)
+
+    # Her aile için (değerler, w matrisi, üst sınır); RH çizgileri doyma ile kırpılmaz
+    rh = np.array(sorted(set(list(RH_lines) + [100])), dtype=float)
+    families = [('RH', rh, humidity_ratio(T[None, :], rh[:, None], P_Pa), np.inf)]
+
+    if h_lines is not None and len(h_lines):
+        h = np.asarray(h_lines, dtype=float)
+        families.append(('h', h, humidity_ratio_from_enthalpy(T[None, :], h[:, None]), w_sat))
+
+    if wb_lines is not None and len(wb_lines):
+        wb = np.asarray(wb_lines, dtype=float)
+        w_wb = humidity_ratio_from_wet_bulb(T[None, :], wb[:, None], P_Pa)
+        # Yaş termometre çizgisi T_db >= T_wb bölgesinde tanımlıdır
+        families.append(('T_wb', wb, np.where(T[None, :] >= wb[:, None], w_wb, np.nan), w_sat))
+
+    if v_lines is not None and len(v_lines):
+        v = np.asarray(v_lines, dtype=float)
+        families.append(('v', v, humidity_ratio_from_volume(T[None, :], v[:, None], P_Pa), w_sat))
+
+    cols = {'family': [], 'value': [], 'T': [], 'w': []}
+    for family, values, w, w_max in families:
+        line_idx, T_pts, w_pts = _clip_lines(T, w, w_max)
+        cols['family'].append(np.full(line_idx.size, family, dtype=object))
+        cols['value'].append(values[line_idx])
+        cols['T'].append(T_pts)
+        cols['w'].append(w_pts)
+    return pd.DataFrame({k: np.concatenate(v) for k, v in cols.items()})
+
+
+def generate_psychrometric_chart(P_Pa, T_min=0, T_max=50, RH_lines=None, h_lines=None,
+                                 wb_lines=None, v_lines=None, n_points: int = 400):
+    """
+    Psikrometrik diyagram oluşturur: doyma eğrisi ve iso-RH çizgileri;
+    isteğe bağlı iso-entalpi, yaş termometre ve özgül hacim çizgileri.
+
+    P_Pa: basınç (Pa)
+    T_min, T_max: DBT aralığı (°C)
+    RH_lines: çizilecek bağıl nem yüzdeleri listesi (örn. [10,30,50,70,90])
+    h_lines, wb_lines, v_lines: bkz. psychrometric_chart_data
+
+    Dönen: matplotlib.figure.Figure
+    """
+    data = psychrometric_chart_data(P_Pa, T_min, T_max, RH_lines, h_lines, wb_lines, v_lines, n_points)
+
     fig, ax = plt.subplots(figsize=(8, 6))
-    
-    # Her bir RH çizgisi için w değerlerini hesapla
-    # RH=100 (Doygunluk) dahil
-    all_lines = sorted(list(set(RH_lines + [100])))
-    
-    for rh in all_lines:
-        w_vals = []
-        valid_T = []
-        for T in Tdb:
-            try:
-                ha = HumidAir().with_state(
-                    InputHumidAir.pressure(P_Pa),
-                    InputHumidAir.temperature(T),
-                    InputHumidAir.relative_humidity(rh) # Yüzde olarak gönderilmeli
-                )
-                w_vals.append(ha.humidity)
-                valid_T.append(T)
-            except:
-                # Hesaplama hatası olursa (örn. aşırı sıcaklık/basınç) bu noktayı atla
-                continue
-        
-        if not valid_T:
+
+    styles = {
+        'h': dict(color='tab:red', linestyle=':', linewidth=0.8),
+        'T_wb': dict(color='tab:green', linestyle='-.', linewidth=0.8),
+        'v': dict(color='tab:purple', linestyle=':', linewidth=0.8),
+    }
+    labels = {'h': 'h = {:g} kJ/kg', 'T_wb': 'T_wb = {:g} °C', 'v': 'v = {:g} m³/kg'}
+
+    for (family, value), line in data.groupby(['family', 'value'], sort=False):
+        if line.empty:
             continue
-            
-        style = 'k-' if rh == 100 else '--'
-        label = f'RH {rh}%' + (' (Doygun)' if rh == 100 else '')
-        ax.plot(valid_T, w_vals, style, label=label)
+        if family == 'RH':
+            style = 'k-' if value == 100 else '--'
+            label = f'RH {value:g}%' + (' (Doygun)' if value == 100 else '')
+            ax.plot(line['T'], line['w'], style, label=label)
+        else:
+            ax.plot(line['T'], line['w'], **styles[family])
+            # Çizgi etiketi düşük sıcaklık ucuna yazılır
+            ax.annotate(labels[family].format(value), (line['T'].iloc[0], line['w'].iloc[0]),
+                        fontsize=6, color=styles[family]['color'])
 
     ax.set_xlabel('Kuru Termometre Sıcaklığı (°C)')
     ax.set_ylabel('Nem Oranı w (kg su/kg kuru hava)')
@@ -114,4 +367,262 @@ def generate_psychrometric_chart(P_Pa, T_min=0, T_max=50, RH_lines=None):
     ax.legend(loc='best', fontsize='small')
     ax.grid(True, alpha=0.3)
 
-    return fig
\ No newline at end of file
+    return fig
+
+
+# ---------------- Önbellekli Diyagram Arka Planı ----------------
+
+class ChartBackground:
+    """
+    Psikrometrik diyagramın PNG olarak rasterlenmiş arka planı.
+
+    Arka plan çizgileri yalnızca (P, T aralığı, çizgi kümeleri) ile belirlenir;
+    bir kez çizilip saklanır. Durum noktası ve proses çizgileri render() ile
+    PNG üzerine piksel olarak eklenir (matplotlib yeniden çalıştırılmaz).
+    Eksenler doğrusal olduğundan veri -> piksel dönüşümü afin tutulur.
+    """
+
+    def __init__(self, png: bytes, x_scale: tuple, y_scale: tuple):
+        self.png = png
+        self._image = Image.open(io.BytesIO(png)).convert("RGB")
+        self._x_scale = x_scale  # (a, b): px = a + b*T
+        self._y_scale = y_scale  # (a, b): py = a + b*w
+
+    def to_pixel(self, T_C, w):
+        """(T [°C], w) -> (x, y) piksel koordinatı (y aşağı doğru)."""
+        return (self._x_scale[0] + self._x_scale[1] * T_C,
+                self._y_scale[0] + self._y_scale[1] * w)
+
+    def render(self, points=None, process_lines=None, color=(214, 39, 40), radius: int = 6) -> bytes:
+        """
+        Arka planın üzerine durum noktalarını [(T, w), ...] ve proses
+        çizgilerini [[(T, w), (T, w), ...], ...] çizip PNG döndürür.
+        """
+        if not points and not process_lines:
+            return self.png
+
+        img = self._image.copy()
+        draw = ImageDraw.Draw(img)
+        for line in process_lines or []:
+            if len(line) >= 2:
+                draw.line([self.to_pixel(T, w) for T, w in line], fill=color, width=2)
+        for T, w in points or []:
+            x, y = self.to_pixel(T, w)
+            draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color, outline=(0, 0, 0))
+
+        buf = io.BytesIO()
+        # Hızlı sıkıştırma: sonuç her çalıştırmada yeniden üretilir
+        img.save(buf, format="PNG", compress_level=1)
+        return buf.getvalue()
+
+
+def build_chart_background(P_Pa, T_min=0, T_max=50, RH_lines=None, h_lines=None,
+                           wb_lines=None, v_lines=None, dpi: int = 100) -> ChartBackground:
+    """Diyagramı çizip PNG'ye rasterler ve veri -> piksel dönüşümünü kaydeder."""
+    fig = generate_psychrometric_chart(P_Pa, T_min, T_max, RH_lines, h_lines, wb_lines, v_lines)
+    try:
+        fig.set_dpi(dpi)
+        ax = fig.axes[0]
+        fig.canvas.draw()
+
+        # Eksen sınırlarının iki köşesinden afin dönüşüm (görüntü y'si aşağı doğru)
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        (px0, py0), (px1, py1) = ax.transData.transform([(x0, y0), (x1, y1)])
+        height = fig.canvas.get_width_height()[1]
+        bx = (px1 - px0) / (x1 - x0)
+        by = -(py1 - py0) / (y1 - y0)
+        x_scale = (px0 - bx * x0, bx)
+        y_scale = ((height - py0) - by * y0, by)
+
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi)
+        return ChartBackground(buf.getvalue(), x_scale, y_scale)
+    finally:
+        plt.close(fig)
+
+
+def _lines_key(lines):
+    return None if lines is None else tuple(round(float(v), 6) for v in lines)
+
+
+_backgrounds = OrderedDict()
+_backgrounds_lock = threading.Lock()
+_BACKGROUND_MAXSIZE = 32
+_background_stats = {"hits": 0, "misses": 0}
+
+
+def get_chart_background(P_Pa, T_min=0, T_max=50, RH_lines=None, h_lines=None,
+                         wb_lines=None, v_lines=None, dpi: int = 100) -> ChartBackground:
+    """
+    Arka planı (P, T aralığı, çizgi kümeleri, dpi) anahtarlı LRU önbellekten
+    döndürür; yoksa oluşturur. Basınç 1 Pa'ya yuvarlanır.
+    """
+    key = (
+        round(float(P_Pa)), float(T_min), float(T_max),
+        _lines_key(RH_lines), _lines_key(h_lines), _lines_key(wb_lines), _lines_key(v_lines), int(dpi),
+    )
+    with _backgrounds_lock:
+        bg = _backgrounds.get(key)
+        if bg is not None:
+            _backgrounds.move_to_end(key)
+            _background_stats["hits"] += 1
+            return bg
+        _background_stats["misses"] += 1
+
+    # matplotlib çizimi kilit dışında yapılır
+    bg = build_chart_background(P_Pa, T_min, T_max, RH_lines, h_lines, wb_lines, v_lines, dpi)
+
+    with _backgrounds_lock:
+        bg = _backgrounds.setdefault(key, bg)
+        _backgrounds.move_to_end(key)
+        while len(_backgrounds) > _BACKGROUND_MAXSIZE:
+            _backgrounds.popitem(last=False)
+    return bg
+
+
+def chart_background_stats() -> dict:
+    """Arka plan önbelleği isabet/ıska sayaçları ve boyutu."""
+    with _backgrounds_lock:
+        return {**_background_stats, "size": len(_backgrounds), "maxsize": _BACKGROUND_MAXSIZE}
+
+
+def clear_chart_backgrounds():
+    """Arka plan önbelleğini boşaltır."""
+    with _backgrounds_lock:
+        _backgrounds.clear()
+        _background_stats["hits"] = _background_stats["misses"] = 0
+
+
+# ---------------- Toplu (Log) Hesaplama ----------------
+
+# Çıktı sütunları calculate_psychrometric_properties anahtarlarıyla aynıdır
+BATCH_COLUMNS = [
+    "T_db (°C)", "P (Pa)", "RH (%)", "T_wb (°C)", "h (kJ/kg_dry)",
+    "w (kg_water/kg_dry)", "v (m³/kg_dry)", "T_dp (°C)",
+]
+
+# Varsayılan parça boyutu (satır)
+BATCH_CHUNKSIZE = 100_000
+
+
+def calculate_psychrometric_batch(df: pd.DataFrame, T_col: str = "T_db", rh_col: str | None = "RH",
+                                  twb_col: str | None = None, P_col: str | None = None,
+                                  P_Pa: float = 101325.0, keep_columns: bool = True) -> pd.DataFrame:
+    """
+    Çok sayıda durumu vektörel bağıntılarla hesaplar (BMS/HVAC logları).
+
+    df: T_col (°C) ve rh_col (%) veya twb_col (°C) sütunları; P_col (Pa)
+        verilmezse tüm satırlar için P_Pa kullanılır. Bir satırda RH boşsa
+        yaş termometre sütunu kullanılır.
+    Dönen: BATCH_COLUMNS + 'Hata' (geçersiz satırlarda mesaj, değerler NaN).
+    keep_columns=True ise giriş sütunları başa eklenir.
+
+    Entalpi ve özgül hacim kuru hava başınadır (ASHRAE bağıntıları).
+    """
+    n = len(df)
+    T_db = df[T_col].to_numpy(dtype=float)
+    P = df[P_col].to_numpy(dtype=float) if P_col else np.full(n, float(P_Pa))
+    rh = df[rh_col].to_numpy(dtype=float) if rh_col else np.full(n, np.nan)
+    T_wb_in = df[twb_col].to_numpy(dtype=float) if twb_col else np.full(n, np.nan)
+
+    use_rh = np.isfinite(rh)
+    use_wb = ~use_rh & np.isfinite(T_wb_in)
+    # Skaler fonksiyondaki gibi: T_wb, T_db'yi 0.1 dereceden az aşıyorsa T_db kabul edilir
+    T_wb_in = np.where(use_wb & (T_wb_in > T_db) & (T_wb_in - T_db < 0.1), T_db, T_wb_in)
+
+    error = np.full(n, None, dtype=object)
+    ok = np.ones(n, dtype=bool)
+    checks = [
+        (~np.isfinite(T_db), "Kuru termometre sıcaklığı eksik."),
+        (~(P > 0), "Basınç sıfırdan büyük olmalıdır."),
+        (~use_rh & ~use_wb, "RH (%) veya yaş termometre sıcaklığı belirtilmeli."),
+        (use_rh & ~((rh >= 0) & (rh <= 100)), "Bağıl nem %0 ile %100 arasında olmalıdır."),
+        (use_wb & (T_wb_in > T_db), "Yaş termometre sıcaklığı, kuru termometre sıcaklığından büyük olamaz."),
+    ]
+    for mask, message in reversed(checks):
+        error = np.where(mask, message, error)
+        ok &= ~mask
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        w = np.where(use_rh, humidity_ratio(T_db, rh, P), humidity_ratio_from_wet_bulb(T_db, T_wb_in, P))
+        w = np.where(ok & (w >= 0), w, np.nan)
+        rh_out = np.where(use_rh, rh, relative_humidity(T_db, w, P))
+        T_wb = np.where(use_wb, T_wb_in, wet_bulb_temperature(T_db, P, w=w)[0])
+        values = {
+            "T_db (°C)": T_db,
+            "P (Pa)": P,
+            "RH (%)": rh_out,
+            "T_wb (°C)": T_wb,
+            "h (kJ/kg_dry)": moist_air_enthalpy(T_db, w),
+            "w (kg_water/kg_dry)": w,
+            "v (m³/kg_dry)": moist_air_volume(T_db, w, P),
+            "T_dp (°C)": dew_point(w, P),
+        }
+
+    out = pd.DataFrame({k: np.where(ok, v, np.nan) for k, v in values.items()}, index=df.index)
+    out["Hata"] = error
+    if keep_columns:
+        out = pd.concat([df.drop(columns=[c for c in df.columns if c in out.columns]), out], axis=1)
+    return out
+
+
+def iter_psychrometric_batch(source, chunksize: int = BATCH_CHUNKSIZE, converter=None, **kwargs):
+    """
+    Girdiyi parça parça işleyen üreteç. source: DataFrame, CSV dosya yolu veya
+    dosya benzeri nesne. Hesap sırasındaki bellek kullanımı parça boyutuyla
+    sınırlıdır (kaynağın ve hedefin kendisi hariç).
+    converter: her parçaya hesaptan önce uygulanan fonksiyon (DataFrame ->
+    DataFrame), ör. sütunları °C / Pa'ya çevirmek için.
+    Diğer argümanlar calculate_psychrometric_batch'e iletilir.
+    """
+    if isinstance(source, pd.DataFrame):
+        chunks = (source.iloc[i:i + chunksize] for i in range(0, len(source), chunksize))
+    else:
+        chunks = pd.read_csv(source, chunksize=chunksize)
+    for chunk in chunks:
+        if converter is not None:
+            chunk = converter(chunk)
+        yield calculate_psychrometric_batch(chunk, **kwargs)
+
+
+def write_psychrometric_batch(source, dest, fmt: str = "csv", chunksize: int = BATCH_CHUNKSIZE,
+                              converter=None, **kwargs) -> int:
+    """
+    Toplu hesabı parça parça dest'e (yol veya ikili dosya nesnesi) yazar.
+    fmt: 'csv' veya 'parquet' (parquet için pyarrow gerekir).
+    converter: iter_psychrometric_batch'e bakınız.
+    Dönen: yazılan satır sayısı.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError("Biçim 'csv' veya 'parquet' olmalıdır.")
+
+    rows = 0
+    if fmt == "csv":
+        for i, chunk in enumerate(iter_psychrometric_batch(source, chunksize, converter, **kwargs)):
+            data = chunk.to_csv(index=False, header=(i == 0), float_format="%.8g")
+            if isinstance(dest, (str, bytes)) or hasattr(dest, "__fspath__"):
+                with open(dest, "w" if i == 0 else "a", encoding="utf-8", newline="") as fh:
+                    fh.write(data)
+            else:
+                dest.write(data.encode("utf-8"))
+            rows += len(chunk)
+        return rows
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet çıktısı için 'pyarrow' paketi gereklidir.")
+
+    writer = None
+    try:
+        for chunk in iter_psychrometric_batch(source, chunksize, converter, **kwargs):
+            table = pa.Table.from_pandas(chunk.astype({"Hata": "string"}), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(dest, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
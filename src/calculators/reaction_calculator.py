@@ -1,12 +1,15 @@
+from __future__ import annotations
+
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
-import pandas as pd
-from scipy.integrate import quad
-from pint import UnitRegistry
+from src.calculators.lazy import lazy_import
+from src.calculators.unit_registry import Q_
 
-# Birim sistemi - Tek bir registry örneği
-ureg = UnitRegistry()
-Q_ = ureg.Quantity
+pd = lazy_import("pandas")
+integrate = lazy_import("scipy.integrate")
 
 def _k_units_for_order(overall_order: float) -> str:
     """Toplam mertebeye göre hız sabiti birimini döndürür."""
@@ -44,6 +47,120 @@ def calculate_rate_constant(k0, Ea, T, overall_order: float = 1.0, k0_units: str
     k = k0_q * np.exp(-exponent)
     return k.to_base_units()
 
+# ---------------- Float-Based Rate & Integration Helpers ----------------
+
+# Hız sıfır/negatif olduğunda kullanılan alt sınır [mol/(m^3 s)]
+_EPS_RATE = 1e-30
+
+# Gauss-Legendre düğüm/ağırlıkları (sabit mertebe, bir kez hesaplanır)
+_GL_ORDER = 16
+_GL_PANELS = 8
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(_GL_ORDER)
+
+# [0, 1] aralığına ölçeklenmiş panel düğümleri/ağırlıkları (ağırlık toplamı 1)
+_GL_HALF = 0.5 / _GL_PANELS
+_GL_FRAC = ((np.arange(_GL_PANELS) + 0.5)[:, None] / _GL_PANELS + _GL_HALF * _GL_NODES[None, :]).ravel()
+_GL_FRAC_WEIGHTS = np.tile(_GL_HALF * _GL_WEIGHTS, _GL_PANELS)
+
+
+def _k_si(k, overall_order: float) -> float:
+    """Hız sabitini mertebeye uygun SI birimine çevirip büyüklüğünü döndürür."""
+    k_q = k if hasattr(k, 'units') else Q_(k, _k_units_for_order(overall_order))
+    try:
+        return float(k_q.to(_k_units_for_order(overall_order)).magnitude)
+    except Exception as e:
+        raise ValueError(f"Hız sabiti birimi reaksiyon mertebesi ile uyumsuz: {e}")
+
+
+def _rate_si(x, C_A0: float, C_B0, k: float, n: float, m: float,
+             a: float, b: float, phase: str, epsilon: float) -> np.ndarray:
+    """
+    -r_A [mol/(m^3 s)]; tüm girdiler SI büyüklükleri (birimsiz float), x dizi olabilir.
+    Sıfır veya negatif hız _EPS_RATE ile sınırlandırılır.
+    """
+    x = np.asarray(x, dtype=float)
+    if phase == 'gas':
+        denom = 1.0 + epsilon * x
+        denom = np.where(np.abs(denom) < 1e-9, np.where(denom >= 0, 1e-9, -1e-9), denom)
+        ca = C_A0 * (1.0 - x) / denom
+        cb = (C_B0 - (b/a) * C_A0 * x) / denom if C_B0 is not None else None
+    else:
+        ca = C_A0 * (1.0 - x)
+        cb = np.maximum(C_B0 - (b/a) * C_A0 * x, 0.0) if C_B0 is not None else None
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = k * ca**n
+        if cb is not None and m > 0:
+            r = r * cb**m
+    return np.where(r > 0, r, _EPS_RATE)
+
+
+def _closed_form_inv_rate(X, C_A0, k, n, phase: str, epsilon: float) -> np.ndarray:
+    """
+    Tek reaktanlı durumlar için analitik ∫_0^X dx / (-r_A); girdiler dizi olabilir.
+    Analitik çözümü olmayan elemanlar (gaz fazı, n != 1) NaN döner.
+    """
+    X = np.asarray(X, dtype=float)
+    n = np.asarray(n, dtype=float)
+    ln_term = -np.log1p(-X)  # ln(1/(1-X))
+    first = np.abs(n - 1.0) < 1e-12
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if phase != 'gas':
+            I_n = np.where(first, ln_term, ((1.0 - X)**(1.0 - n) - 1.0) / np.where(first, 1.0, n - 1.0))
+            return I_n / (k * C_A0**n)
+
+        ok = first & (np.minimum(1.0, 1.0 + epsilon * X) > 1e-9)
+        return np.where(ok, ((1.0 + epsilon) * ln_term - epsilon * X) / (k * C_A0), np.nan)
+
+
+def _gl_inv_rate(X, C_A0, C_B0, k, n, m: float, a: float, b: float,
+                 phase: str, epsilon: float) -> np.ndarray:
+    """
+    ∫_0^X dx / (-r_A) için kompozit Gauss-Legendre; X, C_A0, k ve n aynı
+    boyutlu diziler olabilir, her eleman kendi [0, X] aralığında integre edilir.
+    dx = (1-x) du, u ∈ [0, ln(1/(1-X))]: (1-x)^-n tekilliği yumuşatılır.
+    """
+    X = np.atleast_1d(np.asarray(X, dtype=float))
+    ln_term = -np.log1p(-X)
+    u = ln_term[:, None] * _GL_FRAC[None, :]
+    w = ln_term[:, None] * _GL_FRAC_WEIGHTS[None, :]
+    x = -np.expm1(-u)
+
+    def col(v):
+        return np.asarray(v, dtype=float).reshape(-1, 1) if np.ndim(v) else v
+
+    integrand = (1.0 - x) / _rate_si(x, col(C_A0), C_B0, col(k), col(n), m, a, b, phase, epsilon)
+    return np.sum(w * integrand, axis=1)
+
+
+def _integral_inv_rate(X: float, C_A0: float, C_B0, k: float, n: float, m: float,
+                       a: float, b: float, phase: str, epsilon: float) -> float:
+    """
+    I = ∫_0^X dx / (-r_A)  [m^3 s / mol]
+
+    Analitik çözümler:
+      - Sıvı faz, tek reaktanlı üs yasası (n mertebesi)
+      - Gaz faz, birinci mertebe, genleşme faktörü epsilon
+    Diğer durumlarda u = -ln(1-x) dönüşümü ile kompozit Gauss-Legendre
+    (sabit mertebe, vektörel) kullanılır; sonuç sonlu değilse quad'a düşülür.
+    """
+    if C_B0 is None or m == 0:
+        I = float(_closed_form_inv_rate(X, C_A0, k, n, phase, epsilon))
+        if np.isfinite(I):
+            return I
+
+    I = float(_gl_inv_rate(X, C_A0, C_B0, k, n, m, a, b, phase, epsilon)[0])
+
+    if not np.isfinite(I):
+        try:
+            I, _ = integrate.quad(lambda xx: 1.0 / float(_rate_si(xx, C_A0, C_B0, k, n, m, a, b, phase, epsilon)),
+                        0.0, X, limit=500, epsabs=1e-9, epsrel=1e-7)
+        except Exception as e:
+            raise ValueError(f"İntegral hatası: {str(e)}")
+    return I
+
+
 def calculate_reactor_volume(
     F_A0,
     C_A0,
@@ -60,6 +177,8 @@ def calculate_reactor_volume(
 ):
     """
     CSTR veya PFR hacmi hesaplama.
+    Birimler girişte bir kez ayrıştırılır; hesap float üzerinde yapılır,
+    sonuç pint Quantity (m^3) olarak döner.
     """
     if not (0.0 < X < 1.0):
         raise ValueError("X (dönüşüm) 0 ile 1 arasında olmalıdır.")
@@ -69,67 +188,19 @@ def calculate_reactor_volume(
     if F_A0 <= 0 or C_A0 <= 0 or n < 0 or (C_B0 is not None and C_B0 < 0):
         raise ValueError("Girdiler pozitif olmalıdır.")
 
-    F_A0_q = Q_(F_A0, 'mole/second')
-    C_A0_q = Q_(C_A0, 'mole/meter**3')
-    C_B0_q = Q_(C_B0, 'mole/meter**3') if C_B0 is not None else None
-
     overall_order = n + (m if C_B0 is not None else 0)
-
-    if hasattr(k, 'units'):
-        k_q = k
-    else:
-        k_q = Q_(k, _k_units_for_order(overall_order))
-
-    eps_rate = Q_(1e-30, 'mole/(meter**3*second)')
-
-    def rate(x: float):
-        # Konsantrasyonlar
-        if phase == 'gas':
-            denom = (1.0 + epsilon * x)
-            if abs(denom) < 1e-9: denom = 1e-9 if denom >= 0 else -1e-9
-            
-            ca = C_A0_q * (1.0 - x) / denom
-            if C_B0_q is not None:
-                cb = (C_B0_q - (b/a) * C_A0_q * x) / denom
-            else:
-                cb = None
-        else:  # liquid
-            ca = C_A0_q * (1.0 - x)
-            if C_B0_q is not None:
-                cb_raw = C_B0_q - (b/a) * C_A0_q * x
-                if cb_raw.magnitude < 0: cb_raw = Q_(0.0, cb_raw.units)
-                cb = cb_raw
-            else:
-                cb = None
-
-        r = k_q * (ca**n) * ((cb**m) if (cb is not None and m > 0) else 1)
-        if hasattr(r, 'magnitude') and r.magnitude <= 0:
-            r = eps_rate
-        return r.to('mole/(meter**3*second)')
+    k_si = _k_si(k, overall_order)
 
     if reactor_type == 'CSTR':
-        r_exit = rate(X)
-        if r_exit.magnitude <= 0:
+        r_exit = float(_rate_si(X, C_A0, C_B0, k_si, n, m, a, b, phase, epsilon))
+        if r_exit <= 0:
             raise ValueError("Çıkış hız ifadesi sıfır veya negatif.")
-        V = (F_A0_q * X) / r_exit
-        return V.to('meter**3')
+        return Q_(F_A0 * X / r_exit, 'meter**3')
 
     elif reactor_type == 'PFR':
-        def integrand(x):
-            r_x = rate(x)
-            # 1/r_A birimi: (mol/m^3 s)^-1 = m^3 s / mol
-            inv = (Q_(1.0, 'dimensionless') / r_x).to('meter**3 * second / mole').magnitude
-            return inv
-        try:
-            integral_val, _ = quad(integrand, 0.0, X, limit=500, epsabs=1e-9, epsrel=1e-7)
-        except Exception as e:
-             raise ValueError(f"İntegral hatası: {str(e)}")
-             
-        # integral_val birimi: m^3 * s / mol (integrand'dan gelir)
-        # V = F_A0 * integral
-        # [V] = (mol/s) * (m^3 s / mol) = m^3
-        V = F_A0_q * Q_(integral_val, 'meter**3 * second / mole')
-        return V.to('meter**3')
+        # V = F_A0 * ∫ dX / (-r_A)  ->  [mol/s] * [m^3 s / mol] = m^3
+        integral_val = _integral_inv_rate(X, C_A0, C_B0, k_si, n, m, a, b, phase, epsilon)
+        return Q_(F_A0 * integral_val, 'meter**3')
 
     else:
         raise ValueError("Reaktör tipi 'CSTR' veya 'PFR' olmalı.")
@@ -148,61 +219,157 @@ def calculate_batch_time(
 ):
     """
     Kesikli reaktörde dönüşüm için gereken süre [s].
+    Batch: t = C_A0 * ∫ dX / (-r_A); konsantrasyonlar akışlı sistemle aynı
+    ifadelerle (gaz fazında V = V0(1+eps*X)) hesaplanır.
     """
     if not (0.0 < X < 1.0):
         raise ValueError("X (dönüşüm) 0 ile 1 arasında olmalıdır.")
     
-    C_A0_q = Q_(C_A0, 'mole/meter**3')
-    C_B0_q = Q_(C_B0, 'mole/meter**3') if C_B0 is not None else None
     overall_order = n + (m if C_B0 is not None else 0)
-    
-    if hasattr(k, 'units'):
-        k_q = k
+    k_si = _k_si(k, overall_order)
+
+    integral_val = _integral_inv_rate(X, C_A0, C_B0, k_si, n, m, a, b, phase, epsilon)
+    return Q_(C_A0 * integral_val, 'second')
+
+# ---------------- Parametric Sweep ----------------
+
+# Evrensel gaz sabiti [J/(mol K)] (calculate_rate_constant ile aynı)
+_R_GAS = 8.314462618
+
+# Sayısal integral parça boyutu (parça başına bellek: boyut x 128 düğüm)
+_SWEEP_CHUNK = 4096
+
+# Süreç havuzunun devreye girdiği en küçük sayısal integral nokta sayısı
+_SWEEP_POOL_MIN = 200_000
+
+
+def _k_si_array(k, overall_order: np.ndarray) -> np.ndarray:
+    """Hız sabitini her mertebe için SI'ya çevirir (birim ayrıştırma tekil mertebe başına bir kez)."""
+    orders, inverse = np.unique(overall_order, return_inverse=True)
+    return np.array([_k_si(k, o) for o in orders])[inverse]
+
+
+def _sweep_integrate_chunk(args) -> np.ndarray:
+    """Süreç havuzu işçisi: bir parça için sayısal integral; sonlu olmayanlar tekil yoldan (quad)."""
+    X, C_A0, k, n, C_B0, m, a, b, phase, epsilon = args
+    I = _gl_inv_rate(X, C_A0, C_B0, k, n, m, a, b, phase, epsilon)
+    for i in np.flatnonzero(~np.isfinite(I)):
+        I[i] = _integral_inv_rate(X[i], C_A0[i], C_B0, k[i], n[i], m, a, b, phase, epsilon)
+    return I
+
+
+def _sweep_inv_rate(X, C_A0, C_B0, k, n, m, a, b, phase, epsilon, max_workers) -> np.ndarray:
+    """
+    Tüm ızgara için ∫ dx / (-r_A). Analitik çözümü olan noktalar doğrudan,
+    kalanlar parçalar halinde GL ile hesaplanır; nokta sayısı _SWEEP_POOL_MIN'i
+    aşarsa parçalar süreç havuzuna dağıtılır (max_workers=1 ise seri).
+    """
+    if C_B0 is None or m == 0:
+        I = _closed_form_inv_rate(X, C_A0, k, n, phase, epsilon)
     else:
-        k_q = Q_(k, _k_units_for_order(overall_order))
+        I = np.full(X.shape, np.nan)
 
-    eps_rate = Q_(1e-30, 'mole/(meter**3*second)')
+    todo = np.flatnonzero(~np.isfinite(I))
+    if todo.size == 0:
+        return I
 
-    def rate(x: float):
-        # Batch için hacim değişimi varsa konsantrasyonlar değişir
-        # V = V0(1+eps*X)
-        # N_A = N_A0(1-X)
-        # C_A = N_A/V = N_A0(1-X) / (V0(1+eps*X)) = C_A0(1-X)/(1+eps*X)
-        # Formüller akışlı sistemle aynı (sabit hacim veya değişken hacim)
-        
-        if phase == 'gas': # Değişken hacim
-            denom = (1.0 + epsilon * x)
-            if abs(denom) < 1e-9: denom = 1e-9
-            ca = C_A0_q * (1.0 - x) / denom
-            if C_B0_q is not None:
-                cb = (C_B0_q - (b/a) * C_A0_q * x) / denom
-            else:
-                cb = None
-        else: # Sabit hacim
-            ca = C_A0_q * (1.0 - x)
-            if C_B0_q is not None:
-                cb = C_B0_q - (b/a) * C_A0_q * x
-                if cb.magnitude < 0: cb = Q_(0.0, cb.units)
-            else:
-                cb = None
-                
-        r = k_q * (ca**n) * ((cb**m) if (cb is not None and m > 0) else 1)
-        if hasattr(r, 'magnitude') and r.magnitude <= 0:
-            r = eps_rate
-        return r.to('mole/(meter**3*second)')
-
-    def integrand(x: float):
-        r_x = rate(x)
-        # Batch: t = C_A0 * integral(dX / r)
-        val = (C_A0_q / r_x).to('second').magnitude
-        return val
+    parts = np.array_split(todo, math.ceil(todo.size / _SWEEP_CHUNK))
+    chunks = [(X[idx], C_A0[idx], k[idx], n[idx], C_B0, m, a, b, phase, epsilon) for idx in parts]
 
-    try:
-        integral_val, _ = quad(integrand, 0.0, X, limit=500, epsabs=1e-9, epsrel=1e-7)
-    except Exception as e:
-        raise ValueError(f"İntegral hatası: {str(e)}")
-        
-    return Q_(integral_val, 'second')
+    results = None
+    if max_workers != 1 and todo.size >= _SWEEP_POOL_MIN:
+        try:
+            # Çok iş parçacıklı süreçten (Streamlit) fork güvenli değildir: spawn
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(_sweep_integrate_chunk, chunks))
+        except (OSError, BrokenProcessPool):
+            # Süreç başlatılamadı (kısıtlı ortam): seri devam edilir
+            results = None
+    if results is None:
+        results = [_sweep_integrate_chunk(c) for c in chunks]
+
+    I[todo] = np.concatenate(results)
+    return I
+
+
+def sweep_reactor_volume(
+    X,
+    n,
+    C_A0,
+    F_A0,
+    k=None,
+    T=None,
+    k0=None,
+    Ea=None,
+    reactor_types=('CSTR', 'PFR'),
+    C_B0=None,
+    m=0,
+    a: float = 1.0,
+    b: float = 1.0,
+    phase: str = 'liquid',
+    epsilon: float = 0.0,
+    grid: bool = True,
+    max_workers: int | None = None
+) -> pd.DataFrame:
+    """
+    CSTR/PFR hacmini X, T, n, C_A0 ve F_A0 dizileri üzerinde toplu hesaplar.
+
+    Her girdi skaler veya dizi olabilir. grid=True ise tüm kombinasyonlar
+    (Kartezyen çarpım), grid=False ise diziler eleman eleman (broadcast)
+    eşleştirilir. Hız sabiti ya doğrudan `k` ile ya da `k0`, `Ea` [J/mol] ve
+    `T` [K] ile Arrhenius'tan (calculate_rate_constant ile aynı tanım) verilir.
+    Birimler calculate_reactor_volume ile aynıdır (SI).
+
+    Dönen: her (nokta, reaktör) için bir satır içeren uzun tablo:
+    X, T, n, C_A0, F_A0, k, reactor, V [m^3]
+    """
+    for rt in reactor_types:
+        if rt not in ('CSTR', 'PFR'):
+            raise ValueError("Reaktör tipi 'CSTR' veya 'PFR' olmalı.")
+
+    inputs = [
+        np.atleast_1d(np.asarray(v, dtype=float)).ravel()
+        for v in (X, np.nan if T is None else T, n, C_A0, F_A0)
+    ]
+    if grid:
+        cols = [g.ravel() for g in np.meshgrid(*inputs, indexing='ij')]
+    else:
+        try:
+            cols = [c.ravel() for c in np.broadcast_arrays(*inputs)]
+        except ValueError:
+            raise ValueError("grid=False için diziler aynı uzunlukta (veya skaler) olmalıdır.")
+    X_, T_, n_, C_A0_, F_A0_ = cols
+
+    if np.any((X_ <= 0.0) | (X_ >= 1.0)):
+        raise ValueError("X (dönüşüm) 0 ile 1 arasında olmalıdır.")
+    if np.any(X_ > 0.99):
+        raise ValueError("Dönüşüm oranı çok yüksek (maks 0.99).")
+    if np.any(F_A0_ <= 0) or np.any(C_A0_ <= 0) or np.any(n_ < 0) or (C_B0 is not None and C_B0 < 0):
+        raise ValueError("Girdiler pozitif olmalıdır.")
+
+    overall_order = n_ + (m if C_B0 is not None else 0)
+    if T is not None:
+        if k0 is None or Ea is None:
+            raise ValueError("Sıcaklık taraması için k0 ve Ea gereklidir.")
+        if np.any(T_ <= 0):
+            raise ValueError("Sıcaklık (T) 0 Kelvin'den büyük olmalıdır.")
+        k_ = _k_si_array(k0, overall_order) * np.exp(-Ea / (_R_GAS * T_))
+    elif k is not None:
+        k_ = _k_si_array(k, overall_order)
+    else:
+        raise ValueError("Hız sabiti (k) veya Arrhenius parametreleri (k0, Ea, T) verilmelidir.")
+
+    frames = []
+    for rt in reactor_types:
+        if rt == 'CSTR':
+            V = F_A0_ * X_ / _rate_si(X_, C_A0_, C_B0, k_, n_, m, a, b, phase, epsilon)
+        else:
+            V = F_A0_ * _sweep_inv_rate(X_, C_A0_, C_B0, k_, n_, m, a, b, phase, epsilon, max_workers)
+        frames.append(pd.DataFrame({
+            'X': X_, 'T': T_, 'n': n_, 'C_A0': C_A0_, 'F_A0': F_A0_,
+            'k': k_, 'reactor': rt, 'V': V,
+        }))
+    return pd.concat(frames, ignore_index=True)
 
 def generate_levenspiel_data(
     C_A0,
@@ -219,50 +386,27 @@ def generate_levenspiel_data(
 ):
     """
     Levenspiel grafiği (1/-rA vs X) için veri üretir.
+    Birimler bir kez ayrıştırılır; tüm eğri NumPy dizileri üzerinde hesaplanır.
     """
     xs = np.linspace(0.0, X_final, n_points)
-    data = []
-    
-    C_A0_q = Q_(C_A0, 'mole/meter**3')
-    C_B0_q = Q_(C_B0, 'mole/meter**3') if C_B0 is not None else None
+
     overall_order = n + (m if C_B0 is not None else 0)
-    
-    if hasattr(k, 'units'):
-        k_q = k
-    else:
-        k_q = Q_(k, _k_units_for_order(overall_order))
-        
+    k_si = _k_si(k, overall_order)
+
+    # Grafikte sıfır hız için kullanılan alt sınır
     eps_rate = 1e-9
-    
-    for x in xs:
-        if phase == 'gas':
-            denom = (1.0 + epsilon * x)
-            if abs(denom) < 1e-9: denom = 1e-9
-            ca = C_A0_q * (1.0 - x) / denom
-            if C_B0_q is not None:
-                cb = (C_B0_q - (b/a) * C_A0_q * x) / denom
-            else:
-                cb = None
-        else:
-            ca = C_A0_q * (1.0 - x)
-            if C_B0_q is not None:
-                cb = C_B0_q - (b/a) * C_A0_q * x
-                if cb.magnitude < 0: cb = Q_(0.0, cb.units)
-            else:
-                cb = None
-                
-        r_val = k_q * (ca**n) * ((cb**m) if (cb is not None and m > 0) else 1)
-        r_mag = r_val.to('mole/(meter**3*second)').magnitude
-        
-        if r_mag <= 0: r_mag = eps_rate
-            
-        inv_r = 1.0 / r_mag
-        
-        data.append({
-            'X': x,
-            'rate': r_mag,
-            'inv_rate': inv_r,
-            'CA': ca.to('mole/meter**3').magnitude
-        })
-        
-    return pd.DataFrame(data)
\ No newline at end of file
+    rate = _rate_si(xs, C_A0, C_B0, k_si, n, m, a, b, phase, epsilon)
+    rate = np.where(rate > _EPS_RATE, rate, eps_rate)
+
+    if phase == 'gas':
+        denom = 1.0 + epsilon * xs
+        ca = C_A0 * (1.0 - xs) / np.where(np.abs(denom) < 1e-9, 1e-9, denom)
+    else:
+        ca = C_A0 * (1.0 - xs)
+
+    return pd.DataFrame({
+        'X': xs,
+        'rate': rate,
+        'inv_rate': 1.0 / rate,
+        'CA': ca,
+    })
@@ -1,24 +1,40 @@
-import pandas as pd
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.optimize import fsolve
-from thermo import Chemical
+from src.calculators.activity_models import ACTIVITY_MODELS, ActivityModel, get_activity_model
+from src.calculators.lazy import lazy_import
+from src.calculators.property_cache import get_chemical
+from src.calculators.property_tables import ComponentTable, get_component_table
 from typing import Tuple, List, Dict
 
+pd = lazy_import("pandas")
+interpolate = lazy_import("scipy.interpolate")
+optimize = lazy_import("scipy.optimize")
+
 # ---------------- Helper Functions ----------------
 
 def get_phase_enthalpy(chem_name: str, T: float, phase: str) -> float:
     """
-    Belirli bir faz (sıvı veya buhar) için entalpiyi hesaplar (J/mol).
+    Belirli bir faz (sıvı veya buhar) için entalpiyi hesaplar (J/kg).
     Fazı zorlamak için basıncı manipüle ederiz.
+    T bileşen tablosunun aralığındaysa değer tablodan okunur.
     """
+    try:
+        table = get_component_table(chem_name)
+        if table.T_min <= T <= table.T_max:
+            return float(table.enthalpy(T, phase))
+    except Exception:
+        pass
+
     # Kritik sıcaklık kontrolü yapılabilir ama basitlik için:
     # Sıvı için yüksek basınç, Buhar için düşük basınç varsayalım.
     # Ancak ideal olarak P sistem basıncı olmalı.
     # Eğer T, kaynama noktasının çok altındaysa buhar, çok üstündeyse sıvı hipotetiktir.
     
     try:
-        c = Chemical(chem_name, T=T)
+        c = get_chemical(chem_name, T=T)
         Psat = c.Psat if c.Psat else 101325.0
         
         if phase == 'l':
@@ -26,17 +42,22 @@ def get_phase_enthalpy(chem_name: str, T: float, phase: str) -> float:
             # Basit yaklaşım: Doygun sıvı entalpisi
             # thermo kütüphanesinde fazı zorlamak bazen tricky olabilir.
             # P = Psat + epsilon -> Liquid
-            c_l = Chemical(chem_name, T=T, P=Psat*1.01 if Psat else 101325)
+            c_l = get_chemical(chem_name, T=T, P=Psat*1.01 if Psat else 101325)
             return c_l.H
         elif phase == 'v':
             # Buhar entalpisi
             # P = Psat - epsilon -> Vapor
-            c_v = Chemical(chem_name, T=T, P=Psat*0.99 if Psat else 1000)
+            c_v = get_chemical(chem_name, T=T, P=Psat*0.99 if Psat else 1000)
             return c_v.H
     except:
         return 0.0
     return 0.0
 
+def _molar_mass(chem_name: str) -> float:
+    """Molar kütle (kg/mol); J/kg entalpileri J/mol'e çevirmek için."""
+    return get_chemical(chem_name).MW / 1000.0
+
+
 def get_mixture_enthalpy(chem1: str, chem2: str, x1: float, T: float, P: float, phase: str = None) -> float:
     """
     Karışımın entalpisini hesaplar (J/mol).
@@ -46,30 +67,34 @@ def get_mixture_enthalpy(chem1: str, chem2: str, x1: float, T: float, P: float,
         # Faz belirtilmediyse T ve P'ye göre otomatik belirlenir (Chemical varsayılanı)
         # Ancak biz VLE eğrileri için fazı zorlamak isteyebiliriz.
         
-        h1 = get_phase_enthalpy(chem1, T, phase)
-        h2 = get_phase_enthalpy(chem2, T, phase)
+        h1 = get_phase_enthalpy(chem1, T, phase) * _molar_mass(chem1)
+        h2 = get_phase_enthalpy(chem2, T, phase) * _molar_mass(chem2)
         
         return x1 * h1 + (1 - x1) * h2
     except:
         return 0.0
 
-def calculate_q_from_T(chem1: str, chem2: str, P: float, zF: float, T_feed: float) -> float:
+def calculate_q_from_T(chem1: str, chem2: str, P: float, zF: float, T_feed: float, vle: "VLEData | None" = None) -> float:
     """
     Besleme sıcaklığından q değerini hesaplar.
     q = (H_vapor_sat - H_feed) / (H_vapor_sat - H_liquid_sat)
+
+    vle: önceden hesaplanmış VLE verisi (verilmezse paylaşılan önbellekten alınır)
     """
     # 1. Besleme kompozisyonunda (zF) kabarcık ve çiy noktası sıcaklıklarını bul
     # Basitlik için VLE fonksiyonunu kullanabiliriz veya tek nokta hesabı yapabiliriz.
     # Şimdilik VLE fonksiyonunu çağırıp interpolasyon yapalım (biraz yavaş olabilir ama güvenli)
     
-    df = calculate_vle_thermo(chem1, chem2, P, n_points=11)
+    if vle is None:
+        vle = get_vle_data(chem1, chem2, P, n_points=11)
+    df = vle.df
     
     # zF noktasındaki doygun sıvı ve buhar entalpileri
     # DİKKAT: Ponchon diyagramında aynı x (veya y) apsisindeki dikey farka bakıyoruz.
     # Yani zF kompozisyonundaki doymuş sıvı ve doymuş buhar.
     
-    f_HL = interp1d(df['x'], df['HL'], kind='linear', fill_value='extrapolate')
-    f_HV = interp1d(df['y'], df['HV'], kind='linear', fill_value='extrapolate') # y'ye bağlı HV
+    f_HL = interpolate.interp1d(df['x'], df['HL'], kind='linear', fill_value='extrapolate')
+    f_HV = interpolate.interp1d(df['y'], df['HV'], kind='linear', fill_value='extrapolate') # y'ye bağlı HV
     
     HL_sat = float(f_HL(zF))
     HV_sat = float(f_HV(zF)) # zF buhar fazındayken entalpi
@@ -78,8 +103,8 @@ def calculate_q_from_T(chem1: str, chem2: str, P: float, zF: float, T_feed: floa
     # H_feed. Eğer T_feed verilmişse:
     # Fazı tahmin etmemiz lazım.
     # T_bubble ve T_dew bulmamız lazım zF için.
-    f_T_bub = interp1d(df['x'], df['T'], kind='linear', fill_value='extrapolate')
-    f_T_dew = interp1d(df['y'], df['T'], kind='linear', fill_value='extrapolate')
+    f_T_bub = interpolate.interp1d(df['x'], df['T'], kind='linear', fill_value='extrapolate')
+    f_T_dew = interpolate.interp1d(df['y'], df['T'], kind='linear', fill_value='extrapolate')
     
     T_bub = float(f_T_bub(zF))
     T_dew = float(f_T_dew(zF))
@@ -106,95 +131,633 @@ def calculate_q_from_T(chem1: str, chem2: str, P: float, zF: float, T_feed: floa
     q = (HV_sat - H_feed) / (HV_sat - HL_sat)
     return q
 
-def calculate_vle_thermo(chem1: str, chem2: str, P: float, n_points: int = 20) -> pd.DataFrame:
+# ---------------- Vectorized VLE Engine ----------------
+
+def _saturation_window(table1: ComponentTable, table2: ComponentTable, P: float, margin: float = 10.0) -> Tuple[float, float]:
+    """İki bileşenin P'deki doyma sıcaklıklarını kapsayan, tablo aralığındaki sıcaklık aralığı."""
+    Tsats = [float(table1.Tsat(P)), float(table2.Tsat(P))]
+    T_lo = max(min(Tsats) - margin, table1.T_min, table2.T_min)
+    T_hi = min(max(Tsats) + margin, table1.T_max, table2.T_max)
+    if T_lo >= T_hi:
+        raise ValueError("Bileşenlerin tablo aralıkları bu basınçta örtüşmüyor.")
+    return T_lo, T_hi
+
+
+def _solve_bubble_T(
+    x1: np.ndarray, P: float, table1: ComponentTable, table2: ComponentTable,
+    T_lo: float, T_hi: float, tol: float = 1e-9, max_iter: int = 50,
+    activity: ActivityModel | None = None
+) -> np.ndarray:
+    """
+    Tüm x1 noktaları için kabarcık noktası sıcaklığını aynı anda çözer.
+    ln(x1*γ1*P1sat + x2*γ2*P2sat) - ln(P) = 0 denklemi için sınırlandırılmış
+    (bracketed) Newton: Newton adımı aralık dışına çıkarsa ikiye bölme yapılır.
+
+    activity verilirse γ her iterasyonda tüm noktalar için tek çağrıda
+    hesaplanır; Newton türevinde dγ/dT ihmal edilir (zayıf bağımlılık,
+    aralık sınırlaması yakınsamayı korur). Yakınsamayan noktalar NaN döner.
+    """
+    x2 = 1.0 - x1
+    lnP = np.log(P)
+    lo = np.full_like(x1, T_lo)
+    hi = np.full_like(x1, T_hi)
+    # Başlangıç tahmini: saf bileşen doyma sıcaklıklarının ağırlıklı ortalaması
+    T = np.clip(x1 * table1.Tsat(P) + x2 * table2.Tsat(P), T_lo, T_hi)
+
+    for _ in range(max_iter):
+        p1 = table1.psat(T)
+        p2 = table2.psat(T)
+        if activity is not None:
+            g1, g2 = activity.gammas(x1, T)
+            p1, p2 = g1 * p1, g2 * p2
+        s = x1 * p1 + x2 * p2
+        g = np.log(s) - lnP
+        # Psat(T) monoton artan olduğundan g < 0 ise kök T'nin üstündedir
+        lo = np.where(g < 0, T, lo)
+        hi = np.where(g > 0, T, hi)
+
+        dg = (x1 * p1 * table1.dln_psat_dT(T) + x2 * p2 * table2.dln_psat_dT(T)) / s
+        T_new = T - g / dg
+        outside = ~np.isfinite(T_new) | (T_new <= lo) | (T_new >= hi)
+        T_new = np.where(outside, 0.5 * (lo + hi), T_new)
+
+        converged = np.abs(T_new - T) < tol
+        T = T_new
+        if converged.all():
+            break
+    return np.where(converged, T, np.nan)
+
+
+def calculate_vle_thermo(chem1: str, chem2: str, P: float, n_points: int = 20, model: str = 'ideal') -> pd.DataFrame:
+    """
+    İkili VLE verisini hesaplar: x, y, T (K), HL, HV (J/mol).
+
+    model: 'ideal' (Raoult) veya modifiye Raoult için aktivite modeli
+    ('wilson', 'nrtl', 'unifac'); y1 = x1*γ1*P1sat/P.
+    Psat ve faz entalpileri bileşen tablolarından (property_tables) okunur,
+    tüm kompozisyon noktaları tek bir NumPy dizisi olarak çözülür.
+    """
     if P <= 0:
         raise ValueError("Basınç sıfırdan büyük olmalıdır.")
+    activity = get_activity_model(model, chem1, chem2)
 
-    xs = np.linspace(0.0, 1.0, n_points)
-    data = []
-
-    # Saf maddelerin kaynama noktalarını bul (Sıcaklık tahmini için)
+    empty = pd.DataFrame(columns=['x', 'y', 'T', 'HL', 'HV'])
     try:
-        Tb1 = Chemical(chem1, P=P).Tb
-        Tb2 = Chemical(chem2, P=P).Tb
-    except:
-        Tb1, Tb2 = 373.15, 351.15 # Fallback
+        table1 = get_component_table(chem1)
+        table2 = get_component_table(chem2)
+        M1, M2 = _molar_mass(chem1), _molar_mass(chem2)
+        # Pozitif sapmalı sistemlerde kabarcık noktası saf bileşenlerin altına inebilir
+        T_lo, T_hi = _saturation_window(table1, table2, P, margin=10.0 if activity.ideal else 60.0)
+    except Exception:
+        return empty
 
-    for x1 in xs:
-        x2 = 1.0 - x1
-        
-        # T_bub (Kabarcık noktası sıcaklığı) bulma
-        # P = x1*P1sat(T) + x2*P2sat(T) denklemini çözen T
-        def error_func(T):
-            try:
-                p1 = Chemical(chem1, T=T).Psat
-                p2 = Chemical(chem2, T=T).Psat
-                if p1 is None or p2 is None: return 1e5
-                return x1 * p1 + x2 * p2 - P
-            except:
-                return 1e5
-        
-        # Başlangıç tahmini: Ağırlıklı ortalama
-        T_guess = x1 * Tb1 + x2 * Tb2
-        try:
-            T_sol = fsolve(error_func, T_guess)[0]
-        except:
-            continue
+    x1 = np.linspace(0.0, 1.0, n_points)
+    if activity.ideal:
+        T = _solve_bubble_T(x1, P, table1, table2, T_lo, T_hi)
+        g1 = 1.0
+    else:
+        T = _solve_bubble_T(x1, P, table1, table2, T_lo, T_hi, activity=activity)
+        g1 = activity.gammas(x1, T)[0]
+    y1 = np.clip(x1 * g1 * table1.psat(T) / P, 0.0, 1.0)
 
-        # y1 hesapla
-        try:
-            P1sat = Chemical(chem1, T=T_sol).Psat
-            y1 = x1 * P1sat / P
-            y1 = max(0.0, min(1.0, y1)) # Sınırla
-        except:
-            continue
-            
-        # Entalpileri Hesapla (J/mol)
-        # H_L = x1*H_L1 + x2*H_L2
-        # H_V = y1*H_V1 + y2*H_V2
-        # Not: Karışım ısısını ihmal ediyoruz (İdeal karışım varsayımı)
-        
-        H_L1 = get_phase_enthalpy(chem1, T_sol, 'l')
-        H_L2 = get_phase_enthalpy(chem2, T_sol, 'l')
-        H_V1 = get_phase_enthalpy(chem1, T_sol, 'v')
-        H_V2 = get_phase_enthalpy(chem2, T_sol, 'v')
-        
-        HL = x1 * H_L1 + x2 * H_L2
-        HV = y1 * H_V1 + (1 - y1) * H_V2
-        
-        data.append({
-            'x': x1, 
-            'y': y1, 
-            'T': T_sol, 
-            'HL': HL, 
-            'HV': HV
-        })
-
-    df = pd.DataFrame(data)
+    # Molar entalpiler, J/mol (ideal karışım, karışım ısısı ihmal)
+    HL = x1 * M1 * table1.H_liquid(T) + (1 - x1) * M2 * table2.H_liquid(T)
+    HV = y1 * M1 * table1.H_vapor(T) + (1 - y1) * M2 * table2.H_vapor(T)
+
+    df = pd.DataFrame({'x': x1, 'y': y1, 'T': T, 'HL': HL, 'HV': HV})
+    df = df[np.isfinite(df[['y', 'T', 'HL', 'HV']]).all(axis=1)]
     if df.empty:
-        return pd.DataFrame(columns=['x', 'y', 'T', 'HL', 'HV'])
-        
+        return empty
+
     return df.sort_values('x').reset_index(drop=True)
 
 
+# ---------------- Shared VLE Dataset ----------------
+
+class VLEData:
+    """
+    Bir ikili sistem için hesaplanmış VLE eğrisi (x, y, T, HL, HV).
+
+    q-hesabı, McCabe-Thiele ve Ponchon-Savarit aynı nesneyi paylaşır;
+    df salt okunur kabul edilir (dışarıya kopyası verilir).
+    """
+
+    def __init__(self, chem1: str, chem2: str, P: float, model: str, df: pd.DataFrame):
+        self.chem1 = chem1
+        self.chem2 = chem2
+        self.P = P
+        self.model = model
+        self.df = df
+        self._azeotropes = None
+        self._splines = {}
+
+    @property
+    def n_points(self) -> int:
+        return len(self.df)
+
+    @property
+    def empty(self) -> bool:
+        return self.df.empty
+
+    @property
+    def azeotropes(self) -> List[Dict[str, float]]:
+        """Eğrideki azeotroplar (find_azeotropes); ilk erişimde bir kez taranır."""
+        if self._azeotropes is None:
+            self._azeotropes = find_azeotropes(self.df)
+        return self._azeotropes
+
+    def _spline(self, col: str):
+        spline = self._splines.get(col)
+        if spline is None:
+            spline = self._splines[col] = interpolate.PchipInterpolator(self.df['x'], self.df[col])
+        return spline
+
+    def y_of_x(self, x):
+        """Denge eğrisi y(x), monoton kübik (PCHIP) interpolasyon."""
+        return self._spline('y')(x)
+
+    def T_of_x(self, x):
+        """Kabarcık noktası sıcaklığı T(x), PCHIP interpolasyon."""
+        return self._spline('T')(x)
+
+    def x_of_y(self, y: float, x_hi: float = 1.0) -> float:
+        """
+        Denge eğrisinin tersi: y(x) = y olan x, [0, x_hi] aralığında spline
+        üzerinde kök bulma ile (ekstrapolasyon yok). x_hi, azeotroplu
+        eğrilerde monoton dalı seçmek için verilir.
+        """
+        if y <= 0.0:
+            return 0.0
+        spline = self._spline('y')
+        return float(optimize.brentq(lambda x: spline(x) - y, 0.0, x_hi, xtol=1e-13))
+
+    def resample(self, n_points: int) -> "VLEData":
+        """
+        Eğriyi n_points eşit aralıklı x noktasına yeniden örnekler
+        (monoton kübik/PCHIP interpolasyon). Kaba bir istek, daha ince
+        hesaplanmış bir eğriden yeniden çözüm yapılmadan karşılanır.
+        """
+        if self.empty or n_points == self.n_points:
+            return self
+        xs = np.linspace(0.0, 1.0, n_points)
+        data = {'x': xs}
+        for col in ['y', 'T', 'HL', 'HV']:
+            data[col] = interpolate.PchipInterpolator(self.df['x'], self.df[col])(xs)
+        data['y'] = np.clip(data['y'], 0.0, 1.0)
+        return VLEData(self.chem1, self.chem2, self.P, self.model, pd.DataFrame(data))
+
+
+_VLE_CACHE_SIZE = 64
+_vle_cache = OrderedDict()
+_vle_lock = threading.Lock()
+
+
+def get_vle_data(chem1: str, chem2: str, P: float, n_points: int = 20, model: str = 'ideal') -> VLEData:
+    """
+    (chem1, chem2, P, n_points, model) anahtarıyla önbelleklenmiş VLE verisi.
+    Aynı sistem için daha ince bir eğri önbellekteyse istek ondan yeniden
+    örneklenerek karşılanır.
+    """
+    if P <= 0:
+        raise ValueError("Basınç sıfırdan büyük olmalıdır.")
+    if model not in ACTIVITY_MODELS:
+        raise ValueError(f"Bilinmeyen VLE modeli: {model}")
+
+    base = (chem1.strip().lower(), chem2.strip().lower(), round(float(P), 3), model)
+    key = base + (n_points,)
+    with _vle_lock:
+        vle = _vle_cache.get(key)
+        if vle is not None:
+            _vle_cache.move_to_end(key)
+            return vle
+        finer = [(k[4], v) for k, v in _vle_cache.items() if k[:4] == base and k[4] > n_points]
+
+    if finer:
+        vle = min(finer, key=lambda item: item[0])[1].resample(n_points)
+    else:
+        vle = VLEData(chem1, chem2, P, model, calculate_vle_thermo(chem1, chem2, P, n_points, model))
+
+    with _vle_lock:
+        _vle_cache[key] = vle
+        while len(_vle_cache) > _VLE_CACHE_SIZE:
+            _vle_cache.popitem(last=False)
+    return vle
+
+
+# ---------------- Feasibility Pre-check ----------------
+
+# İşletme doğrusu - denge eğrisi karşılaştırmasındaki ızgara nokta sayısı
+_PINCH_GRID = 401
+
+
+class InfeasibleSpecError(ValueError):
+    """
+    Kolon şartnamesi (zF, xD, xB, q, R) verilen VLE eğrisiyle sağlanamaz.
+
+    diagnostic: 'reason' ('spec', 'azeotrope', 'volatility', 'pinch') ve
+    nedene göre konum bilgisi (x, y, T, section) içeren sözlük.
+    """
+
+    def __init__(self, message: str, diagnostic: Dict):
+        super().__init__(message)
+        self.diagnostic = diagnostic
+
+
+def find_azeotropes(df: pd.DataFrame) -> List[Dict[str, float]]:
+    """
+    VLE eğrisinde y - x'in işaret değiştirdiği iç noktaları bulur.
+    Kök ve sıcaklık komşu noktalar arasında doğrusal interpolasyonla
+    hesaplanır; saf bileşen uçları (x = 0, 1) hariç tutulur.
+    """
+    x = df['x'].to_numpy(dtype=float)
+    d = df['y'].to_numpy(dtype=float) - x
+    T = df['T'].to_numpy(dtype=float)
+    inner = (x > 1e-9) & (x < 1 - 1e-9)
+    x, d, T = x[inner], d[inner], T[inner]
+
+    found = [{'x': float(xi), 'T': float(Ti)} for xi, di, Ti in zip(x, d, T) if di == 0.0]
+    nz = d != 0.0
+    x, d, T = x[nz], d[nz], T[nz]
+    for i in np.nonzero(d[:-1] * d[1:] < 0)[0]:
+        w = d[i] / (d[i] - d[i + 1])
+        found.append({'x': float(x[i] + w * (x[i + 1] - x[i])), 'T': float(T[i] + w * (T[i + 1] - T[i]))})
+    return sorted(found, key=lambda a: a['x'])
+
+
+def _check_composition_spec(vle: VLEData, zF: float, xD: float, xB: float):
+    """Sıralama, azeotrop ve uçuculuk kontrolleri (iki yöntem için ortak)."""
+    if not (0.0 <= xB < zF < xD <= 1.0):
+        raise InfeasibleSpecError(
+            "Kompozisyonlar 0 ≤ xB < zF < xD ≤ 1 sırasını sağlamalıdır.",
+            {'reason': 'spec', 'zF': zF, 'xD': xD, 'xB': xB},
+        )
+
+    for az in vle.azeotropes:
+        if xB < az['x'] < xD:
+            raise InfeasibleSpecError(
+                f"x = {az['x']:.3f} (T = {az['T']:.1f} K) noktasındaki azeotrop xB-xD aralığında; "
+                f"basit distilasyonla aşılamaz.",
+                {'reason': 'azeotrope', **az},
+            )
+
+    # Aralıkta azeotrop yoksa y - x tek işaretlidir; orta noktada bakmak yeterli
+    x_mid = 0.5 * (xB + xD)
+    if vle.y_of_x(x_mid) <= x_mid:
+        raise InfeasibleSpecError(
+            "1. bileşen bu kompozisyon aralığında daha uçucu değil (y < x); bileşen sırasını değiştirin.",
+            {'reason': 'volatility', 'x': x_mid},
+        )
+
+
+def _operating_lines(zF: float, xD: float, xB: float, q: float, R: float) -> Tuple[float, float, float, float, float, float]:
+    """
+    Sabit molal taşma varsayımıyla işletme doğruları:
+    (x_int, y_int, m_r, b_r, m_s, b_s); kesişim q-doğrusu üzerindedir.
+    """
+    m_r = R / (R + 1)
+    b_r = xD / (R + 1)
+
+    if abs(q - 1.0) < 1e-9: # Doygun sıvı besleme: q-doğrusu dikey
+        x_int = zF
+    else:
+        m_q = q / (q - 1)
+        b_q = -zF / (q - 1)
+        denom = (m_q - m_r)
+        if abs(denom) < 1e-9: x_int = zF
+        else: x_int = (b_r - b_q) / denom
+    y_int = m_r * x_int + b_r
+
+    # Soyma doğrusu
+    denom_s = (x_int - xB)
+    if abs(denom_s) < 1e-9: m_s = 0
+    else: m_s = (y_int - xB) / denom_s
+    b_s = y_int - m_s * x_int
+    return x_int, y_int, m_r, b_r, m_s, b_s
+
+
+def check_mccabe_thiele_spec(vle: VLEData, zF: float, xD: float, xB: float, q: float, R: float) -> Dict:
+    """
+    Raf sayımından önce şartnameyi VLE eğrisine karşı tek geçişte denetler:
+    azeotroplar, q-doğrusu kesişimi ve işletme doğrularının denge eğrisine
+    değdiği/kestiği (besleme veya teğet) pinch noktaları. Sağlanamayan
+    şartname için InfeasibleSpecError fırlatır; aksi halde en dar
+    noktanın konumunu ve payını döndürür.
+    """
+    _check_composition_spec(vle, zF, xD, xB)
+    x_int, y_int, m_r, b_r, m_s, b_s = _operating_lines(zF, xD, xB, q, R)
+    if not (xB < x_int < xD):
+        raise InfeasibleSpecError(
+            f"q-doğrusu işletme doğrularını xB-xD aralığı dışında kesiyor (x = {x_int:.3f}).",
+            {'reason': 'spec', 'x': x_int, 'y': y_int},
+        )
+
+    x = np.linspace(xB, xD, _PINCH_GRID)[1:-1]
+    y_op = np.where(x >= x_int, m_r * x + b_r, m_s * x + b_s)
+    margin = vle.y_of_x(x) - y_op
+    i = int(np.argmin(margin))
+    section = 'zenginleştirme' if x[i] >= x_int else 'sıyırma'
+    if margin[i] <= 0:
+        kind = 'besleme' if abs(x[i] - x_int) <= 2 * (x[1] - x[0]) else 'teğet'
+        diagnostic = {'reason': 'pinch', 'kind': kind, 'section': section, 'x': float(x[i]), 'y': float(y_op[i])}
+        try:
+            diagnostic['R_min'] = minimum_reflux(vle, zF, xD, xB, q)['R_min']
+            r_min = f" (R_min ≈ {diagnostic['R_min']:.3f})"
+        except (InfeasibleSpecError, ValueError):
+            r_min = ""
+        raise InfeasibleSpecError(
+            f"R = {R:.3f} için işletme doğrusu denge eğrisine x = {x[i]:.3f} noktasında değiyor "
+            f"({kind} pinch, {section} bölgesi); R < R_min{r_min}. Geri akış oranını artırın.",
+            diagnostic,
+        )
+    return {'pinch_x': float(x[i]), 'margin': float(margin[i]), 'section': section}
+
+
+def check_ponchon_savarit_spec(
+    vle: VLEData, zF: float, xD: float, xB: float, HF: float, Q_prime_D: float, Q_prime_B: float
+) -> Dict:
+    """
+    Ponchon-Savarit için pinch denetimi: zenginleştirme bölgesindeki hiçbir
+    bağ doğrusunun (tie-line) x = xD'deki uzantısı Delta_D'ye ulaşmamalı,
+    sıyırma bölgesindekilerin x = xB'deki uzantısı Delta_B'nin altına
+    inmemelidir. Bölgeler F noktasından geçen bağ doğrusunun sıvı
+    kompozisyonunda ayrılır. Bağ doğruları eğrinin ince (PCHIP) örneği
+    üzerinden vektörel olarak değerlendirilir.
+    """
+    _check_composition_spec(vle, zF, xD, xB)
+
+    fine = vle.resample(_PINCH_GRID).df
+    x = fine['x'].to_numpy()
+    y = fine['y'].to_numpy()
+    dx = y - x
+    valid = np.abs(dx) > 1e-9
+    slope = np.where(valid, (fine['HV'].to_numpy() - fine['HL'].to_numpy()) / np.where(valid, dx, 1.0), 0.0)
+    HL = fine['HL'].to_numpy()
+
+    # F'e en yakın geçen bağ doğrusu (x <= zF <= y olanlar arasından)
+    x_F = zF
+    around = np.nonzero(valid & (x <= zF) & (y >= zF))[0]
+    if len(around):
+        g = HL[around] + slope[around] * (zF - x[around]) - HF
+        x_F = float(x[around[np.argmin(np.abs(g))]])
+
+    rect = valid & (x >= x_F) & (x < xD)
+    strip = valid & (x > xB) & (x <= x_F)
+    if rect.any():
+        H_ext = HL[rect] + slope[rect] * (xD - x[rect])
+        i = int(np.argmax(H_ext))
+        if H_ext[i] >= Q_prime_D:
+            x_p = float(x[rect][i])
+            raise InfeasibleSpecError(
+                f"x = {x_p:.3f} noktasındaki bağ doğrusu Delta_D'nin üzerinden geçiyor "
+                f"(zenginleştirme bölgesi pinch); R < R_min. Geri akış oranını artırın.",
+                {'reason': 'pinch', 'section': 'zenginleştirme', 'x': x_p, 'y': float(y[rect][i])},
+            )
+    margins = {}
+    if rect.any():
+        margins['margin_D'] = float(Q_prime_D - H_ext[i])
+    if strip.any():
+        H_ext = HL[strip] + slope[strip] * (xB - x[strip])
+        i = int(np.argmin(H_ext))
+        margins['margin_B'] = float(H_ext[i] - Q_prime_B)
+        if H_ext[i] <= Q_prime_B:
+            x_p = float(x[strip][i])
+            raise InfeasibleSpecError(
+                f"x = {x_p:.3f} noktasındaki bağ doğrusu Delta_B'nin altından geçiyor "
+                f"(sıyırma bölgesi pinch); R < R_min. Geri akış oranını artırın.",
+                {'reason': 'pinch', 'section': 'sıyırma', 'x': x_p, 'y': float(y[strip][i])},
+            )
+    return margins
+
+
+# ---------------- Shortcut Design (R_min / Fenske / Gilliland) ----------------
+
+# Kısa yol eğrisinin varsayılan R/R_min noktaları
+DEFAULT_R_RATIOS = np.concatenate([np.linspace(1.02, 2.0, 50), np.linspace(2.05, 5.0, 60)])
+
+
+def _q_line_equilibrium(vle: VLEData, zF: float, q: float) -> Tuple[float, float]:
+    """
+    q-doğrusunun denge eğrisini kestiği nokta (x*, y*).
+    h(x) = (q-1)*y(x) - q*x + zF; h(0) = zF > 0, h(1) = zF - 1 < 0.
+    """
+    x_star = optimize.brentq(lambda x: (q - 1) * vle.y_of_x(x) - q * x + zF, 0.0, 1.0, xtol=1e-12)
+    return float(x_star), float(vle.y_of_x(x_star))
+
+
+def minimum_reflux(vle: VLEData, zF: float, xD: float, xB: float, q: float) -> Dict:
+    """
+    Pinch geometrisinden minimum geri akış oranı (sabit molal taşma).
+
+    Zenginleştirme doğrusu [x*, xD) aralığında denge eğrisinin, sıyırma
+    doğrusu (xB, x*] aralığında eğrinin altında kalmalıdır; her iki koşul
+    denge eğrisi ızgarası üzerinde tek vektörel geçişte en dik/en yatık
+    doğru olarak bulunur. Sabit α için Underwood sonucuna eşittir, ayrıca
+    (ör. etanol-su) teğet pinch'leri de yakalar.
+    """
+    _check_composition_spec(vle, zF, xD, xB)
+    x_star, y_star = _q_line_equilibrium(vle, zF, q)
+    if not (xB < x_star < xD):
+        raise InfeasibleSpecError(
+            f"q-doğrusu denge eğrisini xB-xD aralığı dışında kesiyor (x = {x_star:.3f}).",
+            {'reason': 'spec', 'x': x_star, 'y': y_star},
+        )
+
+    # Zenginleştirme: eğim L/V >= max (xD - y) / (xD - x)
+    x_r = np.linspace(x_star, xD, _PINCH_GRID)[:-1]
+    slopes_r = (xD - vle.y_of_x(x_r)) / (xD - x_r)
+    i_r = int(np.argmax(slopes_r))
+    R_rect = slopes_r[i_r] / (1.0 - slopes_r[i_r])
+
+    # Sıyırma: eğim L'/V' <= min (y - xB) / (x - xB); bu doğrunun q-doğrusunu
+    # kestiği noktadan geçen zenginleştirme doğrusu gereken R'yi verir
+    x_s = np.linspace(xB, x_star, _PINCH_GRID)[1:]
+    slopes_s = (vle.y_of_x(x_s) - xB) / (x_s - xB)
+    i_s = int(np.argmin(slopes_s))
+    s = slopes_s[i_s]
+    x_p = (zF + (q - 1) * (xB - s * xB)) / (q - (q - 1) * s)
+    y_p = xB + s * (x_p - xB)
+    m_r = (xD - y_p) / (xD - x_p)
+    R_strip = m_r / (1.0 - m_r)
+
+    if R_rect >= R_strip - 1e-9:
+        i, x_pinch, section = i_r, float(x_r[i_r]), 'zenginleştirme'
+    else:
+        i, x_pinch, section = i_s, float(x_s[i_s]), 'sıyırma'
+    kind = 'besleme' if (section == 'zenginleştirme' and i == 0) or (section == 'sıyırma' and i == len(x_s) - 1) else 'teğet'
+    return {
+        'R_min': float(max(R_rect, R_strip, 0.0)),
+        'x': x_pinch,
+        'y': float(vle.y_of_x(x_pinch)),
+        'kind': kind,
+        'section': section,
+    }
+
+
+def relative_volatility(vle: VLEData, x):
+    """α = y(1-x) / (x(1-y)), denge eğrisi spline'ı üzerinden."""
+    x = np.asarray(x, dtype=float)
+    y = vle.y_of_x(x)
+    return y * (1 - x) / (x * (1 - y))
+
+
+def fenske_min_stages(vle: VLEData, xD: float, xB: float) -> Tuple[float, float]:
+    """
+    Fenske denklemiyle tam geri akışta minimum teorik kademe sayısı.
+    α, tepe ve dip kompozisyonlarındaki değerlerin geometrik ortalamasıdır.
+    Döndürür: (N_min, α_ort)
+    """
+    if not (0.0 < xB < xD < 1.0):
+        raise InfeasibleSpecError(
+            "Fenske için 0 < xB < xD < 1 olmalıdır (saf ürün sonsuz kademe gerektirir).",
+            {'reason': 'spec', 'xD': xD, 'xB': xB},
+        )
+    alpha = float(np.sqrt(np.prod(relative_volatility(vle, [xD, xB]))))
+    if not alpha > 1.0:
+        raise InfeasibleSpecError(
+            f"Ortalama bağıl uçuculuk α = {alpha:.3f} ≤ 1; ayırma mümkün değil.",
+            {'reason': 'volatility', 'alpha': alpha},
+        )
+    N_min = np.log((xD / (1 - xD)) * ((1 - xB) / xB)) / np.log(alpha)
+    return float(N_min), alpha
+
+
+def gilliland_stages(R, R_min: float, N_min: float) -> np.ndarray:
+    """
+    Gilliland korelasyonu (Molokanov biçimi), R dizisi için teorik kademe
+    sayıları: X = (R - R_min)/(R + 1), Y = (N - N_min)/(N + 1).
+    R <= R_min için sonsuz döner.
+    """
+    R = np.asarray(R, dtype=float)
+    X = np.clip((R - R_min) / (R + 1), 0.0, 1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Y = 1 - np.exp((1 + 54.4 * X) / (11 + 117.2 * X) * (X - 1) / np.sqrt(X))
+        N = (Y + N_min) / (1 - Y)
+    return np.where(X > 0, N, np.inf)
+
+
+def calculate_shortcut_design(
+    chem1: str, chem2: str, P: float, zF: float, xD: float, xB: float, q: float,
+    vle: VLEData | None = None, R_ratios=None
+) -> Dict:
+    """
+    Kısa yol kolon tasarımı: pinch geometrisinden R_min, Fenske ile N_min ve
+    Gilliland ile N - R/R_min eğrisinin tamamı (tek vektörel geçiş).
+    Raf sayımı gerektirmez; kullanıcı R'yi seçmeden önce çalıştırılabilir.
+
+    Döndürür: {'R_min', 'N_min', 'alpha', 'pinch': {...}, 'curve': DataFrame(R_ratio, R, N)}
+    """
+    if vle is None:
+        vle = get_vle_data(chem1, chem2, P)
+    if vle.empty:
+        raise ValueError("VLE verisi oluşturulamadı.")
+
+    pinch = minimum_reflux(vle, zF, xD, xB, q)
+    N_min, alpha = fenske_min_stages(vle, xD, xB)
+
+    ratios = DEFAULT_R_RATIOS if R_ratios is None else np.asarray(R_ratios, dtype=float)
+    R = ratios * pinch['R_min']
+    curve = pd.DataFrame({'R_ratio': ratios, 'R': R, 'N': gilliland_stages(R, pinch['R_min'], N_min)})
+    return {'R_min': pinch['R_min'], 'N_min': N_min, 'alpha': alpha, 'pinch': pinch, 'curve': curve}
+
+
 # ---------------- McCabe-Thiele Method ----------------
 
+# Kademe sayımı için üst sınır (ön denetimden geçen ama R_min'e çok yakın şartnameler)
+MAX_STAGES = 500
+
+
+def mccabe_thiele_stages(
+    vle: VLEData, zF: float, xD: float, xB: float, q: float, R: float, max_stages: int = MAX_STAGES
+) -> Dict:
+    """
+    Toplam yoğuşturuculu kolon için McCabe-Thiele kademe profili.
+
+    Her kademede denge eğrisi, monoton (PCHIP) spline üzerinde kök bulma ile
+    tam olarak tersine çevrilir; doğrusal ekstrapolasyon yapılmaz, bu yüzden
+    kaba bir VLE ızgarası da doğru kademe sayısı verir. Son kademe kesirlidir:
+    (x_{N-1} - xB) / (x_{N-1} - x_N).
+
+    Akımlar F = 1 mol temelinde, sabit molal taşma ile verilir. Döndürülen
+    sözlükte kademe başına NumPy dizileri 'x', 'y', 'T', 'L', 'V' (tepeden
+    aşağı, 1. kademe en üstte), kesirli 'n_stages' ve 'feed_stage' bulunur.
+    """
+    check_mccabe_thiele_spec(vle, zF, xD, xB, q, R)
+    x_int, _, m_r, b_r, m_s, b_s = _operating_lines(zF, xD, xB, q, R)
+
+    D = (zF - xB) / (xD - xB)
+    L_r, V_r = R * D, (R + 1) * D
+    L_s, V_s = L_r + q, V_r - (1 - q)
+
+    xs, ys = [], []
+    y_n = xD
+    feed_stage = None
+    while True:
+        x_n = vle.x_of_y(y_n, x_hi=xD)
+        xs.append(x_n)
+        ys.append(y_n)
+        if x_n <= xB:
+            break
+        if len(xs) >= max_stages:
+            raise InfeasibleSpecError(
+                f"{max_stages} kademede xB'ye ulaşılamadı; R, R_min'e çok yakın.",
+                {'reason': 'pinch', 'x': x_n, 'y': y_n},
+            )
+        # Besleme, sıvı kompozisyonu kesişimin altına inen ilk kademeden sonra verilir
+        if x_n >= x_int:
+            y_n = m_r * x_n + b_r
+        else:
+            if feed_stage is None:
+                feed_stage = len(xs)
+            y_n = m_s * x_n + b_s
+
+    x = np.array(xs)
+    y = np.array(ys)
+    n = len(x)
+    x_prev = x[-2] if n > 1 else xD
+    fraction = (x_prev - xB) / (x_prev - x[-1]) if x_prev > x[-1] else 1.0
+    if feed_stage is None:
+        feed_stage = n
+    # Besleme kademesinden inen sıvı sıyırma, çıkan buhar zenginleştirme akımıdır
+    stage = np.arange(1, n + 1)
+    return {
+        'stage': stage,
+        'x': x,
+        'y': y,
+        'T': vle.T_of_x(x),
+        'L': np.where(stage < feed_stage, L_r, L_s),
+        'V': np.where(stage <= feed_stage, V_r, V_s),
+        'n_stages': (n - 1) + float(fraction),
+        'feed_stage': int(feed_stage),
+    }
+
+
 def calculate_mccabe_thiele(
-    chem1: str, chem2: str, P: float, zF: float, xD: float, xB: float, q: float, R: float
+    chem1: str, chem2: str, P: float, zF: float, xD: float, xB: float, q: float, R: float,
+    vle: VLEData | None = None, stages: Dict | None = None
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, int, List[Tuple[float, float]]]:
+    """
+    McCabe-Thiele grafiği ve raf sayısı.
+
+    stages: aynı şartname için önceden hesaplanmış mccabe_thiele_stages
+    çıktısı (verilmezse burada hesaplanır; ön denetim de onun içindedir).
+    """
     
-    # 1. VLE Verisi
-    vle_df = calculate_vle_thermo(chem1, chem2, P)
+    # 1. VLE Verisi (verilmezse paylaşılan önbellekten)
+    if vle is None:
+        vle = get_vle_data(chem1, chem2, P)
+    vle_df = vle.df.copy()
     if vle_df.empty:
         raise ValueError("VLE verisi oluşturulamadı.")
 
-    # 2. İşletme Doğruları
-    m_r = R / (R + 1)
-    b_r = xD / (R + 1)
+    # 2. Ön denetim: azeotrop/pinch varsa raf sayımına girmeden reddedilir
+    if stages is None:
+        stages = mccabe_thiele_stages(vle, zF, xD, xB, q, R)
+
+    # 3. İşletme Doğruları
+    x_int, y_int, m_r, b_r, m_s, b_s = _operating_lines(zF, xD, xB, q, R)
     
-    # q-doğrusu ve kesişim
+    # q-doğrusu çizimi
     if abs(q - 1.0) < 1e-9: # Doygun sıvı besleme
-        x_int = zF
         # q-line dikey
         qx = np.array([zF, zF])
         # y değerini denge eğrisinden bulalım
@@ -203,87 +766,50 @@ def calculate_mccabe_thiele(
     else:
         m_q = q / (q - 1)
         b_q = -zF / (q - 1)
-        
-        denom = (m_q - m_r)
-        if abs(denom) < 1e-9: x_int = zF 
-        else: x_int = (b_r - b_q) / denom
-        
-        # q-line çizimi için noktalar
         # zF'den kesişime kadar
         qx = np.linspace(min(zF, x_int), max(zF, x_int), 10)
         qy = m_q * qx + b_q
-
-    y_int = m_r * x_int + b_r
-    
-    # Soyma doğrusu
-    denom_s = (x_int - xB)
-    if abs(denom_s) < 1e-9: m_s = 0
-    else: m_s = (y_int - xB) / denom_s
-    b_s = y_int - m_s * x_int
     
     # DataFrame'ler (Grafik için)
     rect_df = pd.DataFrame({'x': [x_int, xD], 'y': [y_int, xD]})
     strip_df = pd.DataFrame({'x': [xB, x_int], 'y': [xB, y_int]})
     q_df = pd.DataFrame({'x': qx, 'y': qy})
     
-    # 3. Raf Sayımı (Stepping)
-    steps = []
-    x_curr, y_curr = xD, xD
-    steps.append((x_curr, y_curr))
-    
-    trays = 0
-    max_trays = 100
-    
-    # İnterpolasyon fonksiyonu
-    eq_interp = interp1d(vle_df['y'], vle_df['x'], kind='linear', fill_value='extrapolate') # y -> x (ters)
-    
-    while x_curr > xB and trays < max_trays:
-        # 1. Dengeye git (Yatay: y sabit, x değişir)
-        # y_curr değerine karşılık gelen x dengesi
-        try:
-            x_eq = float(eq_interp(y_curr))
-        except:
-            break
-            
-        steps.append((x_eq, y_curr))
-        x_curr = x_eq
-        trays += 1
-        
-        if x_curr <= xB:
-            break
-            
-        # 2. İşletme doğrusuna git (Dikey: x sabit, y değişir)
-        if x_curr >= x_int:
-            y_op = m_r * x_curr + b_r
-        else:
-            y_op = m_s * x_curr + b_s
-            
-        steps.append((x_curr, y_op))
-        y_curr = y_op
-        
+    # 4. Raf Sayımı (Stepping): kademe profilinden merdiven noktaları
+    steps = [(xD, xD)]
+    for i, (x_n, y_n) in enumerate(zip(stages['x'], stages['y'])):
+        if i > 0:
+            steps.append((float(stages['x'][i - 1]), float(y_n)))
+        steps.append((float(x_n), float(y_n)))
+
+    # Kesirli son kademe tam kademeye yuvarlanır (stages['n_stages'] kesirli değerdir)
+    trays = int(np.ceil(stages['n_stages'] - 1e-9))
     return vle_df, q_df, rect_df, strip_df, trays, steps
 
 
 # ---------------- Ponchon-Savarit Method ----------------
 
 def calculate_ponchon_savarit(
-    chem1: str, chem2: str, P: float, zF: float, xD: float, xB: float, q: float, R: float
+    chem1: str, chem2: str, P: float, zF: float, xD: float, xB: float, q: float, R: float,
+    vle: VLEData | None = None
 ) -> Tuple[pd.DataFrame, Dict, int, List[Tuple[float, float]]]:
     
-    # 1. VLE ve Entalpi Verisi
-    df = calculate_vle_thermo(chem1, chem2, P)
+    # 1. VLE ve Entalpi Verisi (verilmezse paylaşılan önbellekten)
+    if vle is None:
+        vle = get_vle_data(chem1, chem2, P)
+    df = vle.df.copy()
     if df.empty:
         raise ValueError("Veri oluşturulamadı.")
         
     # İnterpolasyonlar
     # x -> HL, y -> HV, y -> x (denge), x -> y (denge)
     # Denge verileri (x-y)
-    f_y_vs_x = interp1d(df['x'], df['y'], kind='linear', fill_value='extrapolate')
-    f_x_vs_y = interp1d(df['y'], df['x'], kind='linear', fill_value='extrapolate')
+    f_y_vs_x = interpolate.interp1d(df['x'], df['y'], kind='linear', fill_value='extrapolate')
+    f_x_vs_y = interpolate.interp1d(df['y'], df['x'], kind='linear', fill_value='extrapolate')
     
     # Entalpi verileri
-    f_HL_vs_x = interp1d(df['x'], df['HL'], kind='linear', fill_value='extrapolate')
-    f_HV_vs_y = interp1d(df['y'], df['HV'], kind='linear', fill_value='extrapolate') # Dikkat: HV y'ye bağlı
+    f_HL_vs_x = interpolate.interp1d(df['x'], df['HL'], kind='linear', fill_value='extrapolate')
+    f_HV_vs_y = interpolate.interp1d(df['y'], df['HV'], kind='linear', fill_value='extrapolate') # Dikkat: HV y'ye bağlı
     
     # 2. Delta Noktalarının Belirlenmesi
     
@@ -352,6 +878,9 @@ def calculate_ponchon_savarit(
         slope = (Q_prime_D - HF) / (xD - zF)
         Q_prime_B = slope * (xB - zF) + HF
         
+    # Ön denetim: azeotrop veya bağ doğrusu pinch'i varsa adımlamaya girilmez
+    check_ponchon_savarit_spec(vle, zF, xD, xB, HF, Q_prime_D, Q_prime_B)
+
     points = {
         'F': (zF, HF),
         'D': (xD, hD),
@@ -429,7 +958,7 @@ def calculate_ponchon_savarit(
             try:
                 # Bir sonraki y, current_x'ten küçük olmalı (aşağı iniyoruz)
                 # Ancak denge eğrisi üzerinde arıyoruz.
-                next_y = fsolve(op_error, current_x)[0]
+                next_y = optimize.fsolve(op_error, current_x)[0]
             except:
                 separation_possible = False
                 break
@@ -1,9 +1,14 @@
-import pandas as pd
-from thermo import Chemical
-from pint import UnitRegistry
+from __future__ import annotations
 
-ureg = UnitRegistry()
-Q_ = ureg.Quantity
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from src.calculators.lazy import lazy_import
+from src.calculators.property_cache import get_chemical
+from src.calculators.unit_plans import ConversionPlan, get_plan
+
+pd = lazy_import("pandas")
 
 # Yaygın kimyasallar ve Türkçe karşılıkları
 CHEMICAL_TRANSLATIONS = {
@@ -46,191 +51,375 @@ def get_chemical_list():
     """Kimyasal listesini (İngilizce Key, Türkçe Value) döndürür."""
     return CHEMICAL_TRANSLATIONS
 
-def calculate_properties(chemical_name, temperature_input, pressure_input, unit_system, selected_properties_keys, manual_units=None):
+# Özellik anahtarı -> (SI birimi, birim sistemi -> (hedef birim, görüntülenen birim))
+# thermo değerleri SI döner. Yeni özellik veya birim sistemi yalnızca bu tabloya eklenir.
+PROPERTY_UNITS = {
+    'rho': ('kg/m**3', {
+        "SI": ('kg/m**3', 'kg/m³'), "Metric (CGS)": ('g/cm**3', 'g/cm³'), "English": ('lb/ft**3', 'lb/ft³')}),
+    'mu': ('Pa*s', {
+        "SI": ('Pa*s', 'Pa·s'), "Metric (CGS)": ('cP', 'cP'), "English": ('lb/(ft*s)', 'lb/(ft·s)')}),
+    'Cp': ('J/(kg*K)', {
+        "SI": ('J/(kg*K)', 'J/(kg·K)'), "Metric (CGS)": ('kJ/(kg*K)', 'kJ/(kg·K)'),
+        "English": ('Btu/(lb*degF)', 'Btu/(lb·°F)')}),
+    'Psat': ('Pa', {
+        "SI": ('Pa', 'Pa'), "Metric (CGS)": ('bar', 'bar'), "English": ('psi', 'psia')}),
+    'sigma': ('N/m', {
+        "SI": ('N/m', 'N/m'), "Metric (CGS)": ('mN/m', 'mN/m'), "English": ('lbf/ft', 'lbf/ft')}),
+    'k': ('W/(m*K)', {
+        "SI": ('W/(m*K)', 'W/(m·K)'), "Metric (CGS)": ('W/(m*K)', 'W/(m·K)'),
+        "English": ('Btu/(hr*ft*degF)', 'Btu/(hr·ft·°F)')}),
+    'Tb': ('K', {
+        "SI": ('K', 'K'), "Metric (CGS)": ('degC', '°C'), "English": ('degF', '°F')}),
+    'Tm': ('K', {
+        "SI": ('K', 'K'), "Metric (CGS)": ('degC', '°C'), "English": ('degF', '°F')}),
+}
+
+# Birim sistemi -> (sıcaklık, basınç) girdi birimleri
+INPUT_UNITS = {
+    "SI": ('kelvin', 'pascal'),
+    "Metric (CGS)": ('degC', 'bar'),
+    "English": ('degF', 'psi'),
+}
+
+_IDENTITY = ConversionPlan(1.0)
+
+
+def _input_units(unit_system, manual_units=None):
+    """Sıcaklık ve basınç girdilerinin birimleri; tanımsız sistemler SI kabul edilir."""
+    if unit_system == "Manual" and manual_units:
+        return manual_units.get('T', 'kelvin'), manual_units.get('P', 'pascal')
+    return INPUT_UNITS.get(unit_system, INPUT_UNITS["SI"])
+
+
+def display_conversion(prop_key, unit_system, manual_units=None):
     """
-    Verilen kimyasal, sıcaklık, basınç ve birim sistemine göre
-    seçilen termodinamik özellikleri hesaplar ve bir DataFrame olarak döndürür.
-    
-    manual_units: {'T': 'degC', 'P': 'bar', 'rho': 'kg/m**3', ...} gibi sözlük
+    SI özellik değerini görüntüleme birimine çeviren plan ve birim etiketi.
+
+    Dönen plan skaler ve NumPy dizilerine aynı şekilde uygulanır; çarpan/ofset
+    (SI birimi, hedef birim) çifti başına bir kez hesaplanır. Manuel sistemde
+    hedef birim verilmemişse değer SI olarak bırakılır.
+    """
+    si_unit, targets = PROPERTY_UNITS[prop_key]
+    if unit_system == "Manual" and manual_units:
+        target = manual_units.get(prop_key)
+        if not target:
+            return _IDENTITY, "(SI)"
+        return get_plan(si_unit, target), target
+    if unit_system not in targets:
+        return _IDENTITY, "-"
+    target, label = targets[unit_system]
+    return get_plan(si_unit, target), label
+
+
+# Görüntülenen özellik adı -> thermo Chemical özniteliği
+PROPERTY_OPTIONS = {
+    "Yoğunluk (rho)": "rho",
+    "Viskozite (mu)": "mu",
+    "Isı Kapasitesi (Cp)": "Cp",
+    "Buhar Basıncı (Psat)": "Psat",
+    "Yüzey Gerilimi (sigma)": "sigma",
+    "Isıl İletkenlik (k)": "k",
+    "Kaynama Noktası (Tb)": "Tb",
+    "Donma Noktası (Tm)": "Tm"
+}
+
+
+def _property_values(chemical_name, temperature_input, pressure_input, unit_system, selected_properties_keys, manual_units=None):
+    """
+    Seçilen özellikleri görüntüleme biriminde hesaplar.
+
+    (satırlar, formül) döndürür; satırlar (özellik adı, değer, birim) üçlüleridir.
+    Hesaplanamayan özelliklerde değer bir durum mesajıdır (str). Girdi veya
+    kimyasal hataları ValueError olarak yükseltilir.
     """
-    property_options = {
-        "Yoğunluk (rho)": "rho",
-        "Viskozite (mu)": "mu",
-        "Isı Kapasitesi (Cp)": "Cp",
-        "Buhar Basıncı (Psat)": "Psat",
-        "Yüzey Gerilimi (sigma)": "sigma",
-        "Isıl İletkenlik (k)": "k",
-        "Kaynama Noktası (Tb)": "Tb",
-        "Donma Noktası (Tm)": "Tm"
-    }
-    
     # Girdi birimlerini SI'ya (Kelvin, Pascal) çevirme
     try:
-        if unit_system == "Metric (CGS)":
-            T_si = Q_(temperature_input, "degC").to("kelvin").magnitude
-            P_si = Q_(pressure_input, "bar").to("pascal").magnitude
-        elif unit_system == "English":
-            T_si = Q_(temperature_input, "degF").to("kelvin").magnitude
-            P_si = Q_(pressure_input, "psi").to("pascal").magnitude
-        elif unit_system == "Manual" and manual_units:
-            T_si = Q_(temperature_input, manual_units.get('T', 'kelvin')).to("kelvin").magnitude
-            P_si = Q_(pressure_input, manual_units.get('P', 'pascal')).to("pascal").magnitude
-        else: # SI
-            T_si = temperature_input
-            P_si = pressure_input
+        T_unit, P_unit = _input_units(unit_system, manual_units)
+        T_si = get_plan(T_unit, 'kelvin')(temperature_input)
+        P_si = get_plan(P_unit, 'pascal')(pressure_input)
     except Exception as e:
-        return pd.DataFrame([{"Özellik": "Hata", "Değer": f"Birim çevirme hatası: {e}", "Birim": "-"}]), ""
+        raise ValueError(f"Birim çevirme hatası: {e}")
 
     if T_si <= 0:
-        return pd.DataFrame([{"Özellik": "Hata", "Değer": "Sıcaklık 0 Kelvin'den büyük olmalıdır.", "Birim": "-"}]), ""
+        raise ValueError("Sıcaklık 0 Kelvin'den büyük olmalıdır.")
     if P_si <= 0:
-        return pd.DataFrame([{"Özellik": "Hata", "Değer": "Basınç 0 Pascal'dan büyük olmalıdır.", "Birim": "-"}]), ""
+        raise ValueError("Basınç 0 Pascal'dan büyük olmalıdır.")
 
     try:
-        chem = Chemical(chemical_name, T=T_si, P=P_si)
+        chem = get_chemical(chemical_name, T=T_si, P=P_si)
     except Exception as e:
-        return pd.DataFrame([{"Özellik": "Hata", "Değer": f"Kimyasal bulunamadı veya hata: {str(e)}", "Birim": "-"}]), ""
-    
-    results = []
+        raise ValueError(f"Kimyasal bulunamadı veya hata: {str(e)}")
+
+    rows = []
     for prop_name in selected_properties_keys:
-        prop_key = property_options[prop_name]
+        prop_key = PROPERTY_OPTIONS[prop_name]
         value = getattr(chem, prop_key, None)
 
-        if value is not None:
-            # SI değerleri (thermo kütüphanesi SI döner)
-            # rho: kg/m3, mu: Pa*s, Cp: J/kg/K, Psat: Pa, sigma: N/m, k: W/m/K, Tb: K, Tm: K
-            
-            unit_str = ""
-            display_value = ""
-            
-            try:
-                # Hedef birime çevirme
-                if unit_system == "SI":
-                    if prop_key in ['Tb', 'Tm']: unit_str = 'K'
-                    elif prop_key in ['Psat']: unit_str = 'Pa'
-                    elif prop_key == 'rho': unit_str = 'kg/m³'
-                    elif prop_key == 'mu': unit_str = 'Pa·s'
-                    elif prop_key == 'Cp': unit_str = 'J/(kg·K)'
-                    elif prop_key == 'sigma': unit_str = 'N/m'
-                    elif prop_key == 'k': unit_str = 'W/(m·K)'
-                    val_conv = value
-                    
-                elif unit_system == "Metric (CGS)":
-                    if prop_key in ['Tb', 'Tm']: 
-                        val_conv = Q_(value, 'kelvin').to('degC').magnitude; unit_str = '°C'
-                    elif prop_key in ['Psat']: 
-                        val_conv = Q_(value, 'pascal').to('bar').magnitude; unit_str = 'bar'
-                    elif prop_key == 'rho': 
-                        val_conv = Q_(value, 'kg/m**3').to('g/cm**3').magnitude; unit_str = 'g/cm³'
-                    elif prop_key == 'mu': 
-                        val_conv = Q_(value, 'pascal*second').to('centipoise').magnitude; unit_str = 'cP'
-                    elif prop_key == 'Cp': 
-                        val_conv = Q_(value, 'joule/(kg*kelvin)').to('kJ/(kg*kelvin)').magnitude; unit_str = 'kJ/(kg·K)'
-                    elif prop_key == 'sigma': 
-                        val_conv = Q_(value, 'newton/meter').to('millinewton/meter').magnitude; unit_str = 'mN/m'
-                    elif prop_key == 'k': 
-                        val_conv = value; unit_str = 'W/(m·K)'
-
-                elif unit_system == "English":
-                    if prop_key in ['Tb', 'Tm']: 
-                        val_conv = Q_(value, 'kelvin').to('degF').magnitude; unit_str = '°F'
-                    elif prop_key in ['Psat']: 
-                        val_conv = Q_(value, 'pascal').to('psi').magnitude; unit_str = 'psia'
-                    elif prop_key == 'rho': 
-                        val_conv = Q_(value, 'kg/m**3').to('lb/ft**3').magnitude; unit_str = 'lb/ft³'
-                    elif prop_key == 'mu': 
-                        val_conv = Q_(value, 'pascal*second').to('lb/(ft*s)').magnitude; unit_str = 'lb/(ft·s)'
-                    elif prop_key == 'Cp': 
-                        val_conv = Q_(value, 'joule/(kg*kelvin)').to('btu/(lb*degF)').magnitude; unit_str = 'Btu/(lb·°F)'
-                    elif prop_key == 'sigma': 
-                        val_conv = Q_(value, 'newton/meter').to('lbf/ft').magnitude; unit_str = 'lbf/ft'
-                    elif prop_key == 'k': 
-                        val_conv = Q_(value, 'watt/(meter*kelvin)').to('btu/(hour*ft*degF)').magnitude; unit_str = 'Btu/(hr·ft·°F)'
-                
-                elif unit_system == "Manual" and manual_units:
-                    # Manuel çevirim
-                    target_unit = manual_units.get(prop_key, None)
-                    if target_unit:
-                        # Kaynak birimler (SI)
-                        src_units = {
-                            'rho': 'kg/m**3', 'mu': 'pascal*second', 'Cp': 'joule/(kg*kelvin)',
-                            'Psat': 'pascal', 'sigma': 'newton/meter', 'k': 'watt/(meter*kelvin)',
-                            'Tb': 'kelvin', 'Tm': 'kelvin'
-                        }
-                        src = src_units.get(prop_key)
-                        if src:
-                            val_conv = Q_(value, src).to(target_unit).magnitude
-                            unit_str = target_unit
-                        else:
-                            val_conv = value; unit_str = "-"
-                    else:
-                        val_conv = value; unit_str = "(SI)"
-                
-                else:
-                    val_conv = value; unit_str = "-"
-
-                display_value = f"{val_conv:.4g}"
-            except Exception as e:
-                display_value = "Çevrim Hatası"
-                unit_str = str(e)
-
-            results.append({"Özellik": prop_name, "Değer": display_value, "Birim": unit_str})
-        else:
-            results.append({"Özellik": prop_name, "Değer": "Hesaplanamadı", "Birim": "-"})
+        if value is None:
+            rows.append((prop_name, "Hesaplanamadı", "-"))
+            continue
+        try:
+            # thermo SI döner; hedef birime önceden hesaplanmış plan ile çevrilir
+            plan, unit_str = display_conversion(prop_key, unit_system, manual_units)
+            rows.append((prop_name, float(plan(value)), unit_str))
+        except Exception as e:
+            rows.append((prop_name, "Çevrim Hatası", str(e)))
+    return rows, chem.formula
+
+
+def calculate_properties(chemical_name, temperature_input, pressure_input, unit_system, selected_properties_keys, manual_units=None):
+    """
+    Verilen kimyasal, sıcaklık, basınç ve birim sistemine göre
+    seçilen termodinamik özellikleri hesaplar ve bir DataFrame olarak döndürür.
     
-    return pd.DataFrame(results), chem.formula
+    manual_units: {'T': 'degC', 'P': 'bar', 'rho': 'kg/m**3', ...} gibi sözlük
+    """
+    try:
+        rows, formula = _property_values(
+            chemical_name, temperature_input, pressure_input, unit_system, selected_properties_keys, manual_units
+        )
+    except ValueError as e:
+        return pd.DataFrame([{"Özellik": "Hata", "Değer": str(e), "Birim": "-"}]), ""
+
+    results = [
+        {"Özellik": name, "Değer": value if isinstance(value, str) else f"{value:.4g}", "Birim": unit}
+        for name, value, unit in rows
+    ]
+    return pd.DataFrame(results), formula
+
+
+# ---------------- Çoklu Kimyasal Tablosu ----------------
+
+# Bu sayıdan az (kimyasal, durum) çifti seri hesaplanır (süreç başlatma maliyeti)
+_BATCH_POOL_MIN = 8
+
+
+def _property_batch_row(task) -> dict:
+    """Süreç havuzu işçisi: tek (kimyasal, T, P) için geniş tablo satırı."""
+    chemical_name, T, P, unit_system, selected_properties_keys, manual_units = task
+    row = {"Kimyasal": chemical_name, "Formül": "", "T": T, "P": P}
+    row.update({name: np.nan for name in selected_properties_keys})
+    row["Hata"] = None
+    try:
+        rows, row["Formül"] = _property_values(chemical_name, T, P, unit_system, selected_properties_keys, manual_units)
+    except Exception as e:
+        row["Hata"] = str(e)
+        return row
+
+    errors = []
+    for name, value, unit in rows:
+        if isinstance(value, str):
+            errors.append(f"{name}: {value}")
+        else:
+            row[name] = value
+    if errors:
+        row["Hata"] = "; ".join(errors)
+    return row
+
+
+def iter_property_batch(chemicals, states, unit_system, selected_properties_keys, manual_units=None, max_workers=None):
+    """
+    Her kimyasal ve her (T, P) durumu için özellikleri hesaplar; (sıra, satır)
+    çiftlerini tamamlandıkça üretir (sıra, kimyasal-öncelikli giriş sırasıdır).
+
+    thermo'da Chemical kurulumu CPU'ya bağlı ve GIL altında olduğundan çiftler
+    süreç havuzuna dağıtılır; çift sayısı _BATCH_POOL_MIN'den azsa veya
+    max_workers=1 ise seri hesaplanır. Satır biçimi için calculate_property_batch.
+    """
+    tasks = [
+        (chemical, T, P, unit_system, tuple(selected_properties_keys), manual_units)
+        for chemical in chemicals for T, P in states
+    ]
+    done = set()
+    if max_workers != 1 and len(tasks) >= _BATCH_POOL_MIN:
+        try:
+            # Streamlit sunucusu çok iş parçacıklıdır; fork, çocukta kilitli kalmış
+            # (import, logging) kilitleri devralabilir. spawn ile işçiler temiz başlar.
+            pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        except OSError:
+            pool = None
+        if pool is not None:
+            try:
+                futures = {pool.submit(_property_batch_row, task): i for i, task in enumerate(tasks)}
+                for future in as_completed(futures):
+                    row = future.result()
+                    done.add(futures[future])
+                    yield futures[future], row
+            except (OSError, BrokenProcessPool):
+                # Süreç başlatılamadı (kısıtlı ortam): kalanlar seri hesaplanır
+                pass
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    for i, task in enumerate(tasks):
+        if i not in done:
+            yield i, _property_batch_row(task)
+
+
+def property_batch_columns(unit_system, selected_properties_keys, manual_units=None) -> dict:
+    """Geniş tablo sütunlarının birimli başlıkları (ham sütun adı -> başlık)."""
+    T_unit, P_unit = _input_units(unit_system, manual_units)
+    columns = {"T": f"Sıcaklık [{T_unit}]", "P": f"Basınç [{P_unit}]"}
+    for name in selected_properties_keys:
+        try:
+            _, unit = display_conversion(PROPERTY_OPTIONS[name], unit_system, manual_units)
+        except Exception:
+            unit = "?"
+        columns[name] = f"{name} [{unit}]"
+    return columns
+
+
+def calculate_property_batch(chemicals, states, unit_system, selected_properties_keys, manual_units=None, max_workers=None) -> pd.DataFrame:
+    """
+    Çoklu kimyasal karşılaştırma tablosu.
+
+    chemicals: kimyasal isimleri; states: girdi biriminde (T, P) çiftleri.
+    Her (kimyasal, durum) için bir satır ve her özellik için bir sayısal sütun
+    içeren geniş DataFrame döndürür (görüntüleme biriminde, başlıkta birim).
+    Hesaplanamayan değerler NaN olur, nedeni "Hata" sütununa yazılır.
+    """
+    rows = dict(iter_property_batch(chemicals, states, unit_system, selected_properties_keys, manual_units, max_workers))
+    df = pd.DataFrame([rows[i] for i in sorted(rows)],
+                      columns=["Kimyasal", "Formül", "T", "P", *selected_properties_keys, "Hata"])
+    return df.rename(columns=property_batch_columns(unit_system, selected_properties_keys, manual_units))
+
+# Özellik anahtarı -> faz -> (thermo nesnesi, dönüşüm tipi)
+# '*': fazdan bağımsız; 'Vm': molar hacim -> yoğunluk; 'molar': J/mol/K -> J/kg/K
+_CURVE_SOURCES = {
+    'Psat': {'*': ('VaporPressure', None)},
+    'sigma': {'*': ('SurfaceTension', None)},
+    'rho': {'s': ('VolumeSolid', 'Vm'), 'l': ('VolumeLiquid', 'Vm'), 'g': ('VolumeGas', 'Vm')},
+    'mu': {'l': ('ViscosityLiquid', None), 'g': ('ViscosityGas', None)},
+    'Cp': {'s': ('HeatCapacitySolid', 'molar'), 'l': ('HeatCapacityLiquid', 'molar'), 'g': ('HeatCapacityGas', 'molar')},
+    'k': {'s': ('ThermalConductivitySolid', None), 'l': ('ThermalConductivityLiquid', None), 'g': ('ThermalConductivityGas', None)},
+}
+
 
-def generate_plot_data(chemical_name, pressure_input, unit_system, prop_key, temp_min, temp_max, manual_units=None):
+class PropertyCurve:
+    """
+    Bir kimyasalın tek bir özelliğini sabit basınçta sıcaklık dizisi üzerinde hesaplar.
+
+    Kimyasal ve thermo'nun seçtiği sıcaklık bağımlı yöntem (VaporPressure,
+    ViscosityLiquid, HeatCapacityLiquid vb.) bir kez çözümlenir; her sıcaklık
+    için yeni Chemical nesnesi oluşturulmaz. Faz (katı/sıvı/gaz) Chemical ile
+    aynı kurala göre (Tm, Tc, Psat) dizi üzerinde belirlenir.
+
+    Not: Yoğun fazlar ve gaz taşınım özellikleri için basınç düzeltmesi
+    yapılmaz (düşük basınç/doyma korelasyonu); gaz yoğunluğu P ile hesaplanır.
+    """
+
+    def __init__(self, chemical_name: str, prop_key: str, P: float):
+        if prop_key not in _CURVE_SOURCES and prop_key not in ('Tb', 'Tm'):
+            raise ValueError(f"Eğri modu '{prop_key}' özelliğini desteklemiyor.")
+        self.chem = get_chemical(chemical_name)
+        self.prop_key = prop_key
+        self.P = P
+        self.sources = {
+            phase: (getattr(self.chem, attr), conv)
+            for phase, (attr, conv) in _CURVE_SOURCES.get(prop_key, {}).items()
+        }
+
+    @staticmethod
+    def _evaluate(func, T: np.ndarray) -> np.ndarray:
+        # thermo korelasyon nesneleri skaler çalışır; None -> NaN
+        out = np.full(T.shape, np.nan)
+        for i, t in enumerate(T):
+            try:
+                v = func(t)
+            except Exception:
+                v = None
+            if v is not None:
+                out[i] = v
+        return out
+
+    def saturation_pressure(self, T: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+        """Psat (Pa) dizisi; yalnızca mask noktalarında hesaplanır, diğerleri NaN."""
+        if mask is None:
+            mask = T > 0
+        psat = np.full(T.shape, np.nan)
+        psat[mask] = self._evaluate(self.chem.VaporPressure.T_dependent_property, T[mask])
+        return psat
+
+    def phases(self, T: np.ndarray, psat: np.ndarray | None = None) -> np.ndarray:
+        """
+        Her sıcaklık için faz ('s', 'l', 'g') dizisi. psat (aynı T için
+        hesaplanmış Psat) verilirse yeniden hesaplanmaz; verilmezse yalnızca
+        faz kararının Psat'a bağlı olduğu Tm < T < Tc noktalarında hesaplanır.
+        """
+        chem = self.chem
+        if psat is None:
+            need = T > 0
+            if chem.Tc:
+                need &= T < chem.Tc
+            if chem.Tm:
+                need &= T > chem.Tm
+            psat = self.saturation_pressure(T, need)
+        phase = np.where(psat >= self.P, 'g', 'l')
+        if chem.Tc:
+            phase = np.where(T >= chem.Tc, 'g', phase)
+        if chem.Tm:
+            phase = np.where(T <= chem.Tm, 's', phase)
+        return phase
+
+    def __call__(self, T) -> np.ndarray:
+        """SI biriminde özellik değerleri; hesaplanamayan noktalar NaN."""
+        T = np.asarray(T, dtype=float)
+        if self.prop_key in ('Tb', 'Tm'):
+            value = getattr(self.chem, self.prop_key)
+            return np.full(T.shape, np.nan if value is None else value)
+
+        values = np.full(T.shape, np.nan)
+        valid = T > 0
+        if self.prop_key == 'Psat':
+            return self.saturation_pressure(T, valid)
+        if '*' in self.sources:
+            obj, _ = self.sources['*']
+            values[valid] = self._evaluate(obj.T_dependent_property, T[valid])
+            return values
+
+        phase = self.phases(np.where(valid, T, 1.0))
+        MW = self.chem.MW
+        for ph, (obj, conv) in self.sources.items():
+            mask = valid & (phase == ph)
+            if not mask.any():
+                continue
+            if ph == 'g' and conv == 'Vm':
+                v = self._evaluate(lambda t: obj(t, self.P), T[mask])
+            else:
+                v = self._evaluate(obj.T_dependent_property, T[mask])
+            if conv == 'Vm':
+                v = 1e-3 * MW / v
+            elif conv == 'molar':
+                v = v * 1000.0 / MW
+            values[mask] = v
+        return values
+
+
+def generate_plot_data(chemical_name, pressure_input, unit_system, prop_key, temp_min, temp_max, manual_units=None, step=5.0):
     """
     Belirli bir özellik için sıcaklığa karşı bir veri seti oluşturur.
+
+    step: sıcaklık çözünürlüğü (girdi biriminde). Özellik eğrisi (PropertyCurve)
+    bir kez çözümlendiği için küçük adımlar orantılı yavaşlama getirmez.
+    Özellik hesaplanamazsa veya birim çevrilemezse ValueError yükseltir.
     """
-    if temp_min >= temp_max:
+    if temp_min >= temp_max or step <= 0:
          return pd.DataFrame() 
 
-    temps = pd.to_numeric(pd.Series(range(int(temp_min), int(temp_max), 5)))
+    temps = np.arange(temp_min, temp_max, step)
     
     # Basınç ve Sıcaklık SI (Pa, K) dönüşümü
-    if unit_system == "Metric (CGS)":
-        P_si = Q_(pressure_input, "bar").to("pascal").magnitude
-        temps_k = Q_(temps.values, "degC").to("kelvin").magnitude
-    elif unit_system == "English":
-        P_si = Q_(pressure_input, "psi").to("pascal").magnitude
-        temps_k = Q_(temps.values, "degF").to("kelvin").magnitude
-    elif unit_system == "Manual" and manual_units:
-        P_si = Q_(pressure_input, manual_units.get('P', 'pascal')).to("pascal").magnitude
-        t_unit = manual_units.get('T', 'kelvin')
-        temps_k = Q_(temps.values, t_unit).to("kelvin").magnitude
-    else: # SI
-        P_si = pressure_input
-        temps_k = temps.values
-
-    prop_values = []
-    for t_k in temps_k:
-        try:
-            if t_k <= 0: 
-                prop_values.append(None)
-                continue
-            chem = Chemical(chemical_name, T=t_k, P=P_si)
-            value = getattr(chem, prop_key, None)
-            
-            # Değeri grafikte gösterilecek birime çevir (Manuel birim seçildiyse)
-            if value is not None and unit_system == "Manual" and manual_units:
-                 target_unit = manual_units.get(prop_key)
-                 if target_unit:
-                     src_units = {
-                        'rho': 'kg/m**3', 'mu': 'pascal*second', 'Cp': 'joule/(kg*kelvin)',
-                        'Psat': 'pascal', 'sigma': 'newton/meter', 'k': 'watt/(meter*kelvin)',
-                        'Tb': 'kelvin', 'Tm': 'kelvin'
-                     }
-                     src = src_units.get(prop_key)
-                     if src:
-                         value = Q_(value, src).to(target_unit).magnitude
-
-            prop_values.append(value)
-        except Exception as e:
-            # Hata durumunda None ekle ama hatayı da görebilmek için print edebiliriz
-            print(f"Error for T={t_k}: {e}")
-            prop_values.append(None)
+    T_unit, P_unit = _input_units(unit_system, manual_units)
+    P_si = get_plan(P_unit, 'pascal')(pressure_input)
+    temps_k = get_plan(T_unit, 'kelvin')(temps)
+
+    # Değer tablo ile aynı görüntüleme birimine çevrilir
+    try:
+        prop_values = PropertyCurve(chemical_name, prop_key, P_si)(temps_k)
+        plan, _ = display_conversion(prop_key, unit_system, manual_units)
+        prop_values = plan(prop_values)
+    except Exception as e:
+        raise ValueError(f"{chemical_name} için '{prop_key}' eğrisi hesaplanamadı: {e}") from e
 
     df = pd.DataFrame({
         'Sıcaklık': temps,
@@ -1,6 +1,8 @@
-from pint import UnitRegistry, UndefinedUnitError
+from src.calculators.lazy import lazy_import
+from src.calculators.unit_plans import convert, conversion_plan_stats
+
+pint = lazy_import("pint")
 
-ureg = UnitRegistry()
 
 # Kimya mühendisliğinde sık kullanılan birimler
 UNIT_CATEGORIES = {
@@ -228,10 +230,9 @@ def convert_units(value, from_unit, to_unit):
     to_unit_eng = UNIT_ALIASES.get(to_unit_norm, to_unit_norm)
 
     try:
-        val = value * ureg(from_unit_eng)
-        result = val.to(to_unit_eng)
-        return result.magnitude, None
-    except UndefinedUnitError as e:
+        # Plan (from, to) başına bir kez kurulur; sıcaklıklar afin yoldan çevrilir
+        return convert(value, from_unit_eng, to_unit_eng), None
+    except pint.UndefinedUnitError as e:
         return None, f"Tanımsız birim: {e}"
     except Exception as e:
         # Daha detaylı bir hata mesajı döndür
@@ -0,0 +1,107 @@
+import threading
+from src.calculators.unit_registry import get_ureg
+
+
+class ConversionPlan:
+    """
+    (from_unit, to_unit) çifti için önceden hesaplanmış çevrim: y = x * factor + offset.
+
+    Çarpımsal birimlerde offset 0'dır; sıcaklık gibi ofsetli birimlerde
+    (degC, degF) afin yol kullanılır. Skaler ve NumPy dizileri ile çalışır.
+    """
+
+    __slots__ = ("factor", "offset")
+
+    def __init__(self, factor: float, offset: float = 0.0):
+        self.factor = factor
+        self.offset = offset
+
+    @property
+    def is_affine(self) -> bool:
+        return self.offset != 0.0
+
+    def __call__(self, value):
+        if self.offset:
+            return value * self.factor + self.offset
+        return value * self.factor
+
+
+class ConversionPlanCache:
+    """
+    Birim dizgilerini (from_unit, to_unit) başına bir kez ayrıştırıp çevrim
+    planını saklayan önbellek. Birim kümesi sınırlı olduğundan boyut sınırı
+    yoktur. Streamlit'in iş parçacıklarından güvenle kullanılabilir.
+
+    `ureg` verilmezse paylaşılan registry ilk plan kurulurken kullanılır.
+    """
+
+    def __init__(self, ureg=None):
+        self._ureg = ureg
+        self._plans = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _build(self, from_unit: str, to_unit: str) -> ConversionPlan:
+        ureg = self._ureg if self._ureg is not None else get_ureg()
+        Q_ = ureg.Quantity
+        offset = float(Q_(0.0, from_unit).to(to_unit).magnitude)
+        factor = float(Q_(1.0, from_unit).to(to_unit).magnitude) - offset
+        # Doğrusal olmayan (ör. logaritmik) birimler plan ile ifade edilemez
+        check = float(Q_(2.0, from_unit).to(to_unit).magnitude)
+        if abs(check - (2.0 * factor + offset)) > 1e-9 * max(1.0, abs(check)):
+            raise ValueError(f"Doğrusal olmayan birim çevrimi: {from_unit} -> {to_unit}")
+        return ConversionPlan(factor, offset)
+
+    def get(self, from_unit: str, to_unit: str) -> ConversionPlan:
+        """Planı önbellekten döndürür; yoksa pint ile bir kez oluşturur (hatalar yükseltilir)."""
+        key = (from_unit, to_unit)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = self._build(from_unit, to_unit)
+        with self._lock:
+            return self._plans.setdefault(key, plan)
+
+    def convert(self, value, from_unit: str, to_unit: str):
+        """Değeri (skaler veya dizi) from_unit'ten to_unit'e çevirir."""
+        return self.get(from_unit, to_unit)(value)
+
+    def clear(self):
+        """Planları ve sayaçları sıfırlar."""
+        with self._lock:
+            self._plans.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """İsabet/ıska sayaçları ve plan sayısı."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._plans)}
+
+
+# Süreç genelinde tek plan önbelleği (paylaşılan registry üzerinde)
+_plans = ConversionPlanCache()
+
+
+def get_plan(from_unit: str, to_unit: str) -> ConversionPlan:
+    """Paylaşılan önbellekten (from_unit, to_unit) planını döndürür; hatalar yükseltilir."""
+    return _plans.get(from_unit, to_unit)
+
+
+def convert(value, from_unit: str, to_unit: str):
+    """Paylaşılan plan önbelleği üzerinden çevirir; hatalar yükseltilir."""
+    return _plans.convert(value, from_unit, to_unit)
+
+
+def conversion_plan_stats() -> dict:
+    """Paylaşılan plan önbelleğinin istatistiklerini döndürür."""
+    return _plans.stats()
+
+
+def clear_conversion_plans():
+    """Paylaşılan plan önbelleğini boşaltır."""
+    _plans.clear()
@@ -1,16 +1,16 @@
 import streamlit as st
-from pint import UnitRegistry
-
-ureg = UnitRegistry()
+from src.calculators.unit_plans import convert, conversion_plan_stats
 
 def convert_value(value, from_unit, to_unit):
     """
-    Değeri bir birimden diğerine çevirir.
+    Değeri bir birimden diğerine çevirir (skaler veya NumPy dizisi).
+
+    Çevrim planı (çarpan + ofset) (from_unit, to_unit) başına önbelleğe
+    alınır; tekrar eden çağrılar pint'e uğramaz.
     """
     try:
-        # Pint ile çevirim
         # String temizliği gerekebilir (örn: m**3 -> m^3) ama Pint ** destekler.
-        return ureg.Quantity(value, from_unit).to(to_unit).magnitude
+        return convert(value, from_unit, to_unit)
     except Exception as e:
         # st.error(f"Birim çevirme hatası ({from_unit} -> {to_unit}): {e}")
         return value
@@ -1,7 +1,24 @@
 import os
+import shutil
 import sys
+import tempfile
 
 # Proje kök dizinini sys.path'e ekle
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT) 
\ No newline at end of file
+    sys.path.insert(0, PROJECT_ROOT) 
+# Önbellek dizinleri (bileşen tabloları, pint, tanımlayıcı indeksi) oturuma özel
+# geçici bir dizine yönlendirilir; testler geliştiricinin ~/.cache/chemcalc
+# dizinine yazmaz. Modüller dizinleri içe aktarma anında okuduğundan bu
+# atamalar herhangi bir src importundan önce yapılmalıdır.
+_CACHE_ROOT = tempfile.mkdtemp(prefix="chemcalc-tests-")
+for _var, _sub in (
+    ("CHEMCALC_TABLE_DIR", "tables"),
+    ("CHEMCALC_PINT_CACHE", "pint"),
+    ("CHEMCALC_INDEX_DIR", "identifiers"),
+):
+    os.environ[_var] = os.path.join(_CACHE_ROOT, _sub)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_CACHE_ROOT, ignore_errors=True)
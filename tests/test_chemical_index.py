@@ -0,0 +1,28 @@
+import numpy as np
+
+from src.calculators.chemical_index import ChemicalIndex, build_chemical_index, normalize_key
+from src.calculators.thermo_calculator import CHEMICAL_TRANSLATIONS
+
+
+def test_index_roundtrip_and_search(tmp_path):
+    path = str(tmp_path / "index")
+    build_chemical_index(CHEMICAL_TRANSLATIONS).save(path)
+    index = ChemicalIndex.load(path)
+    assert isinstance(index.tri_post.base, np.memmap)  # diske eşlenmiş, belleğe kopyalanmamış
+
+    assert normalize_key("  Kükürt   DİOKSİT ") == "kukurt dioksit"
+
+    def top(query):
+        return index.search(query, limit=5)[0]
+
+    assert top("toluene")["CAS"] == "108-88-3"
+    assert top("tolune")["CAS"] == "108-88-3"  # yazım hatası: trigram eşleşmesi
+    assert top("108-88-3")["kind"] == "CAS"
+    assert top("C7H8")["name"] == "toluene"
+    assert top("aseton")["name"] == "acetone"
+    assert top("kukurt dioksit")["CAS"] == "7446-09-5"
+
+    hits = index.search("xyl", limit=10)
+    assert {"o-xylene", "m-xylene", "p-xylene"} <= {h["name"] for h in hits}
+    assert len({h["CAS"] for h in hits}) == len(hits)
+    assert index.search("", limit=5) == []
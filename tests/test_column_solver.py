@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from src.calculators.column_solver import (
+    _MixtureModel, block_thomas_solve, solve_column, thomas_solve,
+)
+
+BT = ["benzene", "toluene"]
+BTX = ["benzene", "toluene", "p-xylene"]
+P = 101325
+
+
+def _dense_tridiagonal(a, b, c):
+    return np.diag(b) + np.diag(a[1:], -1) + np.diag(c[:-1], 1)
+
+
+def test_thomas_matches_dense_solve():
+    rng = np.random.default_rng(0)
+    a, c = rng.random((2, 3, 12))
+    b = 3.0 + rng.random((3, 12))
+    d = rng.random((3, 12))
+    x = thomas_solve(a, b, c, d)
+    for i in range(3):
+        expected = np.linalg.solve(_dense_tridiagonal(a[i], b[i], c[i]), d[i])
+        assert x[i] == pytest.approx(expected, rel=1e-12)
+
+
+def test_block_thomas_matches_dense_solve():
+    rng = np.random.default_rng(1)
+    N, n = 8, 5
+    A, C = rng.random((2, N, n, n))
+    B = rng.random((N, n, n)) + 4.0 * np.eye(n)
+    d = rng.random((N, n))
+    dense = np.zeros((N * n, N * n))
+    for j in range(N):
+        dense[j * n:(j + 1) * n, j * n:(j + 1) * n] = B[j]
+        if j > 0:
+            dense[j * n:(j + 1) * n, (j - 1) * n:j * n] = A[j]
+        if j < N - 1:
+            dense[j * n:(j + 1) * n, (j + 1) * n:(j + 2) * n] = C[j]
+    X = block_thomas_solve(A, B, C, d)
+    assert X.ravel() == pytest.approx(np.linalg.solve(dense, d.ravel()), rel=1e-10)
+
+
+def test_binary_column_matches_mccabe_thiele():
+    # McCabe-Thiele: xD = 0.9, xB = 0.1, R = 1.5 için ~11.6 teorik kademe + kazan
+    col = solve_column(BT, P, 14, [{'stage': 7, 'F': 1.0, 'z': [0.4, 0.6], 'q': 1.0}], D=0.375, R=1.5)
+    assert col['xD'][0] == pytest.approx(0.9, abs=0.01)
+    assert col['xB'][0] == pytest.approx(0.1, abs=0.01)
+    assert col['D'] == pytest.approx(0.375)
+    assert col['L'][0] == pytest.approx(1.5 * 0.375)
+    assert col['V'][0] == 0.0
+    assert np.all(np.diff(col['T']) > 0)
+
+
+def test_material_and_energy_balances_close():
+    feed = {'stage': 8, 'F': 1.0, 'z': [0.4, 0.6], 'q': 0.5}
+    col = solve_column(BT, P, 16, [feed], D=0.4, R=2.0)
+
+    z = np.array(feed['z'])
+    assert col['D'] * col['xD'] + col['B'] * col['xB'] == pytest.approx(z, abs=1e-10)
+
+    thermo = _MixtureModel(BT, P)
+    T_F = thermo.bubble_T(z[:, None], np.array([360.0]))
+    H_F = 0.5 * thermo.h_liquid(z[:, None], T_F) + 0.5 * thermo.H_vapor(z[:, None], T_F)
+    h_D = thermo.h_liquid(col['xD'][:, None], col['T'][:1])
+    h_B = thermo.h_liquid(col['xB'][:, None], col['T'][-1:])
+    assert col['Qr'] - col['Qc'] == pytest.approx((col['D'] * h_D + col['B'] * h_B - H_F)[0], rel=1e-6)
+
+
+def test_multicomponent_column_with_side_draws():
+    feeds = [{'stage': 10, 'F': 1.0, 'z': [0.3, 0.4, 0.3]}]
+    draws = [{'stage': 5, 'phase': 'l', 'rate': 0.05}, {'stage': 15, 'phase': 'v', 'rate': 0.05}]
+    col = solve_column(BTX, P, 20, feeds, D=0.25, R=3.0, side_draws=draws)
+
+    assert col['B'] == pytest.approx(0.65)
+    out = col['D'] * col['xD'] + col['B'] * col['xB'] + 0.05 * col['x'][4] + 0.05 * col['y'][14]
+    assert out == pytest.approx([0.3, 0.4, 0.3], abs=1e-10)
+    assert col['x'].sum(axis=1) == pytest.approx(np.ones(20))
+    assert col['xD'][0] > 0.95 and col['xB'][2] > 0.4
+    assert col['iterations'] <= 10
+
+
+def test_newton_iterations_independent_of_stage_count():
+    feeds = lambda N: [{'stage': N // 2, 'F': 1.0, 'z': [0.4, 0.6]}]
+    short = solve_column(BT, P, 30, feeds(30), D=0.375, R=1.5)
+    tall = solve_column(BT, P, 120, feeds(120), D=0.375, R=1.5)
+    assert tall['iterations'] <= short['iterations'] + 2
+    assert tall['xD'][0] >= short['xD'][0]
+
+
+def test_activity_model_column_stays_below_azeotrope():
+    col = solve_column(["ethanol", "water"], P, 20, [{'stage': 12, 'F': 1.0, 'z': [0.2, 0.8]}],
+                       D=0.2, R=3.0, model='unifac')
+    assert 0.7 < col['xD'][0] < 0.9
+
+
+def test_invalid_specs_rejected():
+    feed = [{'stage': 5, 'F': 1.0, 'z': [0.5, 0.5]}]
+    with pytest.raises(ValueError):
+        solve_column(BT, P, 10, feed, D=1.2, R=1.5)
+    with pytest.raises(ValueError):
+        solve_column(BT, P, 10, [{'stage': 1, 'F': 1.0, 'z': [0.5, 0.5]}], D=0.5, R=1.5)
+    with pytest.raises(ValueError):
+        solve_column(BTX, P, 10, [{'stage': 5, 'F': 1.0, 'z': [0.3, 0.3, 0.4]}], D=0.5, R=1.5, model='nrtl')
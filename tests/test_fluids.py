@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from fluids.friction import friction_factor
+from src.calculators.fluids_calculator import (
+    ERR_DENSITY,
+    ERR_FRICTION,
+    ERR_LENGTH,
+    ERR_OK,
+    ERR_VELOCITY,
+    calculate_pressure_drop,
+    calculate_pressure_drop_array,
+    calculate_reynolds_array,
+    friction_factor_array,
+    solve_pipe_network,
+)
+
+
+@pytest.mark.parametrize("method", ["Clamond", "Churchill_1977", "Haaland", "Serghides_2"])
+def test_friction_factor_array_matches_fluids(method):
+    rng = np.random.default_rng(0)
+    Re = 10**rng.uniform(2, 8, 500)
+    eD = 10**rng.uniform(-7, -1.5, 500)
+    expected = [friction_factor(r, e, Method=method) for r, e in zip(Re, eD)]
+    assert np.allclose(friction_factor_array(Re, eD, method), expected, rtol=1e-12)
+
+
+def test_pressure_drop_array_masks_invalid_rows():
+    density = [1000.0, 0.0, 1000.0, 1000.0, 1000.0]
+    velocity = [2.0, 2.0, -1.0, 0.0, 2.0]
+    length = [10.0, 10.0, 10.0, 10.0, -1.0]
+    dp, fd, err = calculate_pressure_drop_array(density, velocity, 0.05, 1e-3, length, 4.5e-5)
+
+    assert err.tolist() == [ERR_OK, ERR_DENSITY, ERR_VELOCITY, ERR_FRICTION, ERR_LENGTH]
+    assert np.isnan(dp[1:]).all()
+
+    dp_ref, fd_ref, _ = calculate_pressure_drop(1000.0, 2.0, 0.05, 1e-3, 10.0, 4.5e-5)
+    assert dp[0] == pytest.approx(dp_ref, rel=1e-12)
+    assert fd[0] == pytest.approx(fd_ref, rel=1e-12)
+
+    _, regime, _ = calculate_reynolds_array(1000.0, [0.01, 0.06, 1.0], 0.05, 1e-3)
+    assert regime.tolist() == [0, 1, 2]
+
+
+def test_pipe_network_series_and_loop():
+    # Seri hat: debi süreklilikten belli, basınçlar tek boru hesabıyla aynı olmalı
+    nodes = pd.DataFrame({'node': ['A', 'B', 'C'], 'demand': [0.0, 0.0, 0.01],
+                          'pressure': [3e5, np.nan, np.nan]})
+    pipes = pd.DataFrame({'pipe': [1, 2], 'from': ['A', 'B'], 'to': ['B', 'C'],
+                          'length': [100.0, 200.0], 'diameter': [0.1, 0.08], 'roughness': [4.5e-5, 4.5e-5]})
+    res = solve_pipe_network(nodes, pipes, 1000.0, 1e-3, method="Clamond")
+    assert res['converged']
+    dp1, _, _ = calculate_pressure_drop(1000.0, 0.01 / (np.pi * 0.1**2 / 4), 0.1, 1e-3, 100.0, 4.5e-5)
+    dp2, _, _ = calculate_pressure_drop(1000.0, 0.01 / (np.pi * 0.08**2 / 4), 0.08, 1e-3, 200.0, 4.5e-5)
+    assert res['nodes']['pressure'].iloc[2] == pytest.approx(3e5 - dp1 - dp2, rel=1e-10)
+
+    # Halka: A -> B iki yoldan (doğrudan ve C üzerinden), kotlu düğüm
+    nodes = pd.DataFrame({'node': ['A', 'B', 'C'], 'demand': [0.0, 0.02, 0.005],
+                          'pressure': [4e5, np.nan, np.nan], 'elevation': [0.0, 5.0, 2.0]})
+    pipes = pd.DataFrame({'pipe': ['p1', 'p2', 'p3'], 'from': ['A', 'A', 'C'], 'to': ['B', 'C', 'B'],
+                          'length': [300.0, 150.0, 150.0], 'diameter': [0.1, 0.1, 0.08],
+                          'roughness': [4.5e-5] * 3})
+    res = solve_pipe_network(nodes, pipes, 1000.0, 1e-3)
+    assert res['converged']
+    assert res['history']['max_dQ'].iloc[-1] < 1e-9 * 0.02
+
+    P = res['nodes'].set_index('node')
+    H = P['pressure'] + 1000.0 * 9.80665 * P['elevation']
+    p = res['pipes']
+    assert np.allclose(H[p['from']].to_numpy() - H[p['to']].to_numpy(), p['dP'], atol=1e-6)
+    Q = dict(zip(p['pipe'], p['Q']))
+    assert Q['p1'] + Q['p3'] == pytest.approx(0.02)
+    assert Q['p2'] - Q['p3'] == pytest.approx(0.005)
+
+    with pytest.raises(ValueError):
+        solve_pipe_network(nodes.assign(pressure=np.nan), pipes, 1000.0, 1e-3)
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+CALCULATOR_MODULES = [
+    "src.calculators.activity_models",
+    "src.calculators.chemical_index",
+    "src.calculators.column_solver",
+    "src.calculators.fluids_calculator",
+    "src.calculators.heat_transfer_calculator",
+    "src.calculators.psychrometrics_calculator",
+    "src.calculators.reaction_calculator",
+    "src.calculators.separation_calculator",
+    "src.calculators.thermo_calculator",
+    "src.calculators.unit_converter",
+]
+
+# İçe aktarma sırasında yüklenmemesi gereken ağır bağımlılıklar
+HEAVY_MODULES = [
+    "pandas", "scipy.integrate", "scipy.optimize", "scipy.interpolate", "scipy.sparse",
+    "thermo", "chemicals", "fluids", "matplotlib.pyplot", "pyfluids", "pint",
+]
+
+# Tüm hesaplayıcıların toplam içe aktarma süresi sınırı (ms); ölçülen ~150 ms
+IMPORT_BUDGET_MS = float(os.environ.get("CHEMCALC_IMPORT_BUDGET_MS", 1000))
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def test_calculators_defer_heavy_imports():
+    code = (
+        f"import sys, {', '.join(CALCULATOR_MODULES)}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = _run(code).stdout.strip()
+    assert loaded == "", f"İçe aktarmada yüklenen ağır modüller: {loaded}"
+
+
+def test_calculator_import_time_budget():
+    result = _run(f"import {', '.join(CALCULATOR_MODULES)}")
+
+    # "import time: self [us] | cumulative | imported package"; yalnızca en üst
+    # seviyedeki src.* girdileri toplanır (alt importlar kümülatife dahildir)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith(" src") and not name.startswith("  "):
+            total_us += int(cumulative)
+
+    assert total_us > 0
+    assert total_us / 1000 < IMPORT_BUDGET_MS, (
+        f"src.calculators içe aktarma süresi {total_us / 1000:.0f} ms "
+        f"(sınır {IMPORT_BUDGET_MS:.0f} ms)"
+    )
@@ -0,0 +1,20 @@
+from src.calculators.property_cache import PropertyCache
+
+
+def test_quantized_hits_and_lru_eviction():
+    cache = PropertyCache(maxsize=2, T_tol=0.1, P_tol=10.0)
+
+    water = cache.get("water", T=300.0, P=101325.0)
+    # Tolerans içinde kalan durum aynı nesneyi döndürmeli
+    assert cache.get("Water", T=300.02, P=101321.0) is water
+    assert cache.stats()["hits"] == 1
+
+    cache.get("water", T=350.0, P=101325.0)
+    cache.get("water", T=300.0, P=101325.0)  # en son kullanılan yapılır
+    cache.get("ethanol", T=300.0, P=101325.0)  # T=350 girdisi çıkarılır
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["misses"] == 3
+    assert cache.get("water", T=300.0, P=101325.0) is water
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from src.calculators.property_tables import ComponentTable, build_component_table, table_path
+from src.calculators.separation_calculator import get_phase_enthalpy
+
+
+def test_table_accuracy_and_npz_round_trip(tmp_path):
+    table = build_component_table("benzene")
+    assert table.errors['psat_rel'] < 1e-4
+    assert table.errors['HL_abs'] < 10.0
+
+    assert float(table.Tsat(101325.0)) == pytest.approx(353.2, abs=0.5)
+
+    path = table_path("benzene", str(tmp_path))
+    table.save(path)
+    loaded = ComponentTable.load(path)
+    T = np.linspace(300.0, 400.0, 7)
+    assert np.allclose(loaded.psat(T), table.psat(T))
+    assert np.allclose(loaded.H_vapor(T), table.H_vapor(T))
+    assert loaded.errors == table.errors
+
+
+def test_phase_enthalpy_reads_from_table():
+    table = build_component_table("toluene")
+    assert get_phase_enthalpy("toluene", 370.0, 'l') == pytest.approx(float(table.H_liquid(370.0)), abs=1.0)
@@ -0,0 +1,146 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+from pyfluids import HumidAir, InputHumidAir
+from src.calculators.psychrometrics_calculator import (
+    calculate_psychrometric_batch,
+    calculate_psychrometric_properties,
+    chart_background_stats,
+    clear_chart_backgrounds,
+    get_chart_background,
+    humidity_ratio,
+    humidity_ratio_from_wet_bulb,
+    moist_air_enthalpy,
+    moist_air_volume,
+    psychrometric_chart_data,
+    wet_bulb_temperature,
+    write_psychrometric_batch,
+)
+
+
+def test_vectorized_relations_match_pyfluids():
+    T = np.linspace(-20.0, 60.0, 9)
+    RH = np.array([10.0, 50.0, 90.0, 100.0])
+    for P in (80000.0, 101325.0):
+        w = humidity_ratio(T[:, None], RH[None, :], P)
+        h = moist_air_enthalpy(T[:, None], w)
+        v = moist_air_volume(T[:, None], w, P)
+        for i, t in enumerate(T):
+            for j, rh in enumerate(RH):
+                ha = HumidAir().with_state(
+                    InputHumidAir.pressure(P), InputHumidAir.temperature(t), InputHumidAir.relative_humidity(rh)
+                )
+                # pyfluids entalpi ve hacmi nemli hava başına verir
+                assert abs(w[i, j] / ha.humidity - 1) < 2.5e-3
+                assert abs(h[i, j] - ha.enthalpy / 1000 * (1 + ha.humidity)) < 0.5
+                assert abs(v[i, j] / (ha.specific_volume * (1 + ha.humidity)) - 1) < 1.5e-3
+
+    ha = HumidAir().with_state(
+        InputHumidAir.pressure(101325.0), InputHumidAir.temperature(30.0), InputHumidAir.wet_bulb_temperature(20.0)
+    )
+    assert abs(humidity_ratio_from_wet_bulb(30.0, 20.0, 101325.0) - ha.humidity) < 5e-5
+
+
+def test_chart_lines_are_clipped_to_saturation():
+    data = psychrometric_chart_data(101325.0, 0, 50, h_lines=[20, 60], wb_lines=[15], v_lines=[0.85])
+    assert set(data['family']) == {'RH', 'h', 'T_wb', 'v'}
+    assert (data.groupby(['family', 'value']).size() >= 50).all()
+
+    w_sat = humidity_ratio(data['T'], 100.0, 101325.0)
+    assert (data['w'] >= 0).all()
+    assert (data['w'] <= w_sat * (1 + 1e-9)).all()
+
+    h = data[data['family'] == 'h']
+    assert np.allclose(moist_air_enthalpy(h['T'], h['w']), h['value'])
+
+
+def test_chart_background_is_cached_and_overlay_is_placed():
+    clear_chart_backgrounds()
+    bg = get_chart_background(101325.0, 0, 50, dpi=50)
+    assert get_chart_background(101325.0, 0, 50, dpi=50) is bg
+    assert chart_background_stats()['hits'] == 1
+
+    w = float(humidity_ratio(25.0, 50.0, 101325.0))
+    png = bg.render([(25.0, w)], radius=3)
+    assert png != bg.png
+
+    # Nokta pikseli işaret rengiyle boyanmış olmalı
+    x, y = bg.to_pixel(25.0, w)
+    img = Image.open(io.BytesIO(png)).convert("RGB")
+    assert img.getpixel((int(round(x)), int(round(y)))) == (214, 39, 40)
+
+
+def test_batch_matches_scalar_and_streams_chunks():
+    df = pd.DataFrame({
+        'T_db': [25.0, 5.0, 35.0, 25.0, 25.0, 20.0],
+        'RH': [50.0, 90.0, 20.0, np.nan, 120.0, np.nan],
+        'T_wb': [np.nan, np.nan, np.nan, 20.0, np.nan, 25.0],
+    })
+    out = calculate_psychrometric_batch(df, twb_col='T_wb')
+
+    for i in range(4):
+        row = df.iloc[i]
+        ref = calculate_psychrometric_properties(row['T_db'], 101325.0,
+                                                 None if np.isnan(row['RH']) else row['RH'],
+                                                 None if np.isnan(row['T_wb']) else row['T_wb'])
+        assert abs(out['w (kg_water/kg_dry)'].iloc[i] / ref['w (kg_water/kg_dry)'] - 1) < 3e-3
+        assert abs(out['T_wb (°C)'].iloc[i] - ref['T_wb (°C)']) < 0.02
+        assert abs(out['T_dp (°C)'].iloc[i] - ref['T_dp (°C)']) < 0.02
+        assert abs(out['RH (%)'].iloc[i] - ref['RH (%)']) < 0.2
+        assert pd.isna(out['Hata'].iloc[i])
+
+    assert out['Hata'].iloc[4] == "Bağıl nem %0 ile %100 arasında olmalıdır."
+    assert out['Hata'].iloc[5].startswith("Yaş termometre")
+    assert out.iloc[4:][['w (kg_water/kg_dry)', 'h (kJ/kg_dry)']].isna().all().all()
+
+    buf = io.BytesIO()
+    assert write_psychrometric_batch(df, buf, chunksize=4, twb_col='T_wb') == len(df)
+    back = pd.read_csv(io.BytesIO(buf.getvalue()))
+    assert len(back) == len(df)
+    assert np.allclose(back['h (kJ/kg_dry)'][:4], out['h (kJ/kg_dry)'][:4], rtol=1e-7)
+
+
+def test_batch_streams_csv_file_with_per_chunk_converter(tmp_path):
+    df = pd.DataFrame({'T_db': [77.0, 41.0, 95.0, 68.0, 86.0], 'RH': [50.0, 90.0, 20.0, 60.0, 40.0]})
+    src, dest = tmp_path / "log.csv", tmp_path / "out.csv"
+    df.to_csv(src, index=False)
+
+    sizes = []
+
+    def to_celsius(chunk):
+        sizes.append(len(chunk))
+        return chunk.assign(T_db=(chunk['T_db'] - 32.0) / 1.8)
+
+    with open(src, "rb") as fh:
+        assert write_psychrometric_batch(fh, dest, chunksize=2, converter=to_celsius) == len(df)
+    assert sizes == [2, 2, 1]
+
+    back = pd.read_csv(dest)
+    ref = calculate_psychrometric_batch(df.assign(T_db=(df['T_db'] - 32.0) / 1.8))
+    assert np.allclose(back['w (kg_water/kg_dry)'], ref['w (kg_water/kg_dry)'], rtol=1e-7)
+
+
+def test_wet_bulb_inversion_vectorized():
+    rng = np.random.default_rng(0)
+    T = rng.uniform(-20.0, 55.0, 20_000)
+    RH = rng.uniform(1.0, 100.0, 20_000)
+    T_wb, converged = wet_bulb_temperature(T, 101325.0, RH)
+    assert converged.all()
+    assert (T_wb <= T + 1e-9).all()
+
+    # Ters yön: w(T_db, T_wb) başlangıç nem oranını vermeli
+    w = humidity_ratio(T, RH, 101325.0)
+    assert np.allclose(humidity_ratio_from_wet_bulb(T, T_wb, 101325.0), w, rtol=0, atol=1e-11)
+
+    for k in range(0, 20_000, 2_000):
+        ha = HumidAir().with_state(
+            InputHumidAir.pressure(101325.0), InputHumidAir.temperature(T[k]), InputHumidAir.relative_humidity(RH[k])
+        )
+        assert abs(T_wb[k] - ha.wet_bulb_temperature) < 0.05
+
+    # Doygun hava: T_wb = T_db; w = 0 ve RH = 100 uç durumları
+    T_wb, converged = wet_bulb_temperature([25.0, 25.0], 101325.0, w=[humidity_ratio(25.0, 100.0, 101325.0), 0.0])
+    assert converged.all()
+    assert T_wb[0] == pytest.approx(25.0, abs=1e-9)
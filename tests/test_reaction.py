@@ -0,0 +1,76 @@
+import math
+import numpy as np
+import pytest
+from scipy.integrate import quad
+from src.calculators import reaction_calculator
+from src.calculators.reaction_calculator import (
+    calculate_batch_time,
+    calculate_rate_constant,
+    calculate_reactor_volume,
+    generate_levenspiel_data,
+    sweep_reactor_volume,
+)
+
+
+def test_pfr_closed_forms():
+    # Sıvı faz, birinci mertebe: V = F_A0/(k C_A0) * ln(1/(1-X))
+    V = calculate_reactor_volume(1.0, 100.0, 0.1, 0.9, 1, 'PFR')
+    assert str(V.units) == "meter ** 3"
+    assert V.magnitude == pytest.approx(math.log(10.0) / 10.0)
+
+    # Gaz faz, birinci mertebe, epsilon
+    V = calculate_reactor_volume(1.0, 100.0, 0.1, 0.9, 1, 'PFR', phase='gas', epsilon=0.5)
+    assert V.magnitude == pytest.approx((1.5 * math.log(10.0) - 0.45) / 10.0)
+
+
+def test_gauss_legendre_matches_quad():
+    C_A0, C_B0, k, X = 100.0, 150.0, 0.001, 0.95
+    t = calculate_batch_time(C_A0, k, X, 1.5, C_B0=C_B0, m=0.5, phase='gas', epsilon=-0.3)
+
+    def inv_rate(x):
+        denom = 1.0 - 0.3 * x
+        ca = C_A0 * (1 - x) / denom
+        cb = (C_B0 - C_A0 * x) / denom
+        return 1.0 / (k * ca**1.5 * cb**0.5)
+
+    expected = C_A0 * quad(inv_rate, 0.0, X, epsrel=1e-10)[0]
+    assert str(t.units) == "second"
+    assert t.magnitude == pytest.approx(expected, rel=1e-6)
+
+
+def test_sweep_matches_scalar_calls(monkeypatch):
+    X = np.linspace(0.1, 0.9, 5)
+    df = sweep_reactor_volume(X, [0.5, 1.0, 2.0], 100.0, 1.0, T=[300.0, 350.0], k0=1e5, Ea=5e4,
+                              C_B0=150.0, m=1, phase='gas', epsilon=0.5)
+    assert len(df) == 2 * 5 * 3 * 2
+    assert list(df.columns) == ['X', 'T', 'n', 'C_A0', 'F_A0', 'k', 'reactor', 'V']
+
+    for _, r in df.iloc[::7].iterrows():
+        k = calculate_rate_constant(1e5, 5e4, r['T'], overall_order=r['n'] + 1)
+        V = calculate_reactor_volume(1.0, 100.0, k, r['X'], r['n'], r['reactor'],
+                                     C_B0=150.0, m=1, phase='gas', epsilon=0.5)
+        assert r['V'] == pytest.approx(V.magnitude, rel=1e-9)
+
+    # Küçük parçalarla süreç havuzu yolu seri sonuçla aynı olmalı
+    monkeypatch.setattr(reaction_calculator, '_SWEEP_CHUNK', 8)
+    monkeypatch.setattr(reaction_calculator, '_SWEEP_POOL_MIN', 1)
+    df_pool = sweep_reactor_volume(X, [0.5, 1.0, 2.0], 100.0, 1.0, T=[300.0, 350.0], k0=1e5, Ea=5e4,
+                                   C_B0=150.0, m=1, phase='gas', epsilon=0.5, max_workers=2)
+    assert np.allclose(df_pool['V'], df['V'], rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        sweep_reactor_volume([0.5, 0.995], 1.0, 100.0, 1.0, k=0.1)
+
+
+def test_levenspiel_data_vectorized():
+    df = generate_levenspiel_data(100.0, 0.001, 0.99, 1.5, C_B0=150.0, m=1, phase='gas',
+                                  epsilon=0.5, n_points=100_000)
+    assert len(df) == 100_000
+    assert list(df.columns) == ['X', 'rate', 'inv_rate', 'CA']
+
+    x = df['X'].to_numpy()
+    ca = 100.0 * (1 - x) / (1 + 0.5 * x)
+    cb = (150.0 - 100.0 * x) / (1 + 0.5 * x)
+    assert np.allclose(df['CA'], ca)
+    assert np.allclose(df['rate'], 0.001 * ca**1.5 * cb)
+    assert np.allclose(df['inv_rate'] * df['rate'], 1.0)
@@ -4,3 +4,86 @@ water = Chemical('water', T=300, P=101325)
 print(f"Density: {water.rho} kg/m^3")
 print(f"Viscosity: {water.mu} Pa.s")
 print(f"Heat Capacity: {water.Cp} J/kg.K")
+
+
+def test_property_curve_matches_chemical():
+    import numpy as np
+    import pytest
+    from src.calculators.thermo_calculator import PropertyCurve
+
+    temps = np.array([300.0, 350.0, 450.0])
+    for key in ("rho", "Cp", "Psat", "mu"):
+        curve = PropertyCurve("water", key, 101325.0)(temps)
+        expected = [getattr(Chemical("water", T=T, P=101325.0), key) for T in temps]
+        assert curve == pytest.approx(expected, rel=1e-3)
+
+
+def test_display_conversion_matches_pint_for_all_systems():
+    import numpy as np
+    import pytest
+    from src.calculators.thermo_calculator import PROPERTY_UNITS, display_conversion
+    from src.calculators.unit_registry import Q_
+
+    values = np.array([0.5, 300.0, 1.0e5])
+    for prop_key, (si_unit, targets) in PROPERTY_UNITS.items():
+        for unit_system, (target, label) in targets.items():
+            plan, unit_str = display_conversion(prop_key, unit_system)
+            assert unit_str == label
+            expected = Q_(values, si_unit).to(target).magnitude
+            assert plan(values) == pytest.approx(expected, rel=1e-12)
+            assert plan(values[1]) == pytest.approx(expected[1], rel=1e-12)
+
+    plan, unit_str = display_conversion('rho', "Manual", {'rho': 'lb/ft**3'})
+    assert unit_str == 'lb/ft**3'
+    assert display_conversion('k', "Manual", {'rho': 'lb/ft**3'})[1] == "(SI)"
+
+
+def test_calculate_properties_english_units():
+    from src.calculators.thermo_calculator import calculate_properties
+
+    df, _ = calculate_properties("water", 80.0, 14.7, "English", ["Isı Kapasitesi (Cp)", "Kaynama Noktası (Tb)"])
+    rows = df.set_index("Özellik")
+    assert rows.loc["Isı Kapasitesi (Cp)", "Birim"] == 'Btu/(lb·°F)'
+    assert abs(float(rows.loc["Isı Kapasitesi (Cp)", "Değer"]) - 1.0) < 0.01
+    assert abs(float(rows.loc["Kaynama Noktası (Tb)", "Değer"]) - 212.0) < 0.5
+
+
+def test_property_batch_matches_single_calls(monkeypatch):
+    import pytest
+    from src.calculators import thermo_calculator
+    from src.calculators.thermo_calculator import calculate_properties, calculate_property_batch
+
+    props = ["Yoğunluk (rho)", "Isı Kapasitesi (Cp)"]
+    states = [(25.0, 1.0), (50.0, 1.0)]
+    chemicals = ["water", "ethanol", "nosuchchemical"]
+
+    serial = calculate_property_batch(chemicals, states, "Metric (CGS)", props, max_workers=1)
+    assert list(serial.columns) == [
+        "Kimyasal", "Formül", "Sıcaklık [degC]", "Basınç [bar]",
+        "Yoğunluk (rho) [g/cm³]", "Isı Kapasitesi (Cp) [kJ/(kg·K)]", "Hata",
+    ]
+    assert len(serial) == len(chemicals) * len(states)
+
+    for _, row in serial.iloc[:4].iterrows():
+        df, formula = calculate_properties(row["Kimyasal"], row["Sıcaklık [degC]"], 1.0, "Metric (CGS)", props)
+        assert row["Formül"] == formula
+        assert float(df.iloc[0]["Değer"]) == pytest.approx(row["Yoğunluk (rho) [g/cm³]"], rel=1e-3)
+        assert float(df.iloc[1]["Değer"]) == pytest.approx(row["Isı Kapasitesi (Cp) [kJ/(kg·K)]"], rel=1e-3)
+    assert serial.iloc[4:]["Hata"].str.startswith("Kimyasal bulunamadı").all()
+
+    # Süreç havuzu yolu aynı tabloyu (aynı sırada) üretmeli
+    monkeypatch.setattr(thermo_calculator, "_BATCH_POOL_MIN", 1)
+    pooled = calculate_property_batch(chemicals, states, "Metric (CGS)", props, max_workers=2)
+    assert pooled.drop(columns="Hata").equals(serial.drop(columns="Hata"))
+
+
+def test_plot_data_reports_errors_to_caller(capsys):
+    import pytest
+    from src.calculators.thermo_calculator import generate_plot_data
+
+    df = generate_plot_data("water", 101325, "SI", "Cp", 300, 320, step=5.0)
+    assert list(df["Sıcaklık"]) == [300, 305, 310, 315]
+
+    with pytest.raises(ValueError, match="nosuchchemical"):
+        generate_plot_data("nosuchchemical", 101325, "SI", "Cp", 300, 320)
+    assert capsys.readouterr().out == ""
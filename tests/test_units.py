@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from pint import UnitRegistry
+
+from src.calculators.unit_plans import ConversionPlanCache
+from src.calculators.unit_converter import convert_units
+
+
+def test_plans_match_pint_and_work_on_arrays():
+    ureg = UnitRegistry()
+    cache = ConversionPlanCache(ureg)
+
+    cases = [
+        ("bar", "psi", 3.7),
+        ("Btu/(lb*degF)", "J/(kg*K)", 0.5),
+        ("kmol/hr", "mol/s", 12.0),
+        ("degC", "K", 25.0),
+        ("degF", "degC", 98.6),
+        ("K", "degR", 300.0),
+    ]
+    for from_unit, to_unit, value in cases:
+        ref = ureg.Quantity(value, from_unit).to(to_unit).magnitude
+        assert cache.convert(value, from_unit, to_unit) == pytest.approx(ref, rel=1e-12)
+
+    assert cache.get("degC", "K").is_affine
+    assert not cache.get("bar", "psi").is_affine
+
+    T = np.linspace(-40.0, 200.0, 7)
+    ref = ureg.Quantity(T, "degF").to("degC").magnitude
+    assert np.allclose(cache.convert(T, "degF", "degC"), ref, rtol=0, atol=1e-9)
+
+    stats = cache.stats()
+    assert stats["size"] == len(cases)
+    assert stats["misses"] == len(cases)
+    assert stats["hits"] == 3
+
+    with pytest.raises(Exception):
+        cache.get("m", "s")
+    assert cache.stats()["size"] == len(cases)
+
+
+def test_convert_units_handles_temperatures():
+    value, err = convert_units(25, "Celsius", "kelvin")
+    assert err is None
+    assert value == pytest.approx(298.15)
+
+    value, err = convert_units(1, "m", "s")
+    assert value is None and err
+
+
+def test_calculators_share_one_registry():
+    from src.calculators import heat_transfer_calculator, reaction_calculator, unit_registry
+
+    q1 = heat_transfer_calculator.Q_(1.0, "watt")
+    q2 = reaction_calculator.Q_(2.0, "joule/second")
+    # Farklı registry'lerden gelen Quantity'ler toplanamaz
+    assert (q1 + q2).to("watt").magnitude == pytest.approx(3.0)
+    assert q1._REGISTRY is unit_registry.get_ureg() is unit_registry.ureg